@@ -0,0 +1,48 @@
+"""
+Pages per second of the matchup page parsers. Run from the repository root with
+
+    python -m benchmarks.bench_parser [--pages 200] [--cache data/page_cache]
+
+Synthetic pages are used unless a page cache directory is given.
+"""
+import argparse
+import time
+
+from src.data_collector import parse_html, parse_html_tables
+from src.page_cache import PageCache
+from .fixtures import matchup_page
+
+
+def pages_per_second(parser, pages: list) -> float:
+    """ Timing the parser over every page. """
+    start = time.perf_counter()
+    for html in pages:
+        parser(html)
+    return len(pages) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pages', type=int, default=200)
+    parser.add_argument('--cache', default=None)
+    args = parser.parse_args()
+
+    if args.cache:
+        cache = PageCache(args.cache)
+        pages = [cache.get(game_id) for game_id in cache.game_ids()[:args.pages]]
+    else:
+        pages = [matchup_page(seed) for seed in range(args.pages)]
+
+    # both parsers have to give the same game records
+    for html in pages[:20]:
+        assert parse_html(html) == parse_html_tables(html)
+
+    before = pages_per_second(parse_html_tables, pages)
+    after = pages_per_second(parse_html, pages)
+    print('read_html:       {:8.1f} pages/s'.format(before))
+    print('matchup_parser:  {:8.1f} pages/s'.format(after))
+    print('speed up:        {:8.1f}x'.format(after / before))
+
+
+if __name__ == '__main__':
+    main()
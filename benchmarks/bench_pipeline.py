@@ -0,0 +1,186 @@
+"""
+Throughput and peak memory of the collect and clean stages at scale. Run from the repository root with
+
+    python -m benchmarks.bench_pipeline [--sizes 1000 10000 100000] [--save]
+
+Everything runs offline on synthetic matchup pages and game records. Each stage is run under tracemalloc
+for its peak memory and then timed with timeit, taking the fastest of several repeats that each run the
+stage long enough to be measured reliably. The results are compared with the JSON baseline in
+benchmarks/baselines. A stage outside the tolerance is measured again and only counts when the
+regression shows up both times. Peak memory regressions fail the run, while slower stages are reported
+as warnings unless --strict is given, since timings on a shared machine drift by more than the tolerance.
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import timeit
+import tracemalloc
+import pandas as pd
+
+from io import StringIO
+from pathlib import Path
+from src.checkpoint import GameOutput
+from src.data_collector import parse_html, format_game_record, games_frame, GAME_COLUMNS
+from src.nfl_data_clean import clean_data, dashed_cols, make_dashed_cols, make_team_dictionary, total_times, \
+    encode_teams
+from .fixtures import matchup_page, game_stat_rows
+
+BASELINE_DIR = Path(__file__).resolve().parent / 'baselines'
+# shortest time a single repeat of a stage runs for, quick stages are called several times per repeat
+MIN_REPEAT_SECONDS = 0.2
+REPEATS = 5
+
+
+def measure(func, items: int) -> dict:
+    """
+    Measuring the peak memory of the stage and then timing it, the first run warms up the caches.
+    The time of the stage is the fastest of the repeats, the slower ones are other work on the machine.
+    :param func: stage to run, called with no arguments
+    :param items: number of games the stage handles
+    """
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timer = timeit.Timer(func)
+    number, seconds = timer.autorange()
+    # autorange stops at 0.2 seconds, calling the stage enough times for every repeat to pass the floor
+    number = max(number, int(number * MIN_REPEAT_SECONDS / seconds) + 1)
+    seconds = min(timer.repeat(repeat=REPEATS, number=number)) / number
+
+    return {'items': items, 'seconds': seconds, 'items_per_s': items / seconds, 'peak_mb': peak / 2 ** 20}
+
+
+def raw_frame(records: list) -> pd.DataFrame:
+    """ Writing the records out and reading them back the way the final_df.csv is read by the cleaning. """
+    text = StringIO()
+    games_frame(records).to_csv(text, index=False)
+    text.seek(0)
+    return pd.read_csv(text)
+
+
+def size_stages(size: int, max_pages: int):
+    """
+    Yielding the name, function and number of games of every stage for the number of games. The data of
+    each stage is made just before it is measured, so the peak memory of one stage does not hold the others.
+    :param size: number of games
+    :param max_pages: largest number of pages parsed, the parser throughput does not depend on the size
+    """
+    pages = [matchup_page(seed) for seed in range(min(size, max_pages))]
+    yield 'parse_html', lambda: [parse_html(html) for html in pages], len(pages)
+    del pages
+
+    games = [game_stat_rows(seed) for seed in range(size)]
+    yield 'format_game_record', lambda: [format_game_record(*game) for game in games], size
+    records = [{'game_id': str(i), **format_game_record(*game)} for i, game in enumerate(games)]
+    del games
+
+    yield 'assemble', lambda: games_frame(records), size
+
+    def write_output():
+        with tempfile.TemporaryDirectory() as tmp:
+            output = GameOutput(Path(tmp) / 'final_df.csv', columns=['game_id'] + GAME_COLUMNS)
+            for record in records:
+                output.write(record['game_id'], record)
+    # the output syncs every row to disk, so it is only timed on the smaller sizes
+    if size <= 10000:
+        yield 'write_output', write_output, size
+
+    raw = raw_frame(records)
+    del records
+    yield 'clean_data', lambda: clean_data(raw), size
+
+    # the stages of the cleaning on their own
+    prepared = raw.dropna()
+    cols = dashed_cols(prepared)
+    team_dictionary = make_team_dictionary(prepared)
+    yield 'make_dashed_cols', lambda: make_dashed_cols(prepared.copy(), cols=cols), size
+    yield 'total_times', lambda: total_times(prepared['home_possession']), size
+    yield 'encode_teams', lambda: encode_teams(prepared['home_team'], team_dictionary), size
+
+
+def run_size(size: int, max_pages: int, baseline: dict = None, tolerance: float = 0.25) -> tuple:
+    """
+    Running every stage for the number of games, a stage outside the tolerance of the baseline is
+    measured a second time and only counts as a regression when it is outside it again.
+    :param size: number of games
+    :param max_pages: largest number of pages parsed, the parser throughput does not depend on the size
+    :param baseline: saved results of the size
+    :param tolerance: allowed fraction of change
+    """
+    results, regressions = {}, []
+    for stage, func, items in size_stages(size, max_pages):
+        result = results[stage] = measure(func, items)
+        base = (baseline or {}).get(stage)
+        first = stage_regressions(size, stage, result, base, tolerance) if base is not None else []
+        if not first:
+            continue
+        kinds = {kind for kind, _ in first}
+        result = results[stage] = measure(func, items)
+        regressions += [r for r in stage_regressions(size, stage, result, base, tolerance) if r[0] in kinds]
+    return results, regressions
+
+
+def stage_regressions(size: int, stage: str, result: dict, base: dict, tolerance: float) -> list:
+    """
+    Finding whether the stage got slower or uses more memory than the baseline allows, each regression
+    is returned with its kind, time or memory.
+    :param size: number of games
+    :param stage: name of the stage
+    :param result: result of this run
+    :param base: saved result of the stage
+    :param tolerance: allowed fraction of change
+    """
+    regressions = []
+    if result['items_per_s'] < base['items_per_s'] * (1 - tolerance):
+        regressions.append(('time', '{} {}: {:.0f} games/s, baseline {:.0f}'.format(
+            size, stage, result['items_per_s'], base['items_per_s'])))
+    if result['peak_mb'] > base['peak_mb'] * (1 + tolerance):
+        regressions.append(('memory', '{} {}: {:.1f} MB peak, baseline {:.1f}'.format(
+            size, stage, result['peak_mb'], base['peak_mb'])))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--max-pages', type=int, default=2000)
+    parser.add_argument('--baseline', default=str(BASELINE_DIR / 'pipeline.json'))
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    parser.add_argument('--save', action='store_true', help='save the results as the new baseline')
+    parser.add_argument('--strict', action='store_true', help='fail on slower stages as well as on memory')
+    args = parser.parse_args()
+
+    baseline_path = Path(args.baseline)
+    baseline = {}
+    if baseline_path.exists() and not args.save:
+        baseline = json.loads(baseline_path.read_text())['results']
+
+    results, regressions = {}, []
+    for size in args.sizes:
+        results[str(size)], size_regressions = run_size(size, args.max_pages, baseline.get(str(size)),
+                                                        args.tolerance)
+        regressions += size_regressions
+        for stage, result in results[str(size)].items():
+            print('{:>7} {:<20} {:>12.0f} games/s {:>9.1f} MB peak'.format(
+                size, stage, result['items_per_s'], result['peak_mb']))
+
+    if args.save:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline = {'python': platform.python_version(), 'pandas': pd.__version__, 'results': results}
+        baseline_path.write_text(json.dumps(baseline, indent=2))
+        print('saved {}'.format(baseline_path))
+        return
+
+    failing = [message for kind, message in regressions if kind == 'memory' or args.strict]
+    for kind, message in regressions:
+        print('{} {}'.format('REGRESSION' if message in failing else 'WARNING', message))
+    if failing:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
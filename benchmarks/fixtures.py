@@ -0,0 +1,84 @@
+import random
+
+# team stat rows of the matchup page in the order ESPN lists them
+STAT_ROWS = [
+    '1st Downs', 'Passing 1st downs', 'Rushing 1st downs', '1st downs from penalties',
+    '3rd down efficiency', '4th down efficiency', 'Total Plays', 'Total Yards', 'Total Drives',
+    'Yards per Play', 'Passing', 'Comp-Att', 'Yards per pass', 'Interceptions thrown',
+    'Sacks-Yards Lost', 'Rushing', 'Rushing Attempts', 'Yards per rush', 'Red Zone (Made-Att)',
+    'Penalties', 'Turnovers', 'Fumbles lost', 'Interceptions thrown', 'Defensive / Special Teams TDs',
+    'Possession',
+]
+
+TEAMS = [
+    'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC',
+    'LV', 'LAC', 'LAR', 'MIA', 'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SF', 'SEA', 'TB', 'TEN', 'WSH',
+    'OAK', 'SD', 'STL',
+]
+
+
+def stat_value(stat: str, rng: random.Random) -> str:
+    """ Making a random value in the format ESPN uses for the stat. """
+    name = stat.lower()
+    if name == 'possession':
+        return '{}:{:02d}'.format(rng.randint(22, 38), rng.randint(0, 59))
+    if 'efficiency' in name or '-' in name or name == 'penalties':
+        attempts = rng.randint(0, 20)
+        return '{}-{}'.format(rng.randint(0, attempts), attempts)
+    if name.startswith('yards per'):
+        return '{:.1f}'.format(rng.uniform(2, 9))
+    return str(rng.randint(0, 450 if 'yards' in name or name in ('passing', 'rushing') else 30))
+
+
+def game_stats(rng: random.Random):
+    """ Making the teams, quarter points and stat rows of a random game. """
+    away, home = rng.sample(TEAMS, 2)
+    quarters = [[rng.choice([0, 0, 3, 7, 7, 10, 14]) for _ in range(4)] for _ in range(2)]
+    stats = [[stat, stat_value(stat, rng), stat_value(stat, rng)] for stat in STAT_ROWS]
+    return [away, home], quarters, stats
+
+
+def matchup_page(seed: int, filler_tables: int = 6, filler_rows: int = 40) -> bytes:
+    """
+    Making a synthetic ESPN matchup page. Along with the linescore and team stats tables the page
+    carries filler tables and markup so the parsers do a comparable amount of work to a real page.
+    :param seed: seed of the random game
+    :param filler_tables: number of unrelated tables on the page
+    :param filler_rows: number of rows in each filler table
+    """
+    rng = random.Random(seed)
+    teams, quarters, stats = game_stats(rng)
+
+    parts = ['<html><head><title>Matchup</title>']
+    parts += ['<script>var data{} = {{"key": "{}"}};</script>'.format(i, 'x' * 200) for i in range(20)]
+    parts.append('</head><body><div id="gamepackage-matchup-wrap">')
+
+    parts.append('<table id="linescore"><thead><tr><th></th><th>1</th><th>2</th><th>3</th><th>4</th>'
+                 '<th>T</th></tr></thead><tbody>')
+    for team, points in zip(teams, quarters):
+        cells = ''.join('<td>{}</td>'.format(p) for p in points + [sum(points)])
+        parts.append('<tr><td class="team-name"><a href="#">{}</a></td>{}</tr>'.format(team, cells))
+    parts.append('</tbody></table>')
+
+    for t in range(filler_tables):
+        parts.append('<div class="mod-container"><table class="filler"><thead><tr><th>Player</th><th>Stat</th>'
+                     '<th>Value</th><th>Note</th></tr></thead><tbody>')
+        for r in range(filler_rows):
+            parts.append('<tr><td><span>Player {}</span></td><td>{}</td><td>{}</td><td>note</td></tr>'.format(
+                r, rng.randint(0, 99), rng.random()))
+        parts.append('</tbody></table></div>')
+
+    parts.append('<table class="mod-data"><thead><tr><th>Matchup</th><th>{}</th><th>{}</th></tr></thead>'
+                 '<tbody>'.format(*teams))
+    for stat, away, home in stats:
+        parts.append('<tr class="highlight"><td>\n    {}\n  </td><td>{}</td><td>{}</td></tr>'.format(stat, away, home))
+    parts.append('</tbody></table></div></body></html>')
+
+    return ''.join(parts).encode()
+
+
+def game_stat_rows(seed: int):
+    """ Making the teams and stat rows of a random game, ending with the points row, as the parser gives them. """
+    rng = random.Random(seed)
+    teams, quarters, stats = game_stats(rng)
+    return teams, stats + [['Points'] + [str(sum(points)) for points in quarters]]
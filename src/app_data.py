@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+from .game_index import index_seasons, DEFAULT_INDEX_PATH
+from .storage import read_dataset, DATA_DIR
+
+# per team stats summarised in the aggregate tables
+AGGREGATE_STATS = ['total_yards', 'yards_per_play', 'rd_down_efficiency', 'turnovers', 'possession']
+
+
+def load_cleaned(data_dir=DATA_DIR, index_path=DEFAULT_INDEX_PATH) -> pd.DataFrame:
+    """
+    Loading the cleaned dataset once, from parquet when it has been converted and from the csv otherwise.
+    Data without a season column gets the season and week of its games from the game index. Data without
+    gameIds or a game index is loaded without seasons, while gameIds missing from the index raise.
+    :param data_dir: directory holding the cleaned_data
+    :param index_path: csv file of the game index
+    """
+    data_dir = Path(data_dir)
+    parquet_path = data_dir / 'cleaned_data.parquet'
+    data = read_dataset(parquet_path) if parquet_path.exists() else pd.read_csv(data_dir / 'cleaned_data.csv')
+    return index_seasons(data, index_path)
+
+
+def team_rows(data: pd.DataFrame) -> pd.DataFrame:
+    """ Turning the games into one row per team and game with the stats the team put up and allowed. """
+    parts = []
+    for side, other in (('home', 'away'), ('away', 'home')):
+        part = pd.DataFrame({'team': data[side + '_team'].to_numpy(), 'game': np.arange(len(data))})
+        if 'season' in data.columns:
+            part['season'] = data['season'].to_numpy()
+        wins = data['home_wins'].to_numpy()
+        part['win'] = wins if side == 'home' else 1 - wins
+        for stat in AGGREGATE_STATS:
+            part[stat] = data['{}_{}'.format(side, stat)].to_numpy()
+            part[stat + '_allowed'] = data['{}_{}'.format(other, stat)].to_numpy()
+        parts.append(part)
+    return pd.concat(parts, ignore_index=True)
+
+
+def aggregate(rows: pd.DataFrame, keys: list) -> pd.DataFrame:
+    """ Summarising the team rows by the keys: games, wins, win rate and the averages of the stats. """
+    grouped = rows.groupby(keys)
+    table = grouped.agg(games=('win', 'size'), wins=('win', 'sum'))
+    table['win_rate'] = table['wins'] / table['games']
+    averages = grouped[[c for c in rows.columns if c not in keys + ['game', 'win', 'season', 'team']]].mean()
+    return table.join(averages.add_prefix('avg_')).reset_index()
+
+
+class AppData:
+    """
+    Data behind the app, built once per process. The games are indexed by team and season and the
+    aggregate tables are computed up front, so filters are answered with array lookups instead of
+    rereading or recleaning the data.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        :param data: cleaned dataset
+        """
+        self.data = data.reset_index(drop=True)
+        rows = team_rows(self.data)
+        self.has_seasons = 'season' in self.data.columns
+
+        # positions of the games of every team and season
+        self.team_index = {int(team): np.unique(group.to_numpy()) for team, group in rows.groupby('team')['game']}
+        self.season_index = {}
+        if self.has_seasons:
+            self.season_index = {int(s): idx for s, idx in self.data.groupby('season').indices.items()}
+
+        self.team_table = aggregate(rows, ['team'])
+        self.team_season_table = aggregate(rows, ['team', 'season']) if self.has_seasons else None
+
+        # columns the sliders filter on, pulled out once as arrays
+        self.total_yards = (self.data['home_total_yards'] + self.data['away_total_yards']).to_numpy()
+
+    @property
+    def teams(self) -> list:
+        return sorted(self.team_index)
+
+    @property
+    def seasons(self) -> list:
+        return sorted(self.season_index)
+
+    def game_positions(self, teams: list = None, seasons: tuple = None, total_yards: tuple = None) -> np.ndarray:
+        """
+        Getting the positions of the games matching the filters, a filter left as None matches every game.
+        :param teams: teams playing in the games
+        :param seasons: first and last season of the games
+        :param total_yards: lowest and highest combined yards of the games
+        """
+        positions = None
+        if teams:
+            positions = np.unique(np.concatenate([self.team_index.get(int(t), []) for t in teams])).astype(int)
+        if seasons is not None and self.has_seasons:
+            first, last = seasons
+            in_seasons = [idx for s, idx in self.season_index.items() if first <= s <= last]
+            season_positions = np.concatenate(in_seasons) if in_seasons else np.array([], dtype=int)
+            positions = season_positions if positions is None else np.intersect1d(positions, season_positions)
+        if positions is None:
+            positions = np.arange(len(self.data))
+        if total_yards is not None:
+            low, high = total_yards
+            yards = self.total_yards[positions]
+            positions = positions[(yards >= low) & (yards <= high)]
+        return positions
+
+    def games(self, **filters) -> pd.DataFrame:
+        """ Getting the games matching the filters of game_positions. """
+        return self.data.iloc[self.game_positions(**filters)]
+
+    def team_summary(self, teams: list = None, seasons: tuple = None) -> pd.DataFrame:
+        """
+        Getting the precomputed aggregate rows of the teams, by season when a season range is given.
+        :param teams: teams to show, every team when None
+        :param seasons: first and last season to show
+        """
+        if seasons is not None and self.team_season_table is not None:
+            table = self.team_season_table
+            table = table[table['season'].between(*seasons)]
+        else:
+            table = self.team_table
+        if teams:
+            table = table[table['team'].isin(teams)]
+        return table
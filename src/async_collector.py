@@ -0,0 +1,154 @@
+import asyncio
+import random
+import time
+import aiohttp
+
+from concurrent.futures import ProcessPoolExecutor
+from .page_cache import PageCache
+from .checkpoint import GameOutput
+from .data_collector import cfb_log, make_url, game_id_from_url, parse_with_metrics, read_cache, write_result, \
+    finish_run, reset_worker_metrics, default_output, ESPN_URL
+
+
+class TokenBucket:
+    """
+    Token bucket limiting how many requests are started per second. Requests wait for a token
+    instead of sleeping a random amount of time after every page.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        """
+        :param rate: number of tokens added to the bucket per second
+        :param capacity: largest burst of requests allowed at once
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """ Waiting until a token is available and taking it from the bucket. """
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class ServerError(Exception):
+    """ Raised when the server answers with a 5xx status, these responses are retried. """
+
+
+async def fetch_html(session: aiohttp.ClientSession, url: str, bucket: TokenBucket,
+                     retries: int = 3, backoff: float = 1.0):
+    """
+    Fetching the html of a page from the shared session. Connection errors and 5xx responses
+    are retried with exponential backoff.
+    :param session: shared session holding the connection pool
+    :param url: page to collect
+    :param bucket: rate limiter shared by all requests
+    :param retries: number of retries before giving up on the page
+    :param backoff: base delay in seconds between retries
+    """
+    for attempt in range(retries + 1):
+        await bucket.acquire()
+        try:
+            with cfb_log.timer('fetch'):
+                async with session.get(url) as response:
+                    if response.status >= 500:
+                        raise ServerError('{} returned {}'.format(url, response.status))
+                    response.raise_for_status()
+                    html = await response.read()
+            cfb_log.count('bytes_downloaded', len(html))
+            return html
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError, ServerError) as e:
+            if attempt == retries:
+                raise
+            delay = backoff * 2 ** attempt + random.uniform(0, backoff)
+            cfb_log.count('retries')
+            cfb_log.info('retrying %s in %.2fs: %s', url, delay, e)
+            await asyncio.sleep(delay)
+
+
+async def collect_game(session: aiohttp.ClientSession, game_url: str, bucket: TokenBucket,
+                       semaphore: asyncio.Semaphore, executor: ProcessPoolExecutor,
+                       base_url: str = ESPN_URL, retries: int = 3, backoff: float = 1.0,
+                       cache: PageCache = None):
+    """
+    Collecting a single game and returning its gameId with the game record and the metrics of the parsing
+    worker. The page is fetched on the event loop and parsed in the executor, the gzip reads and writes
+    of the cache run in a thread so they never block the loop.
+    :param game_url: url of the game page holding the gameId
+    :param semaphore: bounds the number of requests in flight
+    :param executor: process pool the html is parsed in
+    :param cache: cache of the raw pages
+    """
+    game_id = game_id_from_url(game_url)
+    html = await asyncio.to_thread(read_cache, cache, game_id)
+
+    if html is None:
+        url = make_url(game_id, base_url=base_url)
+        async with semaphore:
+            try:
+                html = await fetch_html(session, url, bucket, retries=retries, backoff=backoff)
+            except Exception as e:
+                cfb_log.info('%s: %s', url, e)
+                return game_id, None, None
+        cfb_log.debug('%s', url)
+        if cache is not None:
+            await asyncio.to_thread(cache.put, game_id, html)
+
+    record, metrics = await asyncio.get_running_loop().run_in_executor(executor, parse_with_metrics, html)
+    return game_id, record, metrics
+
+
+async def collect_games(game_urls: list, output: GameOutput, rate: float = 2.0, concurrency: int = 10,
+                        base_url: str = ESPN_URL, retries: int = 3, backoff: float = 1.0,
+                        parse_workers: int = None, cache: PageCache = None):
+    """
+    Collecting the games over one connection pool. Each game record is appended to the output as soon
+    as it finishes, and games already in the output from an earlier run are skipped.
+    :param game_urls: urls of the games to collect
+    :param output: append only output of the game rows
+    :param rate: requests per second allowed by the token bucket
+    :param concurrency: largest number of requests in flight
+    :param base_url: host serving the matchup pages
+    :param retries: number of retries on connection errors and 5xx responses
+    :param backoff: base delay in seconds between retries
+    :param parse_workers: number of processes parsing the html
+    :param cache: cache of the raw pages, cached games are not requested again
+    """
+    pending = [game_url for game_url in game_urls if game_id_from_url(game_url) not in output]
+    cfb_log.info('%s of %s games left to collect', len(pending), len(game_urls))
+
+    bucket = TokenBucket(rate)
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    timeout = aiohttp.ClientTimeout(total=60)
+
+    with ProcessPoolExecutor(max_workers=parse_workers, initializer=reset_worker_metrics) as executor:
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            tasks = [
+                collect_game(session, game_url, bucket, semaphore, executor,
+                             base_url=base_url, retries=retries, backoff=backoff, cache=cache)
+                for game_url in pending
+            ]
+            for task in asyncio.as_completed(tasks):
+                write_result(output, *await task)
+
+
+def async_main_runner(game_urls: list, output: GameOutput = None, **options):
+    """
+    Asyncio version of the main_runner, the options are passed on to collect_games.
+    :param game_urls: urls of the games to collect
+    :param output: append only output of the game rows
+    """
+    output = output if output is not None else default_output()
+    cfb_log.reset()
+    asyncio.run(collect_games(game_urls, output, **options))
+    finish_run(output)
@@ -1,47 +1,19 @@
-import time
-from selenium import webdriver
 from .data_collector import main_runner
+from .game_index import update_index, game_urls
 
 
 test = ['https://www.espn.com/nfl/game/_/gameId/320905019', 'https://www.espn.com/nfl/game/_/gameId/320909003', 'https://www.espn.com/nfl/game/_/gameId/320909005', 'https://www.espn.com/nfl/game/_/gameId/320909008', 'https://www.espn.com/nfl/game/_/gameId/320909010', 'https://www.espn.com/nfl/game/_/gameId/320909012', 'https://www.espn.com/nfl/game/_/gameId/320909016', 'https://www.espn.com/nfl/game/_/gameId/320909018', 'https://www.espn.com/nfl/game/_/gameId/320909020', 'https://www.espn.com/nfl/game/_/gameId/320909034', 'https://www.espn.com/nfl/game/_/gameId/320909009', 'https://www.espn.com/nfl/game/_/gameId/320909022', 'https://www.espn.com/nfl/game/_/gameId/320909027', 'https://www.espn.com/nfl/game/_/gameId/320909007', 'https://www.espn.com/nfl/game/_/gameId/320910033', 'https://www.espn.com/nfl/game/_/gameId/320910013', 'https://www.espn.com/nfl/game/_/gameId/320920029', 'https://www.espn.com/nfl/game/_/gameId/320923003', 'https://www.espn.com/nfl/game/_/gameId/320923005', 'https://www.espn.com/nfl/game/_/gameId/320923006', 'https://www.espn.com/nfl/game/_/gameId/320923010', 'https://www.espn.com/nfl/game/_/gameId/320923011', 'https://www.espn.com/nfl/game/_/gameId/320923015', 'https://www.espn.com/nfl/game/_/gameId/320923016', 'https://www.espn.com/nfl/game/_/gameId/320923018', 'https://www.espn.com/nfl/game/_/gameId/320923028', 'https://www.espn.com/nfl/game/_/gameId/320923022', 'https://www.espn.com/nfl/game/_/gameId/320923024', 'https://www.espn.com/nfl/game/_/gameId/320923007', 'https://www.espn.com/nfl/game/_/gameId/320923013', 'https://www.espn.com/nfl/game/_/gameId/320923033', 'https://www.espn.com/nfl/game/_/gameId/320924026', 'https://www.espn.com/nfl/game/_/gameId/320927033', 'https://www.espn.com/nfl/game/_/gameId/320930001', 'https://www.espn.com/nfl/game/_/gameId/320930002', 'https://www.espn.com/nfl/game/_/gameId/320930008', 'https://www.espn.com/nfl/game/_/gameId/320930012', 'https://www.espn.com/nfl/game/_/gameId/320930014', 'https://www.espn.com/nfl/game/_/gameId/320930020', 'https://www.espn.com/nfl/game/_/gameId/320930034', 'https://www.espn.com/nfl/game/_/gameId/320930007', 'https://www.espn.com/nfl/game/_/gameId/320930022', 'https://www.espn.com/nfl/game/_/gameId/320930030', 'https://www.espn.com/nfl/game/_/gameId/320930009', 'https://www.espn.com/nfl/game/_/gameId/320930027', 'https://www.espn.com/nfl/game/_/gameId/320930021', 'https://www.espn.com/nfl/game/_/gameId/321001006', 'https://www.espn.com/nfl/game/_/gameId/321004014', 'https://www.espn.com/nfl/game/_/gameId/321007004', 'https://www.espn.com/nfl/game/_/gameId/321007011', 'https://www.espn.com/nfl/game/_/gameId/321007012', 'https://www.espn.com/nfl/game/_/gameId/321007019', 'https://www.espn.com/nfl/game/_/gameId/321007023', 'https://www.espn.com/nfl/game/_/gameId/321007028', 'https://www.espn.com/nfl/game/_/gameId/321007029', 'https://www.espn.com/nfl/game/_/gameId/321007030', 'https://www.espn.com/nfl/game/_/gameId/321007016', 'https://www.espn.com/nfl/game/_/gameId/321007017', 'https://www.espn.com/nfl/game/_/gameId/321007025', 'https://www.espn.com/nfl/game/_/gameId/321007018', 'https://www.espn.com/nfl/game/_/gameId/321008020', 'https://www.espn.com/nfl/game/_/gameId/321011010', 'https://www.espn.com/nfl/game/_/gameId/321014001', 'https://www.espn.com/nfl/game/_/gameId/321014005', 'https://www.espn.com/nfl/game/_/gameId/321014015', 'https://www.espn.com/nfl/game/_/gameId/321014020', 'https://www.espn.com/nfl/game/_/gameId/321014021', 'https://www.espn.com/nfl/game/_/gameId/321014027', 'https://www.espn.com/nfl/game/_/gameId/321014033', 'https://www.espn.com/nfl/game/_/gameId/321014022', 'https://www.espn.com/nfl/game/_/gameId/321014026', 'https://www.espn.com/nfl/game/_/gameId/321014025', 'https://www.espn.com/nfl/game/_/gameId/321014028', 'https://www.espn.com/nfl/game/_/gameId/321014034', 'https://www.espn.com/nfl/game/_/gameId/321015024', 'https://www.espn.com/nfl/game/_/gameId/321018025', 'https://www.espn.com/nfl/game/_/gameId/321021002', 'https://www.espn.com/nfl/game/_/gameId/321021011', 'https://www.espn.com/nfl/game/_/gameId/321021014', 'https://www.espn.com/nfl/game/_/gameId/321021016', 'https://www.espn.com/nfl/game/_/gameId/321021019', 'https://www.espn.com/nfl/game/_/gameId/321021027', 'https://www.espn.com/nfl/game/_/gameId/321021029', 'https://www.espn.com/nfl/game/_/gameId/321021034', 'https://www.espn.com/nfl/game/_/gameId/321021013', 'https://www.espn.com/nfl/game/_/gameId/321021017', 'https://www.espn.com/nfl/game/_/gameId/321021004', 'https://www.espn.com/nfl/game/_/gameId/321022003', 'https://www.espn.com/nfl/game/_/gameId/321025016', 'https://www.espn.com/nfl/game/_/gameId/321028003', 'https://www.espn.com/nfl/game/_/gameId/321028005', 'https://www.espn.com/nfl/game/_/gameId/321028008', 'https://www.espn.com/nfl/game/_/gameId/321028009', 'https://www.espn.com/nfl/game/_/gameId/321028010', 'https://www.espn.com/nfl/game/_/gameId/321028014', 'https://www.espn.com/nfl/game/_/gameId/321028020', 'https://www.espn.com/nfl/game/_/gameId/321028021', 'https://www.espn.com/nfl/game/_/gameId/321028023', 'https://www.espn.com/nfl/game/_/gameId/321028012', 'https://www.espn.com/nfl/game/_/gameId/321028006', 'https://www.espn.com/nfl/game/_/gameId/321028007', 'https://www.espn.com/nfl/game/_/gameId/321029022', 'https://www.espn.com/nfl/game/_/gameId/321101024', 'https://www.espn.com/nfl/game/_/gameId/321104004', 'https://www.espn.com/nfl/game/_/gameId/321104005', 'https://www.espn.com/nfl/game/_/gameId/321104009', 'https://www.espn.com/nfl/game/_/gameId/321104010', 'https://www.espn.com/nfl/game/_/gameId/321104011', 'https://www.espn.com/nfl/game/_/gameId/321104028', 'https://www.espn.com/nfl/game/_/gameId/321104030', 'https://www.espn.com/nfl/game/_/gameId/321104034', 'https://www.espn.com/nfl/game/_/gameId/321104013', 'https://www.espn.com/nfl/game/_/gameId/321104026', 'https://www.espn.com/nfl/game/_/gameId/321104019', 'https://www.espn.com/nfl/game/_/gameId/321104001', 'https://www.espn.com/nfl/game/_/gameId/321105018', 'https://www.espn.com/nfl/game/_/gameId/321108030', 'https://www.espn.com/nfl/game/_/gameId/321111004', 'https://www.espn.com/nfl/game/_/gameId/321111015', 'https://www.espn.com/nfl/game/_/gameId/321111016', 'https://www.espn.com/nfl/game/_/gameId/321111017', 'https://www.espn.com/nfl/game/_/gameId/321111018', 'https://www.espn.com/nfl/game/_/gameId/321111027', 'https://www.espn.com/nfl/game/_/gameId/321111029', 'https://www.espn.com/nfl/game/_/gameId/321111033', 'https://www.espn.com/nfl/game/_/gameId/321111026', 'https://www.espn.com/nfl/game/_/gameId/321111021', 'https://www.espn.com/nfl/game/_/gameId/321111025', 'https://www.espn.com/nfl/game/_/gameId/321111003', 'https://www.espn.com/nfl/game/_/gameId/321112023', 'https://www.espn.com/nfl/game/_/gameId/321122008', 'https://www.espn.com/nfl/game/_/gameId/321122006', 'https://www.espn.com/nfl/game/_/gameId/321122020', 'https://www.espn.com/nfl/game/_/gameId/321125003', 'https://www.espn.com/nfl/game/_/gameId/321125004', 'https://www.espn.com/nfl/game/_/gameId/321125005', 'https://www.espn.com/nfl/game/_/gameId/321125011', 'https://www.espn.com/nfl/game/_/gameId/321125012', 'https://www.espn.com/nfl/game/_/gameId/321125015', 'https://www.espn.com/nfl/game/_/gameId/321125027', 'https://www.espn.com/nfl/game/_/gameId/321125030', 'https://www.espn.com/nfl/game/_/gameId/321125024', 'https://www.espn.com/nfl/game/_/gameId/321125018', 'https://www.espn.com/nfl/game/_/gameId/321125022', 'https://www.espn.com/nfl/game/_/gameId/321125019', 'https://www.espn.com/nfl/game/_/gameId/321126021', 'https://www.espn.com/nfl/game/_/gameId/321206013', 'https://www.espn.com/nfl/game/_/gameId/321209002', 'https://www.espn.com/nfl/game/_/gameId/321209004', 'https://www.espn.com/nfl/game/_/gameId/321209005', 'https://www.espn.com/nfl/game/_/gameId/321209011', 'https://www.espn.com/nfl/game/_/gameId/321209016', 'https://www.espn.com/nfl/game/_/gameId/321209023', 'https://www.espn.com/nfl/game/_/gameId/321209027', 'https://www.espn.com/nfl/game/_/gameId/321209028', 'https://www.espn.com/nfl/game/_/gameId/321209029', 'https://www.espn.com/nfl/game/_/gameId/321209030', 'https://www.espn.com/nfl/game/_/gameId/321209025', 'https://www.espn.com/nfl/game/_/gameId/321209019', 'https://www.espn.com/nfl/game/_/gameId/321209026', 'https://www.espn.com/nfl/game/_/gameId/321209009', 'https://www.espn.com/nfl/game/_/gameId/321210017', 'https://www.espn.com/nfl/game/_/gameId/321213021', 'https://www.espn.com/nfl/game/_/gameId/321216001', 'https://www.espn.com/nfl/game/_/gameId/321216003', 'https://www.espn.com/nfl/game/_/gameId/321216005', 'https://www.espn.com/nfl/game/_/gameId/321216014', 'https://www.espn.com/nfl/game/_/gameId/321216015', 'https://www.espn.com/nfl/game/_/gameId/321216018', 'https://www.espn.com/nfl/game/_/gameId/321216033', 'https://www.espn.com/nfl/game/_/gameId/321216034', 'https://www.espn.com/nfl/game/_/gameId/321216002', 'https://www.espn.com/nfl/game/_/gameId/321216022', 'https://www.espn.com/nfl/game/_/gameId/321216024', 'https://www.espn.com/nfl/game/_/gameId/321216006', 'https://www.espn.com/nfl/game/_/gameId/321216013', 'https://www.espn.com/nfl/game/_/gameId/321216017', 'https://www.espn.com/nfl/game/_/gameId/321217010', 'https://www.espn.com/nfl/game/_/gameId/321222008', 'https://www.espn.com/nfl/game/_/gameId/321223006', 'https://www.espn.com/nfl/game/_/gameId/321223009', 'https://www.espn.com/nfl/game/_/gameId/321223012', 'https://www.espn.com/nfl/game/_/gameId/321223015', 'https://www.espn.com/nfl/game/_/gameId/321223020', 'https://www.espn.com/nfl/game/_/gameId/321223021', 'https://www.espn.com/nfl/game/_/gameId/321223023', 'https://www.espn.com/nfl/game/_/gameId/321223027', 'https://www.espn.com/nfl/game/_/gameId/321223029', 'https://www.espn.com/nfl/game/_/gameId/321223030', 'https://www.espn.com/nfl/game/_/gameId/321223034', 'https://www.espn.com/nfl/game/_/gameId/321223007', 'https://www.espn.com/nfl/game/_/gameId/321223022', 'https://www.espn.com/nfl/game/_/gameId/321223033', 'https://www.espn.com/nfl/game/_/gameId/321223026', 'https://www.espn.com/nfl/game/_/gameId/330912017', 'https://www.espn.com/nfl/game/_/gameId/330915001', 'https://www.espn.com/nfl/game/_/gameId/330915002', 'https://www.espn.com/nfl/game/_/gameId/330915003', 'https://www.espn.com/nfl/game/_/gameId/330915009', 'https://www.espn.com/nfl/game/_/gameId/330915011', 'https://www.espn.com/nfl/game/_/gameId/330915012', 'https://www.espn.com/nfl/game/_/gameId/330915021', 'https://www.espn.com/nfl/game/_/gameId/330915033', 'https://www.espn.com/nfl/game/_/gameId/330915034', 'https://www.espn.com/nfl/game/_/gameId/330915022', 'https://www.espn.com/nfl/game/_/gameId/330915027', 'https://www.espn.com/nfl/game/_/gameId/330915013', 'https://www.espn.com/nfl/game/_/gameId/330915019', 'https://www.espn.com/nfl/game/_/gameId/330915026', 'https://www.espn.com/nfl/game/_/gameId/330916004', 'https://www.espn.com/nfl/game/_/gameId/331003005', 'https://www.espn.com/nfl/game/_/gameId/331006003', 'https://www.espn.com/nfl/game/_/gameId/331006004', 'https://www.espn.com/nfl/game/_/gameId/331006009', 'https://www.espn.com/nfl/game/_/gameId/331006010', 'https://www.espn.com/nfl/game/_/gameId/331006011', 'https://www.espn.com/nfl/game/_/gameId/331006014', 'https://www.espn.com/nfl/game/_/gameId/331006015', 'https://www.espn.com/nfl/game/_/gameId/331006019', 'https://www.espn.com/nfl/game/_/gameId/331006022', 'https://www.espn.com/nfl/game/_/gameId/331006006', 'https://www.espn.com/nfl/game/_/gameId/331006025', 'https://www.espn.com/nfl/game/_/gameId/331006013', 'https://www.espn.com/nfl/game/_/gameId/331007001', 'https://www.espn.com/nfl/game/_/gameId/331017022', 'https://www.espn.com/nfl/game/_/gameId/331020001', 'https://www.espn.com/nfl/game/_/gameId/331020008', 'https://www.espn.com/nfl/game/_/gameId/331020015', 'https://www.espn.com/nfl/game/_/gameId/331020020', 'https://www.espn.com/nfl/game/_/gameId/331020021', 'https://www.espn.com/nfl/game/_/gameId/331020028', 'https://www.espn.com/nfl/game/_/gameId/331020029', 'https://www.espn.com/nfl/game/_/gameId/331020030', 'https://www.espn.com/nfl/game/_/gameId/331020010', 'https://www.espn.com/nfl/game/_/gameId/331020009', 'https://www.espn.com/nfl/game/_/gameId/331020012', 'https://www.espn.com/nfl/game/_/gameId/331020023', 'https://www.espn.com/nfl/game/_/gameId/331020011', 'https://www.espn.com/nfl/game/_/gameId/331021019', 'https://www.espn.com/nfl/game/_/gameId/331024027', 'https://www.espn.com/nfl/game/_/gameId/331027008', 'https://www.espn.com/nfl/game/_/gameId/331027012', 'https://www.espn.com/nfl/game/_/gameId/331027017', 'https://www.espn.com/nfl/game/_/gameId/331027018', 'https://www.espn.com/nfl/game/_/gameId/331027021', 'https://www.espn.com/nfl/game/_/gameId/331027030', 'https://www.espn.com/nfl/game/_/gameId/331027004', 'https://www.espn.com/nfl/game/_/gameId/331027013', 'https://www.espn.com/nfl/game/_/gameId/331027007', 'https://www.espn.com/nfl/game/_/gameId/331027022', 'https://www.espn.com/nfl/game/_/gameId/331027016', 'https://www.espn.com/nfl/game/_/gameId/331028014', 'https://www.espn.com/nfl/game/_/gameId/331107016', 'https://www.espn.com/nfl/game/_/gameId/331110001', 'https://www.espn.com/nfl/game/_/gameId/331110003', 'https://www.espn.com/nfl/game/_/gameId/331110009', 'https://www.espn.com/nfl/game/_/gameId/331110010', 'https://www.espn.com/nfl/game/_/gameId/331110011', 'https://www.espn.com/nfl/game/_/gameId/331110019', 'https://www.espn.com/nfl/game/_/gameId/331110023', 'https://www.espn.com/nfl/game/_/gameId/331110033', 'https://www.espn.com/nfl/game/_/gameId/331110025', 'https://www.espn.com/nfl/game/_/gameId/331110022', 'https://www.espn.com/nfl/game/_/gameId/331110024', 'https://www.espn.com/nfl/game/_/gameId/331110018', 'https://www.espn.com/nfl/game/_/gameId/331111027', 'https://www.espn.com/nfl/game/_/gameId/331114010', 'https://www.espn.com/nfl/game/_/gameId/331117002', 'https://www.espn.com/nfl/game/_/gameId/331117003', 'https://www.espn.com/nfl/game/_/gameId/331117004', 'https://www.espn.com/nfl/game/_/gameId/331117021', 'https://www.espn.com/nfl/game/_/gameId/331117023', 'https://www.espn.com/nfl/game/_/gameId/331117027', 'https://www.espn.com/nfl/game/_/gameId/331117030', 'https://www.espn.com/nfl/game/_/gameId/331117034', 'https://www.espn.com/nfl/game/_/gameId/331117015', 'https://www.espn.com/nfl/game/_/gameId/331117018', 'https://www.espn.com/nfl/game/_/gameId/331117019', 'https://www.espn.com/nfl/game/_/gameId/331117026', 'https://www.espn.com/nfl/game/_/gameId/331117007', 'https://www.espn.com/nfl/game/_/gameId/331118029', 'https://www.espn.com/nfl/game/_/gameId/331121001', 'https://www.espn.com/nfl/game/_/gameId/331124005', 'https://www.espn.com/nfl/game/_/gameId/331124008', 'https://www.espn.com/nfl/game/_/gameId/331124009', 'https://www.espn.com/nfl/game/_/gameId/331124012', 'https://www.espn.com/nfl/game/_/gameId/331124014', 'https://www.espn.com/nfl/game/_/gameId/331124015', 'https://www.espn.com/nfl/game/_/gameId/331124033', 'https://www.espn.com/nfl/game/_/gameId/331124034', 'https://www.espn.com/nfl/game/_/gameId/331124013', 'https://www.espn.com/nfl/game/_/gameId/331124022', 'https://www.espn.com/nfl/game/_/gameId/331124019', 'https://www.espn.com/nfl/game/_/gameId/331124017', 'https://www.espn.com/nfl/game/_/gameId/331125028', 'https://www.espn.com/nfl/game/_/gameId/331212007', 'https://www.espn.com/nfl/game/_/gameId/331215001', 'https://www.espn.com/nfl/game/_/gameId/331215005', 'https://www.espn.com/nfl/game/_/gameId/331215011', 'https://www.espn.com/nfl/game/_/gameId/331215015', 'https://www.espn.com/nfl/game/_/gameId/331215016', 'https://www.espn.com/nfl/game/_/gameId/331215019', 'https://www.espn.com/nfl/game/_/gameId/331215027', 'https://www.espn.com/nfl/game/_/gameId/331215030', 'https://www.espn.com/nfl/game/_/gameId/331215013', 'https://www.espn.com/nfl/game/_/gameId/331215029', 'https://www.espn.com/nfl/game/_/gameId/331215006', 'https://www.espn.com/nfl/game/_/gameId/331215010', 'https://www.espn.com/nfl/game/_/gameId/331215014', 'https://www.espn.com/nfl/game/_/gameId/331215023', 'https://www.espn.com/nfl/game/_/gameId/331216008', 'https://www.espn.com/nfl/game/_/gameId/331222002', 'https://www.espn.com/nfl/game/_/gameId/331222004', 'https://www.espn.com/nfl/game/_/gameId/331222012', 'https://www.espn.com/nfl/game/_/gameId/331222014', 'https://www.espn.com/nfl/game/_/gameId/331222020', 'https://www.espn.com/nfl/game/_/gameId/331222028', 'https://www.espn.com/nfl/game/_/gameId/331222029', 'https://www.espn.com/nfl/game/_/gameId/331222030', 'https://www.espn.com/nfl/game/_/gameId/331222034', 'https://www.espn.com/nfl/game/_/gameId/331222008', 'https://www.espn.com/nfl/game/_/gameId/331222026', 'https://www.espn.com/nfl/game/_/gameId/331222009', 'https://www.espn.com/nfl/game/_/gameId/331222024', 'https://www.espn.com/nfl/game/_/gameId/331222033', 'https://www.espn.com/nfl/game/_/gameId/331222021', 'https://www.espn.com/nfl/game/_/gameId/331223025', 'https://www.espn.com/nfl/game/_/gameId/400554214', 'https://www.espn.com/nfl/game/_/gameId/400554215', 'https://www.espn.com/nfl/game/_/gameId/400554232', 'https://www.espn.com/nfl/game/_/gameId/400554260', 'https://www.espn.com/nfl/game/_/gameId/400554217', 'https://www.espn.com/nfl/game/_/gameId/400554262', 'https://www.espn.com/nfl/game/_/gameId/400554226', 'https://www.espn.com/nfl/game/_/gameId/400554223', 'https://www.espn.com/nfl/game/_/gameId/400554221', 'https://www.espn.com/nfl/game/_/gameId/400554229', 'https://www.espn.com/nfl/game/_/gameId/400554256', 'https://www.espn.com/nfl/game/_/gameId/400554269', 'https://www.espn.com/nfl/game/_/gameId/400554266', 'https://www.espn.com/nfl/game/_/gameId/400554273', 'https://www.espn.com/nfl/game/_/gameId/400554296', 'https://www.espn.com/nfl/game/_/gameId/400554301', 'https://www.espn.com/nfl/game/_/gameId/400554196', 'https://www.espn.com/nfl/game/_/gameId/400554198', 'https://www.espn.com/nfl/game/_/gameId/400554245', 'https://www.espn.com/nfl/game/_/gameId/400554241', 'https://www.espn.com/nfl/game/_/gameId/400554206', 'https://www.espn.com/nfl/game/_/gameId/400554235', 'https://www.espn.com/nfl/game/_/gameId/400554211', 'https://www.espn.com/nfl/game/_/gameId/400554202', 'https://www.espn.com/nfl/game/_/gameId/400554249', 'https://www.espn.com/nfl/game/_/gameId/400554278', 'https://www.espn.com/nfl/game/_/gameId/400554274', 'https://www.espn.com/nfl/game/_/gameId/400554291', 'https://www.espn.com/nfl/game/_/gameId/400554287', 'https://www.espn.com/nfl/game/_/gameId/400554284', 'https://www.espn.com/nfl/game/_/gameId/400554314', 'https://www.espn.com/nfl/game/_/gameId/400554318', 'https://www.espn.com/nfl/game/_/gameId/400554194', 'https://www.espn.com/nfl/game/_/gameId/400554195', 'https://www.espn.com/nfl/game/_/gameId/400554237', 'https://www.espn.com/nfl/game/_/gameId/400554240', 'https://www.espn.com/nfl/game/_/gameId/400554244', 'https://www.espn.com/nfl/game/_/gameId/400554199', 'https://www.espn.com/nfl/game/_/gameId/400554250', 'https://www.espn.com/nfl/game/_/gameId/400554213', 'https://www.espn.com/nfl/game/_/gameId/400554208', 'https://www.espn.com/nfl/game/_/gameId/400554203', 'https://www.espn.com/nfl/game/_/gameId/400554247', 'https://www.espn.com/nfl/game/_/gameId/400554253', 'https://www.espn.com/nfl/game/_/gameId/400554280', 'https://www.espn.com/nfl/game/_/gameId/400554276', 'https://www.espn.com/nfl/game/_/gameId/400554283', 'https://www.espn.com/nfl/game/_/gameId/400554288', 'https://www.espn.com/nfl/game/_/gameId/400554201', 'https://www.espn.com/nfl/game/_/gameId/400554207', 'https://www.espn.com/nfl/game/_/gameId/400554238', 'https://www.espn.com/nfl/game/_/gameId/400554286', 'https://www.espn.com/nfl/game/_/gameId/400554252', 'https://www.espn.com/nfl/game/_/gameId/400554279', 'https://www.espn.com/nfl/game/_/gameId/400554248', 'https://www.espn.com/nfl/game/_/gameId/400554212', 'https://www.espn.com/nfl/game/_/gameId/400554290', 'https://www.espn.com/nfl/game/_/gameId/400554242', 'https://www.espn.com/nfl/game/_/gameId/400554315', 'https://www.espn.com/nfl/game/_/gameId/400554319', 'https://www.espn.com/nfl/game/_/gameId/400554325', 'https://www.espn.com/nfl/game/_/gameId/400554197', 'https://www.espn.com/nfl/game/_/gameId/400554234', 'https://www.espn.com/nfl/game/_/gameId/400554236', 'https://www.espn.com/nfl/game/_/gameId/400554204', 'https://www.espn.com/nfl/game/_/gameId/400554239', 'https://www.espn.com/nfl/game/_/gameId/400554210', 'https://www.espn.com/nfl/game/_/gameId/400554209', 'https://www.espn.com/nfl/game/_/gameId/400554205', 'https://www.espn.com/nfl/game/_/gameId/400554200', 'https://www.espn.com/nfl/game/_/gameId/400554243', 'https://www.espn.com/nfl/game/_/gameId/400554246', 'https://www.espn.com/nfl/game/_/gameId/400554275', 'https://www.espn.com/nfl/game/_/gameId/400554251', 'https://www.espn.com/nfl/game/_/gameId/400554277', 'https://www.espn.com/nfl/game/_/gameId/400554282', 'https://www.espn.com/nfl/game/_/gameId/400554216', 'https://www.espn.com/nfl/game/_/gameId/400554259', 'https://www.espn.com/nfl/game/_/gameId/400554263', 'https://www.espn.com/nfl/game/_/gameId/400554295', 'https://www.espn.com/nfl/game/_/gameId/400554222', 'https://www.espn.com/nfl/game/_/gameId/400554299', 'https://www.espn.com/nfl/game/_/gameId/400554255', 'https://www.espn.com/nfl/game/_/gameId/400554231', 'https://www.espn.com/nfl/game/_/gameId/400554225', 'https://www.espn.com/nfl/game/_/gameId/400554302', 'https://www.espn.com/nfl/game/_/gameId/400554220', 'https://www.espn.com/nfl/game/_/gameId/400554308', 'https://www.espn.com/nfl/game/_/gameId/400554305', 'https://www.espn.com/nfl/game/_/gameId/400554312', 'https://www.espn.com/nfl/game/_/gameId/400554335', 'https://www.espn.com/nfl/game/_/gameId/400554219', 'https://www.espn.com/nfl/game/_/gameId/400554268', 'https://www.espn.com/nfl/game/_/gameId/400554270', 'https://www.espn.com/nfl/game/_/gameId/400554271', 'https://www.espn.com/nfl/game/_/gameId/400554294', 'https://www.espn.com/nfl/game/_/gameId/400554265', 'https://www.espn.com/nfl/game/_/gameId/400554257', 'https://www.espn.com/nfl/game/_/gameId/400554233', 'https://www.espn.com/nfl/game/_/gameId/400554261', 'https://www.espn.com/nfl/game/_/gameId/400554228', 'https://www.espn.com/nfl/game/_/gameId/400554297', 'https://www.espn.com/nfl/game/_/gameId/400554304', 'https://www.espn.com/nfl/game/_/gameId/400554300', 'https://www.espn.com/nfl/game/_/gameId/400554307', 'https://www.espn.com/nfl/game/_/gameId/400554311', 'https://www.espn.com/nfl/game/_/gameId/400554309', 'https://www.espn.com/nfl/game/_/gameId/400554344', 'https://www.espn.com/nfl/game/_/gameId/400554334', 'https://www.espn.com/nfl/game/_/gameId/400554337', 'https://www.espn.com/nfl/game/_/gameId/400554341', 'https://www.espn.com/nfl/game/_/gameId/400554347', 'https://www.espn.com/nfl/game/_/gameId/400554351', 'https://www.espn.com/nfl/game/_/gameId/400554339', 'https://www.espn.com/nfl/game/_/gameId/400554377', 'https://www.espn.com/nfl/game/_/gameId/400554381', 'https://www.espn.com/nfl/game/_/gameId/400554385', 'https://www.espn.com/nfl/game/_/gameId/400554389', 'https://www.espn.com/nfl/game/_/gameId/400554393', 'https://www.espn.com/nfl/game/_/gameId/400554328', 'https://www.espn.com/nfl/game/_/gameId/400554332', 'https://www.espn.com/nfl/game/_/gameId/400554355', 'https://www.espn.com/nfl/game/_/gameId/400554362', 'https://www.espn.com/nfl/game/_/gameId/400554370', 'https://www.espn.com/nfl/game/_/gameId/400554372', 'https://www.espn.com/nfl/game/_/gameId/400554358', 'https://www.espn.com/nfl/game/_/gameId/400554367', 'https://www.espn.com/nfl/game/_/gameId/400554396', 'https://www.espn.com/nfl/game/_/gameId/400554397', 'https://www.espn.com/nfl/game/_/gameId/400554400', 'https://www.espn.com/nfl/game/_/gameId/400554403', 'https://www.espn.com/nfl/game/_/gameId/400554408', 'https://www.espn.com/nfl/game/_/gameId/400554293', 'https://www.espn.com/nfl/game/_/gameId/400554317', 'https://www.espn.com/nfl/game/_/gameId/400554333', 'https://www.espn.com/nfl/game/_/gameId/400554326', 'https://www.espn.com/nfl/game/_/gameId/400554324', 'https://www.espn.com/nfl/game/_/gameId/400554322', 'https://www.espn.com/nfl/game/_/gameId/400554320', 'https://www.espn.com/nfl/game/_/gameId/400554329', 'https://www.espn.com/nfl/game/_/gameId/400554360', 'https://www.espn.com/nfl/game/_/gameId/400554357', 'https://www.espn.com/nfl/game/_/gameId/400554364', 'https://www.espn.com/nfl/game/_/gameId/400554365', 'https://www.espn.com/nfl/game/_/gameId/400554369', 'https://www.espn.com/nfl/game/_/gameId/400554331', 'https://www.espn.com/nfl/game/_/gameId/400607990', 'https://www.espn.com/nfl/game/_/gameId/400554394', 'https://www.espn.com/nfl/game/_/gameId/400554281', 'https://www.espn.com/nfl/game/_/gameId/400554285', 'https://www.espn.com/nfl/game/_/gameId/400554289', 'https://www.espn.com/nfl/game/_/gameId/400554321', 'https://www.espn.com/nfl/game/_/gameId/400554292', 'https://www.espn.com/nfl/game/_/gameId/400554354', 'https://www.espn.com/nfl/game/_/gameId/400554363', 'https://www.espn.com/nfl/game/_/gameId/400554359', 'https://www.espn.com/nfl/game/_/gameId/400554330', 'https://www.espn.com/nfl/game/_/gameId/400554327', 'https://www.espn.com/nfl/game/_/gameId/400554323', 'https://www.espn.com/nfl/game/_/gameId/400554316', 'https://www.espn.com/nfl/game/_/gameId/400554368', 'https://www.espn.com/nfl/game/_/gameId/400554371', 'https://www.espn.com/nfl/game/_/gameId/400554395', 'https://www.espn.com/nfl/game/_/gameId/400554399', 'https://www.espn.com/nfl/game/_/gameId/400554342', 'https://www.espn.com/nfl/game/_/gameId/400554346', 'https://www.espn.com/nfl/game/_/gameId/400554386', 'https://www.espn.com/nfl/game/_/gameId/400554392', 'https://www.espn.com/nfl/game/_/gameId/400554380', 'https://www.espn.com/nfl/game/_/gameId/400554376', 'https://www.espn.com/nfl/game/_/gameId/400554353', 'https://www.espn.com/nfl/game/_/gameId/400554350', 'https://www.espn.com/nfl/game/_/gameId/400554390', 'https://www.espn.com/nfl/game/_/gameId/400554382', 'https://www.espn.com/nfl/game/_/gameId/400554418', 'https://www.espn.com/nfl/game/_/gameId/400554420', 'https://www.espn.com/nfl/game/_/gameId/400554415', 'https://www.espn.com/nfl/game/_/gameId/400554423', 'https://www.espn.com/nfl/game/_/gameId/400554425', 'https://www.espn.com/nfl/game/_/gameId/400554427', 'https://www.espn.com/nfl/game/_/gameId/400554356', 'https://www.espn.com/nfl/game/_/gameId/400554366', 'https://www.espn.com/nfl/game/_/gameId/400554361', 'https://www.espn.com/nfl/game/_/gameId/400554401', 'https://www.espn.com/nfl/game/_/gameId/400554373', 'https://www.espn.com/nfl/game/_/gameId/400554406', 'https://www.espn.com/nfl/game/_/gameId/400554436', 'https://www.espn.com/nfl/game/_/gameId/400554434', 'https://www.espn.com/nfl/game/_/gameId/400554410', 'https://www.espn.com/nfl/game/_/gameId/400554402', 'https://www.espn.com/nfl/game/_/gameId/400554398', 'https://www.espn.com/nfl/game/_/gameId/400554439', 'https://www.espn.com/nfl/game/_/gameId/400554444', 'https://www.espn.com/nfl/game/_/gameId/400554442', 'https://www.espn.com/nfl/game/_/gameId/400554447', 'https://www.espn.com/nfl/game/_/gameId/400554449', 'https://www.espn.com/nfl/game/_/gameId/400791484', 'https://www.espn.com/nfl/game/_/gameId/400791500', 'https://www.espn.com/nfl/game/_/gameId/400791491', 'https://www.espn.com/nfl/game/_/gameId/400791496', 'https://www.espn.com/nfl/game/_/gameId/400791594', 'https://www.espn.com/nfl/game/_/gameId/400791592', 'https://www.espn.com/nfl/game/_/gameId/400791553', 'https://www.espn.com/nfl/game/_/gameId/400791583', 'https://www.espn.com/nfl/game/_/gameId/400791557', 'https://www.espn.com/nfl/game/_/gameId/400791546', 'https://www.espn.com/nfl/game/_/gameId/400791589', 'https://www.espn.com/nfl/game/_/gameId/400791597', 'https://www.espn.com/nfl/game/_/gameId/400791623', 'https://www.espn.com/nfl/game/_/gameId/400791626', 'https://www.espn.com/nfl/game/_/gameId/400791631', 'https://www.espn.com/nfl/game/_/gameId/400791635', 'https://www.espn.com/nfl/game/_/gameId/400791662', 'https://www.espn.com/nfl/game/_/gameId/400761514', 'https://www.espn.com/nfl/game/_/gameId/400791709', 'https://www.espn.com/nfl/game/_/gameId/400791678', 'https://www.espn.com/nfl/game/_/gameId/400791706', 'https://www.espn.com/nfl/game/_/gameId/400791712', 'https://www.espn.com/nfl/game/_/gameId/400791671', 'https://www.espn.com/nfl/game/_/gameId/400791701', 'https://www.espn.com/nfl/game/_/gameId/400791704', 'https://www.espn.com/nfl/game/_/gameId/400791714', 'https://www.espn.com/nfl/game/_/gameId/400791719', 'https://www.espn.com/nfl/game/_/gameId/400791718', 'https://www.espn.com/nfl/game/_/gameId/400791716', 'https://www.espn.com/nfl/game/_/gameId/400791720', 'https://www.espn.com/nfl/game/_/gameId/400791741', 'https://www.espn.com/nfl/game/_/gameId/400791487', 'https://www.espn.com/nfl/game/_/gameId/400791495', 'https://www.espn.com/nfl/game/_/gameId/400791492', 'https://www.espn.com/nfl/game/_/gameId/400791548', 'https://www.espn.com/nfl/game/_/gameId/400791551', 'https://www.espn.com/nfl/game/_/gameId/400791488', 'https://www.espn.com/nfl/game/_/gameId/400791542', 'https://www.espn.com/nfl/game/_/gameId/400791498', 'https://www.espn.com/nfl/game/_/gameId/400791545', 'https://www.espn.com/nfl/game/_/gameId/400791554', 'https://www.espn.com/nfl/game/_/gameId/400791559', 'https://www.espn.com/nfl/game/_/gameId/400791560', 'https://www.espn.com/nfl/game/_/gameId/400791584', 'https://www.espn.com/nfl/game/_/gameId/400791588', 'https://www.espn.com/nfl/game/_/gameId/400791593', 'https://www.espn.com/nfl/game/_/gameId/400791627', 'https://www.espn.com/nfl/game/_/gameId/400791633', 'https://www.espn.com/nfl/game/_/gameId/400791629', 'https://www.espn.com/nfl/game/_/gameId/400791639', 'https://www.espn.com/nfl/game/_/gameId/400791625', 'https://www.espn.com/nfl/game/_/gameId/400791598', 'https://www.espn.com/nfl/game/_/gameId/400791621', 'https://www.espn.com/nfl/game/_/gameId/400791637', 'https://www.espn.com/nfl/game/_/gameId/400791663', 'https://www.espn.com/nfl/game/_/gameId/400791667', 'https://www.espn.com/nfl/game/_/gameId/400791670', 'https://www.espn.com/nfl/game/_/gameId/400791674', 'https://www.espn.com/nfl/game/_/gameId/400791676', 'https://www.espn.com/nfl/game/_/gameId/400791503', 'https://www.espn.com/nfl/game/_/gameId/400761515', 'https://www.espn.com/nfl/game/_/gameId/400791523', 'https://www.espn.com/nfl/game/_/gameId/400791517', 'https://www.espn.com/nfl/game/_/gameId/400791520', 'https://www.espn.com/nfl/game/_/gameId/400791527', 'https://www.espn.com/nfl/game/_/gameId/400791529', 'https://www.espn.com/nfl/game/_/gameId/400791533', 'https://www.espn.com/nfl/game/_/gameId/400791536', 'https://www.espn.com/nfl/game/_/gameId/400791511', 'https://www.espn.com/nfl/game/_/gameId/400791540', 'https://www.espn.com/nfl/game/_/gameId/400791564', 'https://www.espn.com/nfl/game/_/gameId/400791567', 'https://www.espn.com/nfl/game/_/gameId/400791574', 'https://www.espn.com/nfl/game/_/gameId/400791601', 'https://www.espn.com/nfl/game/_/gameId/400761516', 'https://www.espn.com/nfl/game/_/gameId/400791605', 'https://www.espn.com/nfl/game/_/gameId/400791642', 'https://www.espn.com/nfl/game/_/gameId/400791609', 'https://www.espn.com/nfl/game/_/gameId/400791613', 'https://www.espn.com/nfl/game/_/gameId/400791618', 'https://www.espn.com/nfl/game/_/gameId/400791649', 'https://www.espn.com/nfl/game/_/gameId/400791646', 'https://www.espn.com/nfl/game/_/gameId/400791653', 'https://www.espn.com/nfl/game/_/gameId/400791657', 'https://www.espn.com/nfl/game/_/gameId/400791681', 'https://www.espn.com/nfl/game/_/gameId/400791684', 'https://www.espn.com/nfl/game/_/gameId/400791690', 'https://www.espn.com/nfl/game/_/gameId/400791698', 'https://www.espn.com/nfl/game/_/gameId/400791725', 'https://www.espn.com/nfl/game/_/gameId/400791727', 'https://www.espn.com/nfl/game/_/gameId/400791721', 'https://www.espn.com/nfl/game/_/gameId/400791722', 'https://www.espn.com/nfl/game/_/gameId/400791728', 'https://www.espn.com/nfl/game/_/gameId/400791730', 'https://www.espn.com/nfl/game/_/gameId/400791700', 'https://www.espn.com/nfl/game/_/gameId/400791732', 'https://www.espn.com/nfl/game/_/gameId/400791731', 'https://www.espn.com/nfl/game/_/gameId/400791733', 'https://www.espn.com/nfl/game/_/gameId/400791734', 'https://www.espn.com/nfl/game/_/gameId/400791735', 'https://www.espn.com/nfl/game/_/gameId/400791486', 'https://www.espn.com/nfl/game/_/gameId/400791490', 'https://www.espn.com/nfl/game/_/gameId/400791499', 'https://www.espn.com/nfl/game/_/gameId/400791543', 'https://www.espn.com/nfl/game/_/gameId/400791552', 'https://www.espn.com/nfl/game/_/gameId/400791556', 'https://www.espn.com/nfl/game/_/gameId/400791494', 'https://www.espn.com/nfl/game/_/gameId/400791549', 'https://www.espn.com/nfl/game/_/gameId/400791581', 'https://www.espn.com/nfl/game/_/gameId/400791586', 'https://www.espn.com/nfl/game/_/gameId/400791595', 'https://www.espn.com/nfl/game/_/gameId/400791591', 'https://www.espn.com/nfl/game/_/gameId/400791599', 'https://www.espn.com/nfl/game/_/gameId/400791622', 'https://www.espn.com/nfl/game/_/gameId/400791632', 'https://www.espn.com/nfl/game/_/gameId/400791640', 'https://www.espn.com/nfl/game/_/gameId/400791673', 'https://www.espn.com/nfl/game/_/gameId/400791636', 'https://www.espn.com/nfl/game/_/gameId/400791703', 'https://www.espn.com/nfl/game/_/gameId/400791668', 'https://www.espn.com/nfl/game/_/gameId/400791707', 'https://www.espn.com/nfl/game/_/gameId/400791679', 'https://www.espn.com/nfl/game/_/gameId/400791665', 'https://www.espn.com/nfl/game/_/gameId/400791715', 'https://www.espn.com/nfl/game/_/gameId/400791677', 'https://www.espn.com/nfl/game/_/gameId/400791713', 'https://www.espn.com/nfl/game/_/gameId/400791710', 'https://www.espn.com/nfl/game/_/gameId/400791717', 'https://www.espn.com/nfl/game/_/gameId/400791507', 'https://www.espn.com/nfl/game/_/gameId/400791509', 'https://www.espn.com/nfl/game/_/gameId/400791510', 'https://www.espn.com/nfl/game/_/gameId/400791514', 'https://www.espn.com/nfl/game/_/gameId/400791516', 'https://www.espn.com/nfl/game/_/gameId/400791502', 'https://www.espn.com/nfl/game/_/gameId/400791505', 'https://www.espn.com/nfl/game/_/gameId/400791504', 'https://www.espn.com/nfl/game/_/gameId/400791522', 'https://www.espn.com/nfl/game/_/gameId/400791506', 'https://www.espn.com/nfl/game/_/gameId/400791519', 'https://www.espn.com/nfl/game/_/gameId/400791512', 'https://www.espn.com/nfl/game/_/gameId/400791526', 'https://www.espn.com/nfl/game/_/gameId/400791532', 'https://www.espn.com/nfl/game/_/gameId/400791537', 'https://www.espn.com/nfl/game/_/gameId/400791561', 'https://www.espn.com/nfl/game/_/gameId/400791568', 'https://www.espn.com/nfl/game/_/gameId/400791611', 'https://www.espn.com/nfl/game/_/gameId/400791647', 'https://www.espn.com/nfl/game/_/gameId/400791619', 'https://www.espn.com/nfl/game/_/gameId/400791643', 'https://www.espn.com/nfl/game/_/gameId/400791576', 'https://www.espn.com/nfl/game/_/gameId/400791615', 'https://www.espn.com/nfl/game/_/gameId/400791606', 'https://www.espn.com/nfl/game/_/gameId/400791572', 'https://www.espn.com/nfl/game/_/gameId/400791579', 'https://www.espn.com/nfl/game/_/gameId/400791655', 'https://www.espn.com/nfl/game/_/gameId/400791652', 'https://www.espn.com/nfl/game/_/gameId/400791658', 'https://www.espn.com/nfl/game/_/gameId/400791602', 'https://www.espn.com/nfl/game/_/gameId/400791682', 'https://www.espn.com/nfl/game/_/gameId/400791686', 'https://www.espn.com/nfl/game/_/gameId/400791513', 'https://www.espn.com/nfl/game/_/gameId/400791580', 'https://www.espn.com/nfl/game/_/gameId/400791566', 'https://www.espn.com/nfl/game/_/gameId/400791530', 'https://www.espn.com/nfl/game/_/gameId/400791577', 'https://www.espn.com/nfl/game/_/gameId/400791534', 'https://www.espn.com/nfl/game/_/gameId/400791562', 'https://www.espn.com/nfl/game/_/gameId/400791524', 'https://www.espn.com/nfl/game/_/gameId/400791539', 'https://www.espn.com/nfl/game/_/gameId/400791604', 'https://www.espn.com/nfl/game/_/gameId/400791573', 'https://www.espn.com/nfl/game/_/gameId/400791616', 'https://www.espn.com/nfl/game/_/gameId/400791608', 'https://www.espn.com/nfl/game/_/gameId/400791612', 'https://www.espn.com/nfl/game/_/gameId/400791570', 'https://www.espn.com/nfl/game/_/gameId/400791641', 'https://www.espn.com/nfl/game/_/gameId/400791650', 'https://www.espn.com/nfl/game/_/gameId/400791656', 'https://www.espn.com/nfl/game/_/gameId/400791688', 'https://www.espn.com/nfl/game/_/gameId/400791660', 'https://www.espn.com/nfl/game/_/gameId/400791694', 'https://www.espn.com/nfl/game/_/gameId/400791693', 'https://www.espn.com/nfl/game/_/gameId/400791695', 'https://www.espn.com/nfl/game/_/gameId/400791685', 'https://www.espn.com/nfl/game/_/gameId/400791696', 'https://www.espn.com/nfl/game/_/gameId/400791699', 'https://www.espn.com/nfl/game/_/gameId/400791697', 'https://www.espn.com/nfl/game/_/gameId/400791723', 'https://www.espn.com/nfl/game/_/gameId/400791724', 'https://www.espn.com/nfl/game/_/gameId/400791726', 'https://www.espn.com/nfl/game/_/gameId/400791692', 'https://www.espn.com/nfl/game/_/gameId/400791729', 'https://www.espn.com/nfl/game/_/gameId/400791501', 'https://www.espn.com/nfl/game/_/gameId/400791508', 'https://www.espn.com/nfl/game/_/gameId/400791563', 'https://www.espn.com/nfl/game/_/gameId/400791535', 'https://www.espn.com/nfl/game/_/gameId/400791531', 'https://www.espn.com/nfl/game/_/gameId/400791518', 'https://www.espn.com/nfl/game/_/gameId/400791521', 'https://www.espn.com/nfl/game/_/gameId/400791525', 'https://www.espn.com/nfl/game/_/gameId/400791515', 'https://www.espn.com/nfl/game/_/gameId/400791538', 'https://www.espn.com/nfl/game/_/gameId/400791575', 'https://www.espn.com/nfl/game/_/gameId/400791528', 'https://www.espn.com/nfl/game/_/gameId/400791571', 'https://www.espn.com/nfl/game/_/gameId/400791569', 'https://www.espn.com/nfl/game/_/gameId/400791565', 'https://www.espn.com/nfl/game/_/gameId/400791578', 'https://www.espn.com/nfl/game/_/gameId/400874484', 'https://www.espn.com/nfl/game/_/gameId/400874522', 'https://www.espn.com/nfl/game/_/gameId/400874524', 'https://www.espn.com/nfl/game/_/gameId/400874570', 'https://www.espn.com/nfl/game/_/gameId/400874543', 'https://www.espn.com/nfl/game/_/gameId/400874527', 'https://www.espn.com/nfl/game/_/gameId/400874520', 'https://www.espn.com/nfl/game/_/gameId/400874486', 'https://www.espn.com/nfl/game/_/gameId/400874510', 'https://www.espn.com/nfl/game/_/gameId/400874511', 'https://www.espn.com/nfl/game/_/gameId/400874577', 'https://www.espn.com/nfl/game/_/gameId/400874574', 'https://www.espn.com/nfl/game/_/gameId/400874573', 'https://www.espn.com/nfl/game/_/gameId/400874539', 'https://www.espn.com/nfl/game/_/gameId/400874537', 'https://www.espn.com/nfl/game/_/gameId/400874532', 'https://www.espn.com/nfl/game/_/gameId/400874530', 'https://www.espn.com/nfl/game/_/gameId/400874512', 'https://www.espn.com/nfl/game/_/gameId/400874488', 'https://www.espn.com/nfl/game/_/gameId/400874541', 'https://www.espn.com/nfl/game/_/gameId/400874529', 'https://www.espn.com/nfl/game/_/gameId/400874487', 'https://www.espn.com/nfl/game/_/gameId/400874518', 'https://www.espn.com/nfl/game/_/gameId/400874535', 'https://www.espn.com/nfl/game/_/gameId/400874549', 'https://www.espn.com/nfl/game/_/gameId/400874514', 'https://www.espn.com/nfl/game/_/gameId/400874515', 'https://www.espn.com/nfl/game/_/gameId/400874526', 'https://www.espn.com/nfl/game/_/gameId/400874525', 'https://www.espn.com/nfl/game/_/gameId/400874517', 'https://www.espn.com/nfl/game/_/gameId/400874545', 'https://www.espn.com/nfl/game/_/gameId/400874547', 'https://www.espn.com/nfl/game/_/gameId/400874551', 'https://www.espn.com/nfl/game/_/gameId/400874558', 'https://www.espn.com/nfl/game/_/gameId/400874613', 'https://www.espn.com/nfl/game/_/gameId/400874610', 'https://www.espn.com/nfl/game/_/gameId/400874562', 'https://www.espn.com/nfl/game/_/gameId/400874565', 'https://www.espn.com/nfl/game/_/gameId/400874682', 'https://www.espn.com/nfl/game/_/gameId/400874615', 'https://www.espn.com/nfl/game/_/gameId/400874567', 'https://www.espn.com/nfl/game/_/gameId/400874620', 'https://www.espn.com/nfl/game/_/gameId/400874618', 'https://www.espn.com/nfl/game/_/gameId/400874624', 'https://www.espn.com/nfl/game/_/gameId/400874623', 'https://www.espn.com/nfl/game/_/gameId/400874628', 'https://www.espn.com/nfl/game/_/gameId/400874650', 'https://www.espn.com/nfl/game/_/gameId/400874653', 'https://www.espn.com/nfl/game/_/gameId/400874655', 'https://www.espn.com/nfl/game/_/gameId/400874657', 'https://www.espn.com/nfl/game/_/gameId/400874664', 'https://www.espn.com/nfl/game/_/gameId/400874668', 'https://www.espn.com/nfl/game/_/gameId/400874663', 'https://www.espn.com/nfl/game/_/gameId/400874662', 'https://www.espn.com/nfl/game/_/gameId/400874660', 'https://www.espn.com/nfl/game/_/gameId/400874666', 'https://www.espn.com/nfl/game/_/gameId/400874658', 'https://www.espn.com/nfl/game/_/gameId/400874669', 'https://www.espn.com/nfl/game/_/gameId/400874671', 'https://www.espn.com/nfl/game/_/gameId/400874672', 'https://www.espn.com/nfl/game/_/gameId/400874674', 'https://www.espn.com/nfl/game/_/gameId/400874675', 'https://www.espn.com/nfl/game/_/gameId/400874677', 'https://www.espn.com/nfl/game/_/gameId/400874693', 'https://www.espn.com/nfl/game/_/gameId/400874698', 'https://www.espn.com/nfl/game/_/gameId/400874708', 'https://www.espn.com/nfl/game/_/gameId/400874709', 'https://www.espn.com/nfl/game/_/gameId/400874703', 'https://www.espn.com/nfl/game/_/gameId/400874730', 'https://www.espn.com/nfl/game/_/gameId/400874736', 'https://www.espn.com/nfl/game/_/gameId/400874707', 'https://www.espn.com/nfl/game/_/gameId/400874705', 'https://www.espn.com/nfl/game/_/gameId/400874701', 'https://www.espn.com/nfl/game/_/gameId/400874731', 'https://www.espn.com/nfl/game/_/gameId/400874733', 'https://www.espn.com/nfl/game/_/gameId/400874732', 'https://www.espn.com/nfl/game/_/gameId/400874734', 'https://www.espn.com/nfl/game/_/gameId/400874735', 'https://www.espn.com/nfl/game/_/gameId/400874429', 'https://www.espn.com/nfl/game/_/gameId/400874490', 'https://www.espn.com/nfl/game/_/gameId/400874494', 'https://www.espn.com/nfl/game/_/gameId/400874496', 'https://www.espn.com/nfl/game/_/gameId/400874492', 'https://www.espn.com/nfl/game/_/gameId/400874491', 'https://www.espn.com/nfl/game/_/gameId/400874500', 'https://www.espn.com/nfl/game/_/gameId/400874501', 'https://www.espn.com/nfl/game/_/gameId/400874493', 'https://www.espn.com/nfl/game/_/gameId/400874498', 'https://www.espn.com/nfl/game/_/gameId/400874505', 'https://www.espn.com/nfl/game/_/gameId/400874503', 'https://www.espn.com/nfl/game/_/gameId/400874506', 'https://www.espn.com/nfl/game/_/gameId/400874508', 'https://www.espn.com/nfl/game/_/gameId/400874509', 'https://www.espn.com/nfl/game/_/gameId/400874553', 'https://www.espn.com/nfl/game/_/gameId/400874555', 'https://www.espn.com/nfl/game/_/gameId/400874619', 'https://www.espn.com/nfl/game/_/gameId/400874612', 'https://www.espn.com/nfl/game/_/gameId/400874557', 'https://www.espn.com/nfl/game/_/gameId/400874564', 'https://www.espn.com/nfl/game/_/gameId/400874561', 'https://www.espn.com/nfl/game/_/gameId/400874625', 'https://www.espn.com/nfl/game/_/gameId/400874569', 'https://www.espn.com/nfl/game/_/gameId/400874622', 'https://www.espn.com/nfl/game/_/gameId/400874616', 'https://www.espn.com/nfl/game/_/gameId/400874629', 'https://www.espn.com/nfl/game/_/gameId/400874652', 'https://www.espn.com/nfl/game/_/gameId/400874605', 'https://www.espn.com/nfl/game/_/gameId/400874599', 'https://www.espn.com/nfl/game/_/gameId/400874600', 'https://www.espn.com/nfl/game/_/gameId/400874601', 'https://www.espn.com/nfl/game/_/gameId/400874604', 'https://www.espn.com/nfl/game/_/gameId/400874603', 'https://www.espn.com/nfl/game/_/gameId/400874598', 'https://www.espn.com/nfl/game/_/gameId/400874596', 'https://www.espn.com/nfl/game/_/gameId/400874597', 'https://www.espn.com/nfl/game/_/gameId/400874594', 'https://www.espn.com/nfl/game/_/gameId/400874593', 'https://www.espn.com/nfl/game/_/gameId/400874592', 'https://www.espn.com/nfl/game/_/gameId/400874591', 'https://www.espn.com/nfl/game/_/gameId/400874609', 'https://www.espn.com/nfl/game/_/gameId/400874646', 'https://www.espn.com/nfl/game/_/gameId/400874634', 'https://www.espn.com/nfl/game/_/gameId/400874638', 'https://www.espn.com/nfl/game/_/gameId/400874641', 'https://www.espn.com/nfl/game/_/gameId/400874644', 'https://www.espn.com/nfl/game/_/gameId/400874649', 'https://www.espn.com/nfl/game/_/gameId/400874695', 'https://www.espn.com/nfl/game/_/gameId/400874691', 'https://www.espn.com/nfl/game/_/gameId/400874697', 'https://www.espn.com/nfl/game/_/gameId/400874700', 'https://www.espn.com/nfl/game/_/gameId/400874702', 'https://www.espn.com/nfl/game/_/gameId/400874704', 'https://www.espn.com/nfl/game/_/gameId/400874706', 'https://www.espn.com/nfl/game/_/gameId/400874495', 'https://www.espn.com/nfl/game/_/gameId/400874499', 'https://www.espn.com/nfl/game/_/gameId/400874502', 'https://www.espn.com/nfl/game/_/gameId/400874566', 'https://www.espn.com/nfl/game/_/gameId/400874554', 'https://www.espn.com/nfl/game/_/gameId/400874507', 'https://www.espn.com/nfl/game/_/gameId/400874614', 'https://www.espn.com/nfl/game/_/gameId/400874654', 'https://www.espn.com/nfl/game/_/gameId/400874626', 'https://www.espn.com/nfl/game/_/gameId/400874560', 'https://www.espn.com/nfl/game/_/gameId/400874659', 'https://www.espn.com/nfl/game/_/gameId/400874665', 'https://www.espn.com/nfl/game/_/gameId/400874670', 'https://www.espn.com/nfl/game/_/gameId/400874680', 'https://www.espn.com/nfl/game/_/gameId/400874676', 'https://www.espn.com/nfl/game/_/gameId/400874684', 'https://www.espn.com/nfl/game/_/gameId/400874713', 'https://www.espn.com/nfl/game/_/gameId/400874715', 'https://www.espn.com/nfl/game/_/gameId/400874723', 'https://www.espn.com/nfl/game/_/gameId/400874721', 'https://www.espn.com/nfl/game/_/gameId/400874720', 'https://www.espn.com/nfl/game/_/gameId/400874718', 'https://www.espn.com/nfl/game/_/gameId/400874717', 'https://www.espn.com/nfl/game/_/gameId/400874719', 'https://www.espn.com/nfl/game/_/gameId/400874722', 'https://www.espn.com/nfl/game/_/gameId/400874724', 'https://www.espn.com/nfl/game/_/gameId/400874726', 'https://www.espn.com/nfl/game/_/gameId/400874725', 'https://www.espn.com/nfl/game/_/gameId/400874727', 'https://www.espn.com/nfl/game/_/gameId/400874728', 'https://www.espn.com/nfl/game/_/gameId/400874729', 'https://www.espn.com/nfl/game/_/gameId/400874428', 'https://www.espn.com/nfl/game/_/gameId/400874497', 'https://www.espn.com/nfl/game/_/gameId/400874563', 'https://www.espn.com/nfl/game/_/gameId/400874568', 'https://www.espn.com/nfl/game/_/gameId/400874504', 'https://www.espn.com/nfl/game/_/gameId/400874611', 'https://www.espn.com/nfl/game/_/gameId/400874556', 'https://www.espn.com/nfl/game/_/gameId/400874552', 'https://www.espn.com/nfl/game/_/gameId/400874559', 'https://www.espn.com/nfl/game/_/gameId/400874617', 'https://www.espn.com/nfl/game/_/gameId/400874621', 'https://www.espn.com/nfl/game/_/gameId/400874651', 'https://www.espn.com/nfl/game/_/gameId/400874627', 'https://www.espn.com/nfl/game/_/gameId/400874550', 'https://www.espn.com/nfl/game/_/gameId/400874656', 'https://www.espn.com/nfl/game/_/gameId/400874661', 'https://www.espn.com/nfl/game/_/gameId/400874667', 'https://www.espn.com/nfl/game/_/gameId/400874673', 'https://www.espn.com/nfl/game/_/gameId/400874683', 'https://www.espn.com/nfl/game/_/gameId/400874678', 'https://www.espn.com/nfl/game/_/gameId/400874714', 'https://www.espn.com/nfl/game/_/gameId/400874686', 'https://www.espn.com/nfl/game/_/gameId/400874688', 'https://www.espn.com/nfl/game/_/gameId/400874687', 'https://www.espn.com/nfl/game/_/gameId/400874685', 'https://www.espn.com/nfl/game/_/gameId/400874681', 'https://www.espn.com/nfl/game/_/gameId/400874710', 'https://www.espn.com/nfl/game/_/gameId/400874689', 'https://www.espn.com/nfl/game/_/gameId/400874711', 'https://www.espn.com/nfl/game/_/gameId/400874712', 'https://www.espn.com/nfl/game/_/gameId/400874679', 'https://www.espn.com/nfl/game/_/gameId/400874716', 'https://www.espn.com/nfl/game/_/gameId/400874485', 'https://www.espn.com/nfl/game/_/gameId/400874489', 'https://www.espn.com/nfl/game/_/gameId/400874534', 'https://www.espn.com/nfl/game/_/gameId/400874528', 'https://www.espn.com/nfl/game/_/gameId/400874523', 'https://www.espn.com/nfl/game/_/gameId/400874516', 'https://www.espn.com/nfl/game/_/gameId/400874540', 'https://www.espn.com/nfl/game/_/gameId/400874521', 'https://www.espn.com/nfl/game/_/gameId/400874546', 'https://www.espn.com/nfl/game/_/gameId/400874575', 'https://www.espn.com/nfl/game/_/gameId/400874513', 'https://www.espn.com/nfl/game/_/gameId/400874571', 'https://www.espn.com/nfl/game/_/gameId/400874579', 'https://www.espn.com/nfl/game/_/gameId/400874583', 'https://www.espn.com/nfl/game/_/gameId/400874585', 'https://www.espn.com/nfl/game/_/gameId/400874588', 'https://www.espn.com/nfl/game/_/gameId/400951566', 'https://www.espn.com/nfl/game/_/gameId/400951567', 'https://www.espn.com/nfl/game/_/gameId/400951570', 'https://www.espn.com/nfl/game/_/gameId/400951572', 'https://www.espn.com/nfl/game/_/gameId/400951574', 'https://www.espn.com/nfl/game/_/gameId/400951576', 'https://www.espn.com/nfl/game/_/gameId/400951584', 'https://www.espn.com/nfl/game/_/gameId/400951592', 'https://www.espn.com/nfl/game/_/gameId/400951580', 'https://www.espn.com/nfl/game/_/gameId/400951597', 'https://www.espn.com/nfl/game/_/gameId/400951601', 'https://www.espn.com/nfl/game/_/gameId/400951605', 'https://www.espn.com/nfl/game/_/gameId/400951608', 'https://www.espn.com/nfl/game/_/gameId/400951581', 'https://www.espn.com/nfl/game/_/gameId/400951612', 'https://www.espn.com/nfl/game/_/gameId/400951615', 'https://www.espn.com/nfl/game/_/gameId/400951568', 'https://www.espn.com/nfl/game/_/gameId/400951579', 'https://www.espn.com/nfl/game/_/gameId/400951583', 'https://www.espn.com/nfl/game/_/gameId/400951590', 'https://www.espn.com/nfl/game/_/gameId/400951594', 'https://www.espn.com/nfl/game/_/gameId/400951599', 'https://www.espn.com/nfl/game/_/gameId/400951604', 'https://www.espn.com/nfl/game/_/gameId/400951607', 'https://www.espn.com/nfl/game/_/gameId/400951611', 'https://www.espn.com/nfl/game/_/gameId/400951616', 'https://www.espn.com/nfl/game/_/gameId/400951587', 'https://www.espn.com/nfl/game/_/gameId/400951623', 'https://www.espn.com/nfl/game/_/gameId/400951627', 'https://www.espn.com/nfl/game/_/gameId/400951634', 'https://www.espn.com/nfl/game/_/gameId/400951644', 'https://www.espn.com/nfl/game/_/gameId/400951668', 'https://www.espn.com/nfl/game/_/gameId/400951552', 'https://www.espn.com/nfl/game/_/gameId/400951554', 'https://www.espn.com/nfl/game/_/gameId/400951556', 'https://www.espn.com/nfl/game/_/gameId/400951558', 'https://www.espn.com/nfl/game/_/gameId/400951562', 'https://www.espn.com/nfl/game/_/gameId/400951646', 'https://www.espn.com/nfl/game/_/gameId/400951650', 'https://www.espn.com/nfl/game/_/gameId/400951651', 'https://www.espn.com/nfl/game/_/gameId/400951655', 'https://www.espn.com/nfl/game/_/gameId/400951659', 'https://www.espn.com/nfl/game/_/gameId/400951657', 'https://www.espn.com/nfl/game/_/gameId/400951661', 'https://www.espn.com/nfl/game/_/gameId/400951664', 'https://www.espn.com/nfl/game/_/gameId/400951691', 'https://www.espn.com/nfl/game/_/gameId/400951695', 'https://www.espn.com/nfl/game/_/gameId/400951697', 'https://www.espn.com/nfl/game/_/gameId/400951702', 'https://www.espn.com/nfl/game/_/gameId/400951704', 'https://www.espn.com/nfl/game/_/gameId/400951766', 'https://www.espn.com/nfl/game/_/gameId/400951767', 'https://www.espn.com/nfl/game/_/gameId/400951699', 'https://www.espn.com/nfl/game/_/gameId/400951700', 'https://www.espn.com/nfl/game/_/gameId/400951770', 'https://www.espn.com/nfl/game/_/gameId/400951773', 'https://www.espn.com/nfl/game/_/gameId/400951776', 'https://www.espn.com/nfl/game/_/gameId/400951779', 'https://www.espn.com/nfl/game/_/gameId/400951782', 'https://www.espn.com/nfl/game/_/gameId/400951785', 'https://www.espn.com/nfl/game/_/gameId/400951571', 'https://www.espn.com/nfl/game/_/gameId/400951575', 'https://www.espn.com/nfl/game/_/gameId/400951578', 'https://www.espn.com/nfl/game/_/gameId/400951582', 'https://www.espn.com/nfl/game/_/gameId/400951585', 'https://www.espn.com/nfl/game/_/gameId/400951589', 'https://www.espn.com/nfl/game/_/gameId/400951593', 'https://www.espn.com/nfl/game/_/gameId/400951598', 'https://www.espn.com/nfl/game/_/gameId/400951603', 'https://www.espn.com/nfl/game/_/gameId/400951619', 'https://www.espn.com/nfl/game/_/gameId/400951628', 'https://www.espn.com/nfl/game/_/gameId/400951609', 'https://www.espn.com/nfl/game/_/gameId/400951624', 'https://www.espn.com/nfl/game/_/gameId/400951638', 'https://www.espn.com/nfl/game/_/gameId/400951641', 'https://www.espn.com/nfl/game/_/gameId/400951670', 'https://www.espn.com/nfl/game/_/gameId/400951683', 'https://www.espn.com/nfl/game/_/gameId/400951706', 'https://www.espn.com/nfl/game/_/gameId/400951711', 'https://www.espn.com/nfl/game/_/gameId/400951715', 'https://www.espn.com/nfl/game/_/gameId/400951717', 'https://www.espn.com/nfl/game/_/gameId/400951721', 'https://www.espn.com/nfl/game/_/gameId/400951723', 'https://www.espn.com/nfl/game/_/gameId/400951725', 'https://www.espn.com/nfl/game/_/gameId/400951729', 'https://www.espn.com/nfl/game/_/gameId/400951732', 'https://www.espn.com/nfl/game/_/gameId/400951736', 'https://www.espn.com/nfl/game/_/gameId/400951737', 'https://www.espn.com/nfl/game/_/gameId/400951743', 'https://www.espn.com/nfl/game/_/gameId/400951761', 'https://www.espn.com/nfl/game/_/gameId/400951755', 'https://www.espn.com/nfl/game/_/gameId/400951758', 'https://www.espn.com/nfl/game/_/gameId/400951760', 'https://www.espn.com/nfl/game/_/gameId/400951749', 'https://www.espn.com/nfl/game/_/gameId/400951753', 'https://www.espn.com/nfl/game/_/gameId/400951751', 'https://www.espn.com/nfl/game/_/gameId/400951763', 'https://www.espn.com/nfl/game/_/gameId/400951765', 'https://www.espn.com/nfl/game/_/gameId/400951786', 'https://www.espn.com/nfl/game/_/gameId/400951787', 'https://www.espn.com/nfl/game/_/gameId/400951790', 'https://www.espn.com/nfl/game/_/gameId/400951553', 'https://www.espn.com/nfl/game/_/gameId/400951555', 'https://www.espn.com/nfl/game/_/gameId/400951559', 'https://www.espn.com/nfl/game/_/gameId/400951563', 'https://www.espn.com/nfl/game/_/gameId/400951656', 'https://www.espn.com/nfl/game/_/gameId/400951565', 'https://www.espn.com/nfl/game/_/gameId/400951653', 'https://www.espn.com/nfl/game/_/gameId/400951658', 'https://www.espn.com/nfl/game/_/gameId/400951648', 'https://www.espn.com/nfl/game/_/gameId/400951663', 'https://www.espn.com/nfl/game/_/gameId/400951686', 'https://www.espn.com/nfl/game/_/gameId/400951688', 'https://www.espn.com/nfl/game/_/gameId/400951690', 'https://www.espn.com/nfl/game/_/gameId/400951693', 'https://www.espn.com/nfl/game/_/gameId/400951569', 'https://www.espn.com/nfl/game/_/gameId/400951573', 'https://www.espn.com/nfl/game/_/gameId/400951577', 'https://www.espn.com/nfl/game/_/gameId/400951586', 'https://www.espn.com/nfl/game/_/gameId/400951588', 'https://www.espn.com/nfl/game/_/gameId/400951591', 'https://www.espn.com/nfl/game/_/gameId/400951595', 'https://www.espn.com/nfl/game/_/gameId/400951600', 'https://www.espn.com/nfl/game/_/gameId/400951606', 'https://www.espn.com/nfl/game/_/gameId/400951610', 'https://www.espn.com/nfl/game/_/gameId/400951618', 'https://www.espn.com/nfl/game/_/gameId/400951629', 'https://www.espn.com/nfl/game/_/gameId/400951614', 'https://www.espn.com/nfl/game/_/gameId/400951622', 'https://www.espn.com/nfl/game/_/gameId/400951633', 'https://www.espn.com/nfl/game/_/gameId/400951640', 'https://www.espn.com/nfl/game/_/gameId/400951672', 'https://www.espn.com/nfl/game/_/gameId/400951677', 'https://www.espn.com/nfl/game/_/gameId/400951684', 'https://www.espn.com/nfl/game/_/gameId/400951707', 'https://www.espn.com/nfl/game/_/gameId/400951710', 'https://www.espn.com/nfl/game/_/gameId/400951728', 'https://www.espn.com/nfl/game/_/gameId/400951718', 'https://www.espn.com/nfl/game/_/gameId/400951726', 'https://www.espn.com/nfl/game/_/gameId/400951713', 'https://www.espn.com/nfl/game/_/gameId/400951680', 'https://www.espn.com/nfl/game/_/gameId/400951731', 'https://www.espn.com/nfl/game/_/gameId/400951740', 'https://www.espn.com/nfl/game/_/gameId/400951722', 'https://www.espn.com/nfl/game/_/gameId/400951733', 'https://www.espn.com/nfl/game/_/gameId/400951746', 'https://www.espn.com/nfl/game/_/gameId/400951754', 'https://www.espn.com/nfl/game/_/gameId/400951557', 'https://www.espn.com/nfl/game/_/gameId/400951560', 'https://www.espn.com/nfl/game/_/gameId/400951564', 'https://www.espn.com/nfl/game/_/gameId/400951647', 'https://www.espn.com/nfl/game/_/gameId/400951654', 'https://www.espn.com/nfl/game/_/gameId/400951692', 'https://www.espn.com/nfl/game/_/gameId/400951660', 'https://www.espn.com/nfl/game/_/gameId/400951561', 'https://www.espn.com/nfl/game/_/gameId/400951649', 'https://www.espn.com/nfl/game/_/gameId/400951665', 'https://www.espn.com/nfl/game/_/gameId/400951662', 'https://www.espn.com/nfl/game/_/gameId/400951687', 'https://www.espn.com/nfl/game/_/gameId/400951689', 'https://www.espn.com/nfl/game/_/gameId/400951652', 'https://www.espn.com/nfl/game/_/gameId/400951694', 'https://www.espn.com/nfl/game/_/gameId/400951696', 'https://www.espn.com/nfl/game/_/gameId/400951705', 'https://www.espn.com/nfl/game/_/gameId/400951768', 'https://www.espn.com/nfl/game/_/gameId/400951772', 'https://www.espn.com/nfl/game/_/gameId/400951774', 'https://www.espn.com/nfl/game/_/gameId/400951778', 'https://www.espn.com/nfl/game/_/gameId/400951784', 'https://www.espn.com/nfl/game/_/gameId/400951806', 'https://www.espn.com/nfl/game/_/gameId/400951808', 'https://www.espn.com/nfl/game/_/gameId/400951809', 'https://www.espn.com/nfl/game/_/gameId/400951777', 'https://www.espn.com/nfl/game/_/gameId/400951781', 'https://www.espn.com/nfl/game/_/gameId/400951811', 'https://www.espn.com/nfl/game/_/gameId/400951812', 'https://www.espn.com/nfl/game/_/gameId/400951813', 'https://www.espn.com/nfl/game/_/gameId/400951814', 'https://www.espn.com/nfl/game/_/gameId/400951816', 'https://www.espn.com/nfl/game/_/gameId/400951596', 'https://www.espn.com/nfl/game/_/gameId/400951602', 'https://www.espn.com/nfl/game/_/gameId/400951617', 'https://www.espn.com/nfl/game/_/gameId/400951621', 'https://www.espn.com/nfl/game/_/gameId/400951667', 'https://www.espn.com/nfl/game/_/gameId/400951625', 'https://www.espn.com/nfl/game/_/gameId/400951631', 'https://www.espn.com/nfl/game/_/gameId/400951637', 'https://www.espn.com/nfl/game/_/gameId/400951642', 'https://www.espn.com/nfl/game/_/gameId/400951671', 'https://www.espn.com/nfl/game/_/gameId/400951613', 'https://www.espn.com/nfl/game/_/gameId/400951675', 'https://www.espn.com/nfl/game/_/gameId/400951709', 'https://www.espn.com/nfl/game/_/gameId/400951682', 'https://www.espn.com/nfl/game/_/gameId/400951714', 'https://www.espn.com/nfl/game/_/gameId/400951719', 'https://www.espn.com/nfl/game/_/gameId/401030690', 'https://www.espn.com/nfl/game/_/gameId/401030691', 'https://www.espn.com/nfl/game/_/gameId/401030704', 'https://www.espn.com/nfl/game/_/gameId/401030705', 'https://www.espn.com/nfl/game/_/gameId/401030694', 'https://www.espn.com/nfl/game/_/gameId/401030708', 'https://www.espn.com/nfl/game/_/gameId/401030700', 'https://www.espn.com/nfl/game/_/gameId/401030698', 'https://www.espn.com/nfl/game/_/gameId/401030696', 'https://www.espn.com/nfl/game/_/gameId/401030693', 'https://www.espn.com/nfl/game/_/gameId/401030732', 'https://www.espn.com/nfl/game/_/gameId/401030730', 'https://www.espn.com/nfl/game/_/gameId/401030736', 'https://www.espn.com/nfl/game/_/gameId/401030733', 'https://www.espn.com/nfl/game/_/gameId/401030738', 'https://www.espn.com/nfl/game/_/gameId/401030739', 'https://www.espn.com/nfl/game/_/gameId/401030775', 'https://www.espn.com/nfl/game/_/gameId/401030777', 'https://www.espn.com/nfl/game/_/gameId/401030795', 'https://www.espn.com/nfl/game/_/gameId/401030787', 'https://www.espn.com/nfl/game/_/gameId/401030784', 'https://www.espn.com/nfl/game/_/gameId/401030782', 'https://www.espn.com/nfl/game/_/gameId/401030781', 'https://www.espn.com/nfl/game/_/gameId/401030790', 'https://www.espn.com/nfl/game/_/gameId/401030794', 'https://www.espn.com/nfl/game/_/gameId/401030788', 'https://www.espn.com/nfl/game/_/gameId/401030791', 'https://www.espn.com/nfl/game/_/gameId/401030798', 'https://www.espn.com/nfl/game/_/gameId/401030801', 'https://www.espn.com/nfl/game/_/gameId/401030799', 'https://www.espn.com/nfl/game/_/gameId/401030802', 'https://www.espn.com/nfl/game/_/gameId/401030805', 'https://www.espn.com/nfl/game/_/gameId/401030839', 'https://www.espn.com/nfl/game/_/gameId/401030847', 'https://www.espn.com/nfl/game/_/gameId/401030846', 'https://www.espn.com/nfl/game/_/gameId/401030845', 'https://www.espn.com/nfl/game/_/gameId/401030844', 'https://www.espn.com/nfl/game/_/gameId/401030842', 'https://www.espn.com/nfl/game/_/gameId/401030843', 'https://www.espn.com/nfl/game/_/gameId/401030841', 'https://www.espn.com/nfl/game/_/gameId/401030840', 'https://www.espn.com/nfl/game/_/gameId/401030930', 'https://www.espn.com/nfl/game/_/gameId/401030848', 'https://www.espn.com/nfl/game/_/gameId/401030931', 'https://www.espn.com/nfl/game/_/gameId/401030932', 'https://www.espn.com/nfl/game/_/gameId/401030933', 'https://www.espn.com/nfl/game/_/gameId/401030934', 'https://www.espn.com/nfl/game/_/gameId/401030697', 'https://www.espn.com/nfl/game/_/gameId/401030702', 'https://www.espn.com/nfl/game/_/gameId/401030785', 'https://www.espn.com/nfl/game/_/gameId/401030770', 'https://www.espn.com/nfl/game/_/gameId/401030745', 'https://www.espn.com/nfl/game/_/gameId/401030741', 'https://www.espn.com/nfl/game/_/gameId/401030734', 'https://www.espn.com/nfl/game/_/gameId/401030709', 'https://www.espn.com/nfl/game/_/gameId/401030778', 'https://www.espn.com/nfl/game/_/gameId/401030793', 'https://www.espn.com/nfl/game/_/gameId/401030803', 'https://www.espn.com/nfl/game/_/gameId/401030797', 'https://www.espn.com/nfl/game/_/gameId/401030808', 'https://www.espn.com/nfl/game/_/gameId/401030831', 'https://www.espn.com/nfl/game/_/gameId/401030834', 'https://www.espn.com/nfl/game/_/gameId/401030692', 'https://www.espn.com/nfl/game/_/gameId/401030695', 'https://www.espn.com/nfl/game/_/gameId/401030743', 'https://www.espn.com/nfl/game/_/gameId/401030746', 'https://www.espn.com/nfl/game/_/gameId/401030706', 'https://www.espn.com/nfl/game/_/gameId/401030771', 'https://www.espn.com/nfl/game/_/gameId/401030742', 'https://www.espn.com/nfl/game/_/gameId/401030737', 'https://www.espn.com/nfl/game/_/gameId/401030701', 'https://www.espn.com/nfl/game/_/gameId/401030748', 'https://www.espn.com/nfl/game/_/gameId/401030773', 'https://www.espn.com/nfl/game/_/gameId/401030776', 'https://www.espn.com/nfl/game/_/gameId/401030774', 'https://www.espn.com/nfl/game/_/gameId/401030779', 'https://www.espn.com/nfl/game/_/gameId/401030783', 'https://www.espn.com/nfl/game/_/gameId/401030800', 'https://www.espn.com/nfl/game/_/gameId/401030792', 'https://www.espn.com/nfl/game/_/gameId/401030832', 'https://www.espn.com/nfl/game/_/gameId/401030833', 'https://www.espn.com/nfl/game/_/gameId/401030830', 'https://www.espn.com/nfl/game/_/gameId/401030809', 'https://www.espn.com/nfl/game/_/gameId/401030807', 'https://www.espn.com/nfl/game/_/gameId/401030806', 'https://www.espn.com/nfl/game/_/gameId/401030835', 'https://www.espn.com/nfl/game/_/gameId/401030836', 'https://www.espn.com/nfl/game/_/gameId/401030838', 'https://www.espn.com/nfl/game/_/gameId/401030837', 'https://www.espn.com/nfl/game/_/gameId/401030804', 'https://www.espn.com/nfl/game/_/gameId/401030796', 'https://www.espn.com/nfl/game/_/gameId/401030767', 'https://www.espn.com/nfl/game/_/gameId/401030769', 'https://www.espn.com/nfl/game/_/gameId/401030814', 'https://www.espn.com/nfl/game/_/gameId/401030816', 'https://www.espn.com/nfl/game/_/gameId/401030822', 'https://www.espn.com/nfl/game/_/gameId/401030826', 'https://www.espn.com/nfl/game/_/gameId/401030811', 'https://www.espn.com/nfl/game/_/gameId/401030819', 'https://www.espn.com/nfl/game/_/gameId/401030829', 'https://www.espn.com/nfl/game/_/gameId/401030852', 'https://www.espn.com/nfl/game/_/gameId/401030855', 'https://www.espn.com/nfl/game/_/gameId/401030858', 'https://www.espn.com/nfl/game/_/gameId/401030862', 'https://www.espn.com/nfl/game/_/gameId/401030729', 'https://www.espn.com/nfl/game/_/gameId/401030810', 'https://www.espn.com/nfl/game/_/gameId/401030752', 'https://www.espn.com/nfl/game/_/gameId/401030754', 'https://www.espn.com/nfl/game/_/gameId/401030821', 'https://www.espn.com/nfl/game/_/gameId/401030766', 'https://www.espn.com/nfl/game/_/gameId/401030815', 'https://www.espn.com/nfl/game/_/gameId/401030853', 'https://www.espn.com/nfl/game/_/gameId/401030828', 'https://www.espn.com/nfl/game/_/gameId/401030859', 'https://www.espn.com/nfl/game/_/gameId/401030756', 'https://www.espn.com/nfl/game/_/gameId/401030865', 'https://www.espn.com/nfl/game/_/gameId/401030869', 'https://www.espn.com/nfl/game/_/gameId/401030873', 'https://www.espn.com/nfl/game/_/gameId/401030878', 'https://www.espn.com/nfl/game/_/gameId/401030929', 'https://www.espn.com/nfl/game/_/gameId/401030910', 'https://www.espn.com/nfl/game/_/gameId/401030922', 'https://www.espn.com/nfl/game/_/gameId/401030952', 'https://www.espn.com/nfl/game/_/gameId/401030966', 'https://www.espn.com/nfl/game/_/gameId/401030971', 'https://www.espn.com/nfl/game/_/gameId/401030894', 'https://www.espn.com/nfl/game/_/gameId/401030970', 'https://www.espn.com/nfl/game/_/gameId/401030969', 'https://www.espn.com/nfl/game/_/gameId/401030963', 'https://www.espn.com/nfl/game/_/gameId/401030903', 'https://www.espn.com/nfl/game/_/gameId/401030972', 'https://www.espn.com/nfl/game/_/gameId/401030905', 'https://www.espn.com/nfl/game/_/gameId/401030925', 'https://www.espn.com/nfl/game/_/gameId/401030923', 'https://www.espn.com/nfl/game/_/gameId/401030919', 'https://www.espn.com/nfl/game/_/gameId/401030921', 'https://www.espn.com/nfl/game/_/gameId/401030904', 'https://www.espn.com/nfl/game/_/gameId/401030914', 'https://www.espn.com/nfl/game/_/gameId/401030902', 'https://www.espn.com/nfl/game/_/gameId/401030920', 'https://www.espn.com/nfl/game/_/gameId/401030916', 'https://www.espn.com/nfl/game/_/gameId/401030912', 'https://www.espn.com/nfl/game/_/gameId/401030911', 'https://www.espn.com/nfl/game/_/gameId/401030906', 'https://www.espn.com/nfl/game/_/gameId/401030908', 'https://www.espn.com/nfl/game/_/gameId/401030762', 'https://www.espn.com/nfl/game/_/gameId/401030899', 'https://www.espn.com/nfl/game/_/gameId/401030928', 'https://www.espn.com/nfl/game/_/gameId/401030955', 'https://www.espn.com/nfl/game/_/gameId/401030957', 'https://www.espn.com/nfl/game/_/gameId/401030965', 'https://www.espn.com/nfl/game/_/gameId/401030954', 'https://www.espn.com/nfl/game/_/gameId/401030953', 'https://www.espn.com/nfl/game/_/gameId/401030968', 'https://www.espn.com/nfl/game/_/gameId/401030962', 'https://www.espn.com/nfl/game/_/gameId/401030964', 'https://www.espn.com/nfl/game/_/gameId/401030960', 'https://www.espn.com/nfl/game/_/gameId/401030935', 'https://www.espn.com/nfl/game/_/gameId/401030959', 'https://www.espn.com/nfl/game/_/gameId/401030958', 'https://www.espn.com/nfl/game/_/gameId/401030951', 'https://www.espn.com/nfl/game/_/gameId/401030871', 'https://www.espn.com/nfl/game/_/gameId/401030724', 'https://www.espn.com/nfl/game/_/gameId/401030750', 'https://www.espn.com/nfl/game/_/gameId/401030823', 'https://www.espn.com/nfl/game/_/gameId/401030825', 'https://www.espn.com/nfl/game/_/gameId/401030764', 'https://www.espn.com/nfl/game/_/gameId/401030761', 'https://www.espn.com/nfl/game/_/gameId/401030758', 'https://www.espn.com/nfl/game/_/gameId/401030753', 'https://www.espn.com/nfl/game/_/gameId/401030813', 'https://www.espn.com/nfl/game/_/gameId/401030851', 'https://www.espn.com/nfl/game/_/gameId/401030827', 'https://www.espn.com/nfl/game/_/gameId/401030854', 'https://www.espn.com/nfl/game/_/gameId/401030863', 'https://www.espn.com/nfl/game/_/gameId/401030860', 'https://www.espn.com/nfl/game/_/gameId/401030817', 'https://www.espn.com/nfl/game/_/gameId/401030867', 'https://www.espn.com/nfl/game/_/gameId/401030874', 'https://www.espn.com/nfl/game/_/gameId/401030891', 'https://www.espn.com/nfl/game/_/gameId/401030876', 'https://www.espn.com/nfl/game/_/gameId/401030900', 'https://www.espn.com/nfl/game/_/gameId/401030896', 'https://www.espn.com/nfl/game/_/gameId/401030893', 'https://www.espn.com/nfl/game/_/gameId/401030909', 'https://www.espn.com/nfl/game/_/gameId/401030927', 'https://www.espn.com/nfl/game/_/gameId/401030918', 'https://www.espn.com/nfl/game/_/gameId/401030915', 'https://www.espn.com/nfl/game/_/gameId/401030924', 'https://www.espn.com/nfl/game/_/gameId/401030898', 'https://www.espn.com/nfl/game/_/gameId/401030950', 'https://www.espn.com/nfl/game/_/gameId/401030956', 'https://www.espn.com/nfl/game/_/gameId/401030961', 'https://www.espn.com/nfl/game/_/gameId/401030967', 'https://www.espn.com/nfl/game/_/gameId/401030868', 'https://www.espn.com/nfl/game/_/gameId/401030897', 'https://www.espn.com/nfl/game/_/gameId/401030872', 'https://www.espn.com/nfl/game/_/gameId/401030875', 'https://www.espn.com/nfl/game/_/gameId/401030877', 'https://www.espn.com/nfl/game/_/gameId/401030861', 'https://www.espn.com/nfl/game/_/gameId/401030866', 'https://www.espn.com/nfl/game/_/gameId/401030892', 'https://www.espn.com/nfl/game/_/gameId/401030870', 'https://www.espn.com/nfl/game/_/gameId/401030864', 'https://www.espn.com/nfl/game/_/gameId/401030895', 'https://www.espn.com/nfl/game/_/gameId/401030907', 'https://www.espn.com/nfl/game/_/gameId/401030901', 'https://www.espn.com/nfl/game/_/gameId/401030913', 'https://www.espn.com/nfl/game/_/gameId/401030917', 'https://www.espn.com/nfl/game/_/gameId/401030926', 'https://www.espn.com/nfl/game/_/gameId/401127913', 'https://www.espn.com/nfl/game/_/gameId/401127928', 'https://www.espn.com/nfl/game/_/gameId/401127954', 'https://www.espn.com/nfl/game/_/gameId/401127961', 'https://www.espn.com/nfl/game/_/gameId/401127963', 'https://www.espn.com/nfl/game/_/gameId/401127968', 'https://www.espn.com/nfl/game/_/gameId/401127923', 'https://www.espn.com/nfl/game/_/gameId/401127931', 'https://www.espn.com/nfl/game/_/gameId/401127972', 'https://www.espn.com/nfl/game/_/gameId/401127995', 'https://www.espn.com/nfl/game/_/gameId/401128007', 'https://www.espn.com/nfl/game/_/gameId/401127999', 'https://www.espn.com/nfl/game/_/gameId/401128010', 'https://www.espn.com/nfl/game/_/gameId/401127860', 'https://www.espn.com/nfl/game/_/gameId/401128021', 'https://www.espn.com/nfl/game/_/gameId/401128025', 'https://www.espn.com/nfl/game/_/gameId/401128054', 'https://www.espn.com/nfl/game/_/gameId/401128066', 'https://www.espn.com/nfl/game/_/gameId/401128072', 'https://www.espn.com/nfl/game/_/gameId/401128098', 'https://www.espn.com/nfl/game/_/gameId/401128114', 'https://www.espn.com/nfl/game/_/gameId/401127862', 'https://www.espn.com/nfl/game/_/gameId/401128106', 'https://www.espn.com/nfl/game/_/gameId/401128110', 'https://www.espn.com/nfl/game/_/gameId/401128115', 'https://www.espn.com/nfl/game/_/gameId/401128061', 'https://www.espn.com/nfl/game/_/gameId/401128101', 'https://www.espn.com/nfl/game/_/gameId/401128118', 'https://www.espn.com/nfl/game/_/gameId/401128120', 'https://www.espn.com/nfl/game/_/gameId/401128122', 'https://www.espn.com/nfl/game/_/gameId/401128124', 'https://www.espn.com/nfl/game/_/gameId/401128127', 'https://www.espn.com/nfl/game/_/gameId/401127859', 'https://www.espn.com/nfl/game/_/gameId/401127915', 'https://www.espn.com/nfl/game/_/gameId/401127921', 'https://www.espn.com/nfl/game/_/gameId/401127925', 'https://www.espn.com/nfl/game/_/gameId/401127929', 'https://www.espn.com/nfl/game/_/gameId/401127953', 'https://www.espn.com/nfl/game/_/gameId/401127956', 'https://www.espn.com/nfl/game/_/gameId/401127861', 'https://www.espn.com/nfl/game/_/gameId/401127959', 'https://www.espn.com/nfl/game/_/gameId/401127962', 'https://www.espn.com/nfl/game/_/gameId/401127966', 'https://www.espn.com/nfl/game/_/gameId/401127970', 'https://www.espn.com/nfl/game/_/gameId/401127998', 'https://www.espn.com/nfl/game/_/gameId/401127993', 'https://www.espn.com/nfl/game/_/gameId/401128125', 'https://www.espn.com/nfl/game/_/gameId/401128003', 'https://www.espn.com/nfl/game/_/gameId/401127927', 'https://www.espn.com/nfl/game/_/gameId/401127958', 'https://www.espn.com/nfl/game/_/gameId/401128014', 'https://www.espn.com/nfl/game/_/gameId/401128001', 'https://www.espn.com/nfl/game/_/gameId/401127965', 'https://www.espn.com/nfl/game/_/gameId/401127971', 'https://www.espn.com/nfl/game/_/gameId/401128006', 'https://www.espn.com/nfl/game/_/gameId/401128011', 'https://www.espn.com/nfl/game/_/gameId/401127864', 'https://www.espn.com/nfl/game/_/gameId/401127932', 'https://www.espn.com/nfl/game/_/gameId/401127960', 'https://www.espn.com/nfl/game/_/gameId/401128019', 'https://www.espn.com/nfl/game/_/gameId/401128029', 'https://www.espn.com/nfl/game/_/gameId/401128053', 'https://www.espn.com/nfl/game/_/gameId/401128062', 'https://www.espn.com/nfl/game/_/gameId/401127902', 'https://www.espn.com/nfl/game/_/gameId/401127940', 'https://www.espn.com/nfl/game/_/gameId/401127942', 'https://www.espn.com/nfl/game/_/gameId/401127945', 'https://www.espn.com/nfl/game/_/gameId/401127947', 'https://www.espn.com/nfl/game/_/gameId/401127949', 'https://www.espn.com/nfl/game/_/gameId/401127951', 'https://www.espn.com/nfl/game/_/gameId/401127974', 'https://www.espn.com/nfl/game/_/gameId/401127977', 'https://www.espn.com/nfl/game/_/gameId/401127979', 'https://www.espn.com/nfl/game/_/gameId/401127982', 'https://www.espn.com/nfl/game/_/gameId/401127985', 'https://www.espn.com/nfl/game/_/gameId/401127987', 'https://www.espn.com/nfl/game/_/gameId/401127894', 'https://www.espn.com/nfl/game/_/gameId/401127905', 'https://www.espn.com/nfl/game/_/gameId/401128035', 'https://www.espn.com/nfl/game/_/gameId/401128037', 'https://www.espn.com/nfl/game/_/gameId/401128039', 'https://www.espn.com/nfl/game/_/gameId/401128042', 'https://www.espn.com/nfl/game/_/gameId/401128048', 'https://www.espn.com/nfl/game/_/gameId/401128051', 'https://www.espn.com/nfl/game/_/gameId/401127912', 'https://www.espn.com/nfl/game/_/gameId/401128046', 'https://www.espn.com/nfl/game/_/gameId/401128045', 'https://www.espn.com/nfl/game/_/gameId/401128050', 'https://www.espn.com/nfl/game/_/gameId/401127895', 'https://www.espn.com/nfl/game/_/gameId/401128043', 'https://www.espn.com/nfl/game/_/gameId/401128073', 'https://www.espn.com/nfl/game/_/gameId/401128074', 'https://www.espn.com/nfl/game/_/gameId/401127907', 'https://www.espn.com/nfl/game/_/gameId/401127911', 'https://www.espn.com/nfl/game/_/gameId/401127934', 'https://www.espn.com/nfl/game/_/gameId/401127939', 'https://www.espn.com/nfl/game/_/gameId/401127981', 'https://www.espn.com/nfl/game/_/gameId/401127948', 'https://www.espn.com/nfl/game/_/gameId/401127952', 'https://www.espn.com/nfl/game/_/gameId/401127976', 'https://www.espn.com/nfl/game/_/gameId/401127986', 'https://www.espn.com/nfl/game/_/gameId/401127944', 'https://www.espn.com/nfl/game/_/gameId/401127989', 'https://www.espn.com/nfl/game/_/gameId/401128041', 'https://www.espn.com/nfl/game/_/gameId/401127992', 'https://www.espn.com/nfl/game/_/gameId/401128044', 'https://www.espn.com/nfl/game/_/gameId/401128052', 'https://www.espn.com/nfl/game/_/gameId/401128075', 'https://www.espn.com/nfl/game/_/gameId/401128077', 'https://www.espn.com/nfl/game/_/gameId/401128081', 'https://www.espn.com/nfl/game/_/gameId/401128084', 'https://www.espn.com/nfl/game/_/gameId/401128086', 'https://www.espn.com/nfl/game/_/gameId/401128049', 'https://www.espn.com/nfl/game/_/gameId/401128047', 'https://www.espn.com/nfl/game/_/gameId/401128089', 'https://www.espn.com/nfl/game/_/gameId/401128092', 'https://www.espn.com/nfl/game/_/gameId/401127897', 'https://www.espn.com/nfl/game/_/gameId/401128133', 'https://www.espn.com/nfl/game/_/gameId/401128134', 'https://www.espn.com/nfl/game/_/gameId/401128015', 'https://www.espn.com/nfl/game/_/gameId/401128017', 'https://www.espn.com/nfl/game/_/gameId/401128022', 'https://www.espn.com/nfl/game/_/gameId/401128057', 'https://www.espn.com/nfl/game/_/gameId/401128058', 'https://www.espn.com/nfl/game/_/gameId/401128070', 'https://www.espn.com/nfl/game/_/gameId/401128095', 'https://www.espn.com/nfl/game/_/gameId/401128107', 'https://www.espn.com/nfl/game/_/gameId/401128032', 'https://www.espn.com/nfl/game/_/gameId/401128063', 'https://www.espn.com/nfl/game/_/gameId/401128027', 'https://www.espn.com/nfl/game/_/gameId/401128100', 'https://www.espn.com/nfl/game/_/gameId/401128104', 'https://www.espn.com/nfl/game/_/gameId/401128067', 'https://www.espn.com/nfl/game/_/gameId/401127967', 'https://www.espn.com/nfl/game/_/gameId/401128112', 'https://www.espn.com/nfl/game/_/gameId/401127871', 'https://www.espn.com/nfl/game/_/gameId/401127869', 'https://www.espn.com/nfl/game/_/gameId/401127868', 'https://www.espn.com/nfl/game/_/gameId/401127867', 'https://www.espn.com/nfl/game/_/gameId/401127916', 'https://www.espn.com/nfl/game/_/gameId/401127926', 'https://www.espn.com/nfl/game/_/gameId/401127964', 'https://www.espn.com/nfl/game/_/gameId/401127969', 'https://www.espn.com/nfl/game/_/gameId/401127994', 'https://www.espn.com/nfl/game/_/gameId/401127920', 'https://www.espn.com/nfl/game/_/gameId/401127997', 'https://www.espn.com/nfl/game/_/gameId/401128005', 'https://www.espn.com/nfl/game/_/gameId/401127930', 'https://www.espn.com/nfl/game/_/gameId/401128002', 'https://www.espn.com/nfl/game/_/gameId/401128009', 'https://www.espn.com/nfl/game/_/gameId/401128013', 'https://www.espn.com/nfl/game/_/gameId/401127901', 'https://www.espn.com/nfl/game/_/gameId/401127898', 'https://www.espn.com/nfl/game/_/gameId/401127900', 'https://www.espn.com/nfl/game/_/gameId/401127903', 'https://www.espn.com/nfl/game/_/gameId/401127904', 'https://www.espn.com/nfl/game/_/gameId/401127935', 'https://www.espn.com/nfl/game/_/gameId/401127906', 'https://www.espn.com/nfl/game/_/gameId/401127910', 'https://www.espn.com/nfl/game/_/gameId/401127933', 'https://www.espn.com/nfl/game/_/gameId/401127937', 'https://www.espn.com/nfl/game/_/gameId/401127893', 'https://www.espn.com/nfl/game/_/gameId/401127896', 'https://www.espn.com/nfl/game/_/gameId/401127938', 'https://www.espn.com/nfl/game/_/gameId/401127941', 'https://www.espn.com/nfl/game/_/gameId/401127943', 'https://www.espn.com/nfl/game/_/gameId/401127946']
 
 
-def make_data_list():
-    browser = webdriver.Chrome()
-    years = list(range(2002, 2021, 1))
-    weeks = list(range(1, 18))
-    game_list = []
+def make_data_list(weeks: list = None, **options):
+    """
+    Getting the game urls of every regular season week. The scoreboard pages are fetched over http
+    into the game index, and only the weeks missing from the index are fetched.
+    :param weeks: season and week pairs to look up, every regular season week when None
+    :param options: passed on to update_index
+    """
+    return game_urls(update_index(weeks, **options))
 
-    # checking events
-    for year in years:
-        if year == 2020:
-            for week in list(range(1, 10)):
-                url_two = 'https://www.espn.com/nfl/scoreboard/_/year/{}/seasontype/2/week/{}'.format(year, week)
-                browser.get(url_two)
-                event_search = browser.find_elements_by_class_name('mobileScoreboardLink')
-                time.sleep(3)
-                for event in event_search:
-                    game_list.append(event.get_attribute('href'))
-        else:
-            for week in weeks:
-                url_two = 'https://www.espn.com/nfl/scoreboard/_/year/{}/seasontype/2/week/{}'.format(year, week)
-                browser.get(url_two)
-                event_search = browser.find_elements_by_class_name('mobileScoreboardLink')
-                time.sleep(3)
-                for event in event_search:
-                    game_list.append(event.get_attribute('href'))
 
-    print('test = [')
-    for game in game_list:
-        print('{},'.format(game))
-    print(']')
-
-    # closing and quitting the browser
-    browser.close()
-    browser.quit()
-
-    return game_list
-
-
-# game_data_list = make_data_list()
-main_runner(list(test))
+if __name__ == '__main__':
+    main_runner(list(test))
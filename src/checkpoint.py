@@ -0,0 +1,155 @@
+import csv
+import json
+import os
+import time
+
+from pathlib import Path
+
+
+def last_line_end(f, size: int, block_size: int = 64 * 1024) -> int:
+    """
+    Finding the end of the last complete line by reading the file backwards in blocks, so only the tail
+    of the file is read however many games it holds. 0 is returned when there is no complete line.
+    :param f: file opened in binary mode
+    :param size: size of the file
+    :param block_size: number of bytes read at a time
+    """
+    end = size
+    while end > 0:
+        start = max(0, end - block_size)
+        f.seek(start)
+        newline = f.read(end - start).rfind(b'\n')
+        if newline >= 0:
+            return start + newline + 1
+        end = start
+    return 0
+
+
+class GameOutput:
+    """
+    Append only output of the collected games. Every game row is written to the csv as soon as it is
+    collected and the attempt is recorded in a manifest next to it. The gameIds already in the csv are
+    skipped when a run is restarted, so only the games that failed or were never reached are collected again.
+    """
+
+    def __init__(self, output_path, columns: list = None, manifest_path=None, fresh: bool = False):
+        """
+        :param output_path: csv file the game rows are appended to
+        :param columns: fixed columns of the output, an existing output must have the same header
+        :param manifest_path: json lines file recording the status of every attempt
+        :param fresh: removing the rows and manifest of an earlier run instead of carrying on from them
+        """
+        self.output_path = Path(output_path)
+        self.manifest_path = Path(manifest_path) if manifest_path else self.output_path.with_suffix('.manifest.jsonl')
+        self.columns = columns
+        self.header_written = False
+        self.collected = set()
+        if fresh:
+            for path in (self.output_path, self.manifest_path):
+                path.unlink(missing_ok=True)
+        self._load()
+
+    def _load(self):
+        """ Reading back the header and gameIds of an earlier run, dropping a partly written last row. """
+        if not self.output_path.exists() or self.output_path.stat().st_size == 0:
+            return
+
+        with open(self.output_path, newline='') as f:
+            header = next(csv.reader(f), None)
+        # the gameIds are read from the first column, so a csv of another layout is never appended to
+        if header is not None and (header[0] != 'game_id' or header != (self.columns or header)):
+            raise ValueError('{} is not an output of these columns, its header starts with {}'.format(
+                self.output_path, header[:3]))
+
+        # truncating the file to the last complete row in case the last run crashed mid write
+        with open(self.output_path, 'rb+') as f:
+            size = f.seek(0, os.SEEK_END)
+            end = last_line_end(f, size)
+            if end < size:
+                f.truncate(end)
+
+        with open(self.output_path, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            self.columns = header
+            self.header_written = True
+            self.collected = {row[0] for row in reader if row}
+
+    def __contains__(self, game_id: str) -> bool:
+        return str(game_id) in self.collected
+
+    def failed(self) -> set:
+        """ Getting the gameIds whose attempts have all failed so far. """
+        failed = set()
+        if not self.manifest_path.exists():
+            return failed
+        with open(self.manifest_path) as f:
+            for line in f:
+                entry = json.loads(line)
+                if entry['status'] == 'ok':
+                    failed.discard(entry['game_id'])
+                else:
+                    failed.add(entry['game_id'])
+        return failed
+
+    def record(self, game_id: str, status: str, **fields):
+        """
+        Writing the status of an attempt to the manifest.
+        :param game_id: gameId of the attempt
+        :param status: ok, empty or failed
+        :param fields: extra information stored with the attempt
+        """
+        entry = {'game_id': str(game_id), 'status': status, 'time': time.time(), **fields}
+        with open(self.manifest_path, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
+
+    def write(self, game_id: str, record: dict):
+        """
+        Appending a game record to the output. Empty or missing records are only recorded in the manifest.
+        :param game_id: gameId of the game
+        :param record: game record keyed by column name
+        """
+        game_id = str(game_id)
+        if record is None:
+            self.record(game_id, 'failed')
+            return
+        if not record:
+            self.record(game_id, 'empty')
+            return
+
+        record = {'game_id': game_id, **record}
+        if self.columns is None:
+            self.columns = list(record)
+        extra = [c for c in record if c not in self.columns]
+
+        with open(self.output_path, 'a', newline='') as f:
+            writer = csv.writer(f)
+            if not self.header_written:
+                writer.writerow(self.columns)
+                self.header_written = True
+            writer.writerow([record.get(c, '') for c in self.columns])
+            f.flush()
+            os.fsync(f.fileno())
+
+        self.collected.add(game_id)
+        if extra:
+            self.record(game_id, 'ok', dropped_columns=extra)
+        else:
+            self.record(game_id, 'ok')
+
+    def move_to(self, output_path):
+        """
+        Moving the output and its manifest over another output, replacing it in one step.
+        :param output_path: csv file to replace
+        """
+        output_path = Path(output_path)
+        manifest_path = output_path.with_suffix('.manifest.jsonl')
+        self.manifest_path.touch()
+        os.replace(self.manifest_path, manifest_path)
+        if self.output_path.exists():
+            os.replace(self.output_path, output_path)
+        else:
+            output_path.unlink(missing_ok=True)
+        self.output_path, self.manifest_path = output_path, manifest_path
@@ -5,14 +5,34 @@ import os
 import time
 import random
 
+from io import BytesIO
 from pathlib import Path
 from .log_cfb import CFBDataLogger
+from .page_cache import PageCache
+from .checkpoint import GameOutput
+from .matchup_parser import extract_matchup
 
+from functools import partial
 from multiprocessing import Pool
 
 # logger for the program
 cfb_log = CFBDataLogger()
 
+# host of the matchup pages
+ESPN_URL = 'https://www.espn.com'
+
+# stats of the matchup page in the order of the team stats table, followed by the points
+GAME_STATS = [
+    '1st downs', 'passing 1st downs', 'rushing 1st downs', '1st downs from penalties', '3rd down efficiency',
+    '4th down efficiency', 'total plays', 'total yards', 'total drives', 'yards per play', 'passing', 'comp-att',
+    'yards per pass', 'interceptions thrown', 'sacks-yards lost', 'rushing', 'rushing attempts', 'yards per rush',
+    'red zone (made-att)', 'penalties', 'turnovers', 'fumbles lost', 'defensive / special teams tds',
+    'possession', 'points',
+]
+
+# fixed column schema of a game record
+GAME_COLUMNS = ['away_team', 'home_team'] + ['{}_{}'.format(team, stat) for stat in GAME_STATS for team in ('away', 'home')]
+
 
 def team_data(df: pd.DataFrame):
     """
@@ -24,37 +44,63 @@ def team_data(df: pd.DataFrame):
     return teams, points
 
 
-def format_game_data_row(df: pd.DataFrame):
+def create_name(row_name: str, team: str):
+    """ Creating a name from the row name and team name. """
+    return '{}_{}'.format(team, row_name)
+
+
+def format_game_record(teams: list, stat_rows: list) -> dict:
     """
-    Transforming the data frame passed in the function, to a new dataframe containing one row
-    to append to the overall data frame. This will move the data from the rows
-    into columns to represent the different features.
+    Transforming the stat rows of a game into one record of the game. This will move the data from
+    the rows into columns to represent the different features, in the same column names and order
+    as GAME_COLUMNS.
+    :param teams: away and home team
+    :param stat_rows: rows of the stat name, away value and home value, ending with the points
     """
+    away_team, home_team = teams
+    record = {'away_team': away_team, 'home_team': home_team}
+    for row_name, away_value, home_value in stat_rows:
+        record[create_name(row_name.lower(), 'away')] = away_value
+        record[create_name(row_name.lower(), 'home')] = home_value
+    return record
 
-    def create_name(row_name, team):
-        """ Creating a name from the row name and team name. """
-        return '{}_{}'.format(team, row_name)
 
-    # creating columns of the home and away team
-    transformed_df = pd.DataFrame()
+def format_game_data_row(df: pd.DataFrame):
+    """
+    Transforming the data frame passed in the function, to a new dataframe containing one row
+    to append to the overall data frame.
+    """
     _, away_team, home_team = df.columns.tolist()
-    transformed_df['away_team'] = [away_team]
-    transformed_df['home_team'] = [home_team]
+    record = format_game_record([away_team, home_team], df.values.tolist())
+    return pd.DataFrame([record])
 
-    # adding columns to the new dataframe
-    for row in df.index:
-        row_name, away_value, home_value = df.iloc[row].tolist()
-        transformed_df[create_name(row_name.lower(), 'away')] = [away_value]
-        transformed_df[create_name(row_name.lower(), 'home')] = [home_value]
 
-    return transformed_df
+def games_frame(records: list) -> pd.DataFrame:
+    """
+    Building the DataFrame of the games once from the game records.
+    :param records: game records, optionally with a game_id
+    """
+    columns = GAME_COLUMNS
+    if records and 'game_id' in records[0]:
+        columns = ['game_id'] + columns
+    return pd.DataFrame.from_records(records, columns=columns)
 
 
-def make_url(page_number: str):
+def make_url(page_number: str, base_url: str = ESPN_URL):
     """
     Making the url to lookup the data.
+    :param page_number: gameId of the matchup page
+    :param base_url: host serving the matchup pages, swapped out for a local server when testing
+    """
+    return '{}/nfl/matchup?gameId={}'.format(base_url, page_number)
+
+
+def game_id_from_url(game_url: str):
+    """
+    Getting the gameId from the end of a game url.
+    :param game_url: url of the game page
     """
-    return 'https://www.espn.com/nfl/matchup?gameId={}'.format(page_number)
+    return game_url.split('/')[-1]
 
 
 def handle_error(error: str):
@@ -63,7 +109,7 @@ def handle_error(error: str):
     :param error: error message from the error
     """
     cfb_log.info(error)
-    return pd.DataFrame()
+    return {}
 
 
 def get_df(nfl_df_list: list, df_shape: tuple):
@@ -78,25 +124,39 @@ def get_df(nfl_df_list: list, df_shape: tuple):
     if df_shape == (2, 6):
         return pd.DataFrame()
     else:
-        return pd.DataFrame(pd.np.empty((0, 3)))
+        return pd.DataFrame(np.empty((0, 3)))
 
 
-def get_data(url: str):
+@cfb_log.timed('parse')
+def parse_html(html: bytes):
     """
-    Getting the data from the website. The website will be collected as html and then passed into
-    the pandas read_html to get the data tables from the html file.
-    :param url: Website to collect the data from
+    Parsing the html of a matchup page into a game record, an empty record is returned for empty pages.
+    Only the linescore and team stats tables are pulled from the page, pages with an unexpected layout
+    go through read_html instead.
+    :param html: raw html of the matchup page
+    """
+    matchup = extract_matchup(html)
+    if matchup is None:
+        cfb_log.count('read_html_fallbacks')
+        return parse_html_tables(html)
+
+    teams, points, stat_rows = matchup
+    return format_game_record(teams, stat_rows + [['points'] + points])
+
+
+def parse_html_tables(html: bytes):
+    """
+    Parsing the html of a matchup page. The html is passed into the pandas read_html
+    to get the data tables from the page and then formatted into a game record.
+    :param html: raw html of the matchup page
     """
     try:
-        html = requests.get(url).content
-        nfl_df_list = pd.read_html(html)
+        nfl_df_list = pd.read_html(BytesIO(html))
 
         # checking if the first DataFrame from the url is empty
         # if the DataFrame at location 0 is empty return an empty DataFrame
-        if nfl_df_list[0].empty or len(nfl_df_list) < 1:
-            return pd.DataFrame
-    except requests.ConnectionError as e:
-        return handle_error(str(e.with_traceback(e.__traceback__)))
+        if len(nfl_df_list) < 1 or nfl_df_list[0].empty:
+            return {}
     except Exception as e:
         return handle_error(str(e.with_traceback(e.__traceback__)))
 
@@ -112,45 +172,186 @@ def get_data(url: str):
     matchup_df = get_df(nfl_df_list=nfl_df_list, df_shape=(25, 3))
     matchup_df.columns = matchup_columns
 
-    # setting up points information and sending back the new DataFrame
-    point_info = np.array([np.append('points', points)])
-    matchup_df = matchup_df.append(pd.DataFrame(point_info, columns=matchup_columns))
-    matchup_df.index = list(range(len(matchup_df.index)))
+    # setting up points information and sending back the game record
+    point_info = np.append('points', points).tolist()
+    return format_game_record(teams, matchup_df.values.tolist() + [point_info])
 
-    return format_game_data_row(matchup_df)
+
+def fetch_html(url: str):
+    """
+    Getting the html of the website, None is returned when the page could not be collected.
+    :param url: Website to collect the html from
+    """
+    try:
+        with cfb_log.timer('fetch'):
+            html = requests.get(url).content
+        cfb_log.count('bytes_downloaded', len(html))
+        return html
+    except requests.ConnectionError as e:
+        handle_error(str(e.with_traceback(e.__traceback__)))
+    except Exception as e:
+        handle_error(str(e.with_traceback(e.__traceback__)))
+    return None
 
 
-def run(game_url: str):
+def get_data(url: str):
     """
-    Running the thread to call a url site and get the table data from the site.
+    Getting the data from the website. The website will be collected as html and then passed into
+    the parser to get the game record, None is returned when the website could not be collected.
+    :param url: Website to collect the data from
+    """
+    html = fetch_html(url)
+    if html is None:
+        return None
+    return parse_html(html)
+
+
+def run(game_url: str, cache: PageCache = None):
+    """
+    Running the thread to call a url site and get the table data from the site. Pages found in the
+    cache are parsed without calling the site.
     :param game_url: url list to make the url and index
+    :param cache: cache of the raw pages
+    """
+    game_id = game_id_from_url(game_url)
+    html = read_cache(cache, game_id)
+
+    if html is None:
+        url = make_url(game_id)
+        cfb_log.debug('%s', url)
+        html = fetch_html(url)
+        rand_value = random.randrange(1, 4, 1)
+        time.sleep(rand_value)
+        cfb_log.debug('******* %s *******', rand_value)
+        if html is None:
+            return None
+        if cache is not None:
+            cache.put(game_id, html)
+
+    return parse_html(html)
+
+
+def read_cache(cache: PageCache, game_id: str):
+    """
+    Reading the page from the cache and counting the hit or miss, None is returned when the page is not cached.
+    :param cache: cache of the raw pages, None when the run has no cache
+    :param game_id: gameId of the page
+    """
+    if cache is None:
+        return None
+    html = cache.get(game_id)
+    cfb_log.count('cache_misses' if html is None else 'cache_hits')
+    return html
+
+
+def parse_cached_game(game_id: str, cache: PageCache):
+    """
+    Parsing a page straight from the cache and returning it with its gameId and the metrics of the worker.
+    :param game_id: gameId of the cached page
+    :param cache: cache of the raw pages
+    """
+    html = read_cache(cache, game_id)
+    record = parse_html(html) if html is not None else None
+    return game_id, record, cfb_log.snapshot(reset=True)
+
+
+def parse_with_metrics(html: bytes):
+    """
+    Parsing the page in a worker process and returning the game record with the metrics of the worker.
+    :param html: raw html of the matchup page
+    """
+    return parse_html(html), cfb_log.snapshot(reset=True)
+
+
+def run_game(game_url: str, cache: PageCache = None):
+    """
+    Running the game and returning the gameId with the game record so results can arrive in any order,
+    along with the metrics of the worker.
+    :param game_url: url of the game page
+    :param cache: cache of the raw pages
     """
-    url = make_url(game_url.split('/')[-1])
-    cfb_log.info(str(url))
-    new_data = get_data(url)
-    rand_value = random.randrange(1, 4, 1)
-    time.sleep(rand_value)
-    cfb_log.info('******* {} *******'.format(rand_value))
-    return new_data
+    return game_id_from_url(game_url), run(game_url, cache=cache), cfb_log.snapshot(reset=True)
 
 
-def main_runner(game_urls: list):
-    game_dfs = []
+def reset_worker_metrics():
+    """ Clearing the metrics a forked worker process copied from the parent. """
+    cfb_log.reset()
+
+
+def write_result(output: GameOutput, game_id: str, record: dict, metrics: dict = None):
+    """
+    Writing the game record to the output and adding the metrics sent back by the worker.
+    :param output: append only output of the game rows
+    :param game_id: gameId of the game
+    :param record: game record, empty for empty pages and None for failed pages
+    :param metrics: snapshot of the worker metrics
+    """
+    cfb_log.merge(metrics)
+    if record is None:
+        cfb_log.count('failed_pages')
+    elif not record:
+        cfb_log.count('empty_pages')
+    with cfb_log.timer('write'):
+        output.write(game_id, record)
+
+
+def finish_run(output: GameOutput):
+    """ Logging the output and the summary of the run, which is kept next to the output. """
+    cfb_log.info('%s', output.output_path)
+    cfb_log.log_summary(output.output_path.with_suffix('.metrics.json'))
+
+
+def default_output_path() -> Path:
+    """ Path of the output of the run, the final_df.csv in the working directory. """
+    return Path(os.getcwd()) / 'final_df.csv'
+
+
+def default_output():
+    """ Output of the run, the final_df.csv in the working directory. """
+    return GameOutput(default_output_path(), columns=['game_id'] + GAME_COLUMNS)
+
+
+def main_runner(game_urls: list, cache: PageCache = None, output: GameOutput = None):
+    """
+    Collecting the games with a pool of processes. The workers send back plain game records and each
+    one is appended to the output as soon as it finishes, and games already in the output from an
+    earlier run are skipped.
+    :param game_urls: urls of the games to collect
+    :param cache: cache of the raw pages
+    :param output: append only output of the game rows
+    """
+    output = output if output is not None else default_output()
+    cfb_log.reset()
+    pending = [game_url for game_url in game_urls if game_id_from_url(game_url) not in output]
+    cfb_log.info('%s of %s games left to collect', len(pending), len(game_urls))
 
     # making a pool of processes to get the table data for each game
-    with Pool(processes=10) as p:
-
-        for df in p.map(run, game_urls):
-            if not df.empty:
-                game_dfs.append(df)
-
-    # writing the data to a csv file
-    final_df = pd.concat(game_dfs)
-    final_df.index = list(range(final_df.shape[0]))
-    cfb_log.info(str(final_df))
-    file_path = str(Path(os.getcwd()+r'/final_df.csv'))
-    cfb_log.info(file_path)
-    final_df.to_csv(file_path, index=False)
+    with Pool(processes=10, initializer=reset_worker_metrics) as p:
+        for result in p.imap_unordered(partial(run_game, cache=cache), pending):
+            write_result(output, *result)
+
+    finish_run(output)
+
+
+def offline_runner(cache: PageCache = None, output: GameOutput = None):
+    """
+    Rebuilding the final_df.csv from the cached pages alone, no requests are made to the site. Every
+    cached page is parsed again into a fresh output, which replaces the old one only once it is complete.
+    :param cache: cache of the raw pages
+    :param output: output of the game rows to replace
+    """
+    cache = cache if cache is not None else PageCache()
+    output_path = output.output_path if output is not None else default_output_path()
+    columns = output.columns if output is not None else ['game_id'] + GAME_COLUMNS
+    rebuild = GameOutput(output_path.with_suffix('.rebuild' + output_path.suffix), columns=columns, fresh=True)
+    cfb_log.reset()
+
+    with Pool(initializer=reset_worker_metrics) as p:
+        for result in p.imap_unordered(partial(parse_cached_game, cache=cache), cache.game_ids()):
+            write_result(rebuild, *result)
+
+    rebuild.move_to(output_path)
+    finish_run(rebuild)
 
 
 # if __name__ == '__main__':
@@ -0,0 +1,187 @@
+import json
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+
+# per team stats of the cleaned_data the form features are made from, win comes from home_wins
+FORM_STATS = ['total_yards', 'yards_per_play', 'rd_down_efficiency', 'possession', 'turnovers', 'win']
+# columns putting the games in the order they were played
+ORDER_COLUMNS = ['season', 'week', 'game_id']
+SIDES = ('home', 'away')
+
+
+def game_order(data: pd.DataFrame) -> list:
+    """ Getting the columns of the data that order the games, the data needs at least the season and week. """
+    missing = [c for c in ORDER_COLUMNS[:2] if c not in data.columns]
+    if missing:
+        raise ValueError('the data needs the {} columns, add them with game_index.add_game_index'.format(missing))
+    return [c for c in ORDER_COLUMNS if c in data.columns]
+
+
+def team_games(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Turning the games into one row per team and game, in the order the games were played.
+    :param data: cleaned_data with the season and week of each game
+    """
+    order = game_order(data)
+    data = data.sort_values(order, kind='stable')
+    parts = []
+    for side in SIDES:
+        part = data[order].copy()
+        part['row'] = data.index
+        part['side'] = side
+        part['team'] = data[side + '_team']
+        for stat in FORM_STATS[:-1]:
+            part[stat] = data['{}_{}'.format(side, stat)].astype('float64')
+        part['win'] = data['home_wins'] if side == 'home' else 1 - data['home_wins']
+        part['win'] = part['win'].astype('float64')
+        part['seq'] = np.arange(len(data))
+        parts.append(part)
+    return pd.concat(parts, ignore_index=True).sort_values(['seq', 'side'], kind='stable', ignore_index=True)
+
+
+def feature_names(side: str, window: int) -> list:
+    """ Getting the names of the form features of the side. """
+    return ['{}_last{}_{}'.format(side, window, stat) for stat in FORM_STATS] + \
+        ['{}_season_{}'.format(side, stat) for stat in FORM_STATS]
+
+
+def to_games(long: pd.DataFrame, form: pd.DataFrame, keys: list, window: int) -> pd.DataFrame:
+    """
+    Putting the per team form features back on one row per game.
+    :param long: rows of team_games
+    :param form: last game window and season to date features of each row of long
+    :param keys: columns identifying the game
+    :param window: number of games in the rolling window
+    """
+    games = long.loc[long['side'] == SIDES[0], keys + ['row']].set_index('row')
+    for side in SIDES:
+        side_form = form[(long['side'] == side).to_numpy()].set_axis(long.loc[long['side'] == side, 'row'])
+        side_form.columns = feature_names(side, window)
+        games = games.join(side_form)
+    return games.rename_axis(None)
+
+
+class TeamFormStore:
+    """
+    Pre-game team form features: the average of the last window games and the season to date average of
+    each team before every game. The features of the full data are computed with grouped window operations
+    and the store keeps the running state of every team, so adding a week only touches the teams that played.
+    """
+
+    def __init__(self, window: int = 5):
+        """
+        :param window: number of games in the rolling average
+        """
+        self.window = window
+        self.features = pd.DataFrame()
+        self.state = {}
+
+    def build(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Computing the features of every game from scratch and the running state of every team.
+        :param data: cleaned_data with the season and week of each game
+        """
+        long = team_games(data)
+        by_team = long.groupby('team', sort=False)
+        previous = by_team[FORM_STATS].shift(1)
+        last_games = previous.groupby(long['team'], sort=False).rolling(self.window, min_periods=1).mean()
+        last_games = last_games.reset_index(level=0, drop=True).sort_index()
+
+        by_season = long.groupby(['team', 'season'], sort=False)
+        season_sums = by_season[FORM_STATS].cumsum()
+        previous_sums = season_sums.groupby([long['team'], long['season']], sort=False).shift(1)
+        season_games = by_season.cumcount().replace(0, np.nan)
+        season = previous_sums.div(season_games, axis=0)
+
+        form = pd.concat([last_games, season], axis=1, ignore_index=True)
+        keys = game_order(data)
+        self.features = to_games(long, form, keys, self.window).sort_values(keys, kind='stable')
+
+        # running state of every team at the end of the data
+        self.state = {}
+        season_counts = by_season.cumcount() + 1
+        last_rows = by_team.tail(1).index
+        recent = {
+            team: rows[FORM_STATS].to_numpy().tolist() for team, rows in by_team.tail(self.window).groupby('team')
+        }
+        for last in last_rows:
+            team = int(long.at[last, 'team'])
+            self.state[team] = {
+                'recent': recent[long.at[last, 'team']],
+                'season': int(long.at[last, 'season']),
+                'season_sum': season_sums.loc[last].tolist(),
+                'season_count': int(season_counts.at[last]),
+            }
+        return self.features
+
+    def team_form(self, team: int, season: int) -> list:
+        """ Getting the last window and season to date features of the team from its running state. """
+        state = self.state.get(team)
+        nan = [np.nan] * len(FORM_STATS)
+        if state is None:
+            return nan + nan
+        last_games = np.mean(state['recent'], axis=0).tolist() if state['recent'] else nan
+        if state['season'] == season and state['season_count']:
+            season_form = (np.array(state['season_sum']) / state['season_count']).tolist()
+        else:
+            season_form = nan
+        return last_games + season_form
+
+    def add_game(self, team: int, season: int, stats: list):
+        """ Moving the running state of the team past a game. """
+        state = self.state.setdefault(team, {'recent': [], 'season': season, 'season_sum': None, 'season_count': 0})
+        state['recent'] = (state['recent'] + [stats])[-self.window:]
+        if state['season'] != season or state['season_sum'] is None:
+            state['season'], state['season_sum'], state['season_count'] = season, [0.0] * len(stats), 0
+        state['season_sum'] = [total + value for total, value in zip(state['season_sum'], stats)]
+        state['season_count'] += 1
+
+    def update(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Adding new games, usually a new week, from the running state of the teams that played them.
+        The features of the new games are added to the store and returned. Games already in the store
+        are rejected, adding them again would count them twice in the running state.
+        :param data: cleaned_data of the new games with their season and week
+        """
+        keys = game_order(data)
+        if 'game_id' in keys and 'game_id' in self.features.columns:
+            applied = data['game_id'][data['game_id'].isin(self.features['game_id'])]
+            if len(applied):
+                raise ValueError('games {} are already in the store'.format(applied.tolist()[:5]))
+        long = team_games(data)
+        form = []
+        # the rows are in the order the games were played, so each team moves past its games one at a time
+        for row in long[['team', 'season'] + FORM_STATS].itertuples(index=False):
+            team, season = int(row[0]), int(row[1])
+            form.append(self.team_form(team, season))
+            self.add_game(team, season, [float(v) for v in row[2:]])
+
+        form = pd.DataFrame(form, index=long.index)
+        new_features = to_games(long, form, keys, self.window)
+        self.features = pd.concat([self.features, new_features]) if len(self.features) else new_features
+        return new_features
+
+    def save(self, path):
+        """
+        Writing the features and the running state of the teams to a directory.
+        :param path: directory of the store
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        self.features.to_parquet(path / 'features.parquet')
+        (path / 'state.json').write_text(json.dumps({'window': self.window, 'teams': self.state}))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reading a store written with save.
+        :param path: directory of the store
+        """
+        path = Path(path)
+        saved = json.loads((path / 'state.json').read_text())
+        store = cls(window=saved['window'])
+        store.state = {int(team): state for team, state in saved['teams'].items()}
+        store.features = pd.read_parquet(path / 'features.parquet')
+        return store
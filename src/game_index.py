@@ -0,0 +1,183 @@
+import asyncio
+import re
+import aiohttp
+import pandas as pd
+
+from pathlib import Path
+from .async_collector import TokenBucket, fetch_html
+from .data_collector import cfb_log, ESPN_URL
+
+# location of the game index
+DEFAULT_INDEX_PATH = Path(__file__).resolve().parent.parent / 'data' / 'game_index.csv'
+INDEX_COLUMNS = ['season', 'week', 'game_id']
+
+# links to the games on the scoreboard pages
+GAME_ID_PATTERN = re.compile(rb'gameId[/=](\d+)')
+
+
+def make_scoreboard_url(season: int, week: int, base_url: str = ESPN_URL):
+    """
+    Making the url of the regular season scoreboard of the week.
+    :param season: year of the season
+    :param week: week of the regular season
+    :param base_url: host serving the scoreboard pages
+    """
+    return '{}/nfl/scoreboard/_/year/{}/seasontype/2/week/{}'.format(base_url, season, week)
+
+
+def make_game_url(game_id, base_url: str = ESPN_URL):
+    """ Making the url of the game page the collector takes. """
+    return '{}/nfl/game/_/gameId/{}'.format(base_url, game_id)
+
+
+def season_weeks(first_season: int = 2002, last_season: int = 2020, last_season_weeks: int = 9) -> list:
+    """
+    Getting the season and week of every regular season week to look up.
+    :param first_season: first season of the index
+    :param last_season: last season of the index
+    :param last_season_weeks: number of weeks played so far in the last season
+    """
+    weeks = []
+    for season in range(first_season, last_season + 1):
+        last_week = last_season_weeks if season == last_season else 17
+        weeks += [(season, week) for week in range(1, last_week + 1)]
+    return weeks
+
+
+def parse_scoreboard(html: bytes) -> list:
+    """
+    Getting the gameIds linked from a scoreboard page in the order they show up.
+    :param html: raw html of the scoreboard page
+    """
+    return list(dict.fromkeys(m.decode() for m in GAME_ID_PATTERN.findall(html)))
+
+
+def load_index(path=DEFAULT_INDEX_PATH) -> pd.DataFrame:
+    """
+    Loading the game index, an empty index is returned when there is none yet.
+    :param path: csv file of the game index
+    """
+    path = Path(path)
+    if not path.exists():
+        return pd.DataFrame(columns=INDEX_COLUMNS).astype('int64')
+    return pd.read_csv(path, dtype='int64')
+
+
+async def fetch_week(session: aiohttp.ClientSession, season: int, week: int, bucket: TokenBucket,
+                     semaphore: asyncio.Semaphore, base_url: str = ESPN_URL):
+    """
+    Fetching a scoreboard page and returning the index rows of its games, None when the page failed.
+    """
+    url = make_scoreboard_url(season, week, base_url=base_url)
+    async with semaphore:
+        try:
+            html = await fetch_html(session, url, bucket)
+        except Exception as e:
+            cfb_log.info('%s: %s', url, e)
+            return None
+    cfb_log.debug('%s', url)
+    return [(season, week, int(game_id)) for game_id in parse_scoreboard(html)]
+
+
+async def fetch_weeks(weeks: list, rate: float = 4.0, concurrency: int = 8, base_url: str = ESPN_URL) -> list:
+    """
+    Fetching the scoreboard pages of the weeks concurrently over one connection pool.
+    :param weeks: season and week pairs to fetch
+    :param rate: requests per second allowed by the token bucket
+    :param concurrency: largest number of requests in flight
+    :param base_url: host serving the scoreboard pages
+    """
+    bucket = TokenBucket(rate)
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=60)) as session:
+        results = await asyncio.gather(*[
+            fetch_week(session, season, week, bucket, semaphore, base_url=base_url) for season, week in weeks
+        ])
+
+    rows = []
+    for (season, week), week_rows in zip(weeks, results):
+        if not week_rows:
+            cfb_log.info('no games found for season %s week %s', season, week)
+            continue
+        rows += week_rows
+    return rows
+
+
+def update_index(weeks: list = None, path=DEFAULT_INDEX_PATH, refresh: list = (), **options) -> pd.DataFrame:
+    """
+    Adding the weeks missing from the game index. Weeks already in the index are not fetched again unless
+    they are in refresh, and weeks that failed or had no games are left out so the next update retries them.
+    :param weeks: season and week pairs the index should hold, every regular season week when None
+    :param path: csv file of the game index
+    :param refresh: season and week pairs fetched again even when they are in the index
+    :param options: passed on to fetch_weeks
+    """
+    weeks = weeks if weeks is not None else season_weeks()
+    index = load_index(path)
+    refresh = set(refresh)
+    indexed = set(zip(index['season'], index['week'])) - refresh
+    missing = [week for week in weeks if week not in indexed]
+    cfb_log.info('%s of %s weeks missing from the game index', len(missing), len(weeks))
+    if not missing:
+        return index
+
+    rows = asyncio.run(fetch_weeks(missing, **options))
+
+    # the weeks fetched again replace their old rows
+    fetched = {(season, week) for season, week, _ in rows}
+    index = index[[week not in fetched for week in zip(index['season'], index['week'])]]
+    new_rows = pd.DataFrame(rows, columns=INDEX_COLUMNS)
+    index = pd.concat([index, new_rows]) if len(index) else new_rows
+    index = index.drop_duplicates('game_id', keep='last').sort_values(['season', 'week', 'game_id'])
+    index = index.astype('int64').reset_index(drop=True)
+
+    path = Path(path)
+    tmp_path = path.with_suffix('.tmp')
+    index.to_csv(tmp_path, index=False)
+    tmp_path.replace(path)
+    return index
+
+
+def game_urls(index: pd.DataFrame) -> list:
+    """ Making the game urls of the index for the collectors. """
+    return [make_game_url(game_id) for game_id in index['game_id']]
+
+
+def add_game_index(data: pd.DataFrame, index: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    Adding the season and week of each game to data carrying a game_id column.
+    :param data: final_df or cleaned_data DataFrame with a game_id column
+    :param index: game index, loaded from the default location when None
+    """
+    index = index if index is not None else load_index()
+    game_weeks = index.set_index('game_id')[['season', 'week']]
+    game_ids = data['game_id'].astype('int64')
+    data = data.copy()
+    data['season'] = game_ids.map(game_weeks['season'])
+    data['week'] = game_ids.map(game_weeks['week'])
+    return data
+
+
+def index_seasons(data: pd.DataFrame, path=DEFAULT_INDEX_PATH) -> pd.DataFrame:
+    """
+    Adding the season and week of each game from the game index when the data has gameIds but no seasons.
+    Data without gameIds, or without an index to look them up in, is returned as it is with a warning.
+    :param data: final_df or cleaned_data DataFrame
+    :param path: csv file of the game index
+    """
+    if 'season' in data.columns:
+        return data
+    if 'game_id' not in data.columns:
+        cfb_log.warning('the data has no game_id column, it is used without seasons')
+        return data
+    if not Path(path).exists():
+        cfb_log.warning('there is no game index at %s, the data is used without seasons', path)
+        return data
+
+    data = add_game_index(data, load_index(path))
+    missing = data.loc[data['season'].isna(), 'game_id']
+    if len(missing):
+        raise ValueError('{} games are not in the game index {}, update it with update_index: {}'.format(
+            len(missing), path, missing.tolist()[:5]))
+    return data.astype({'season': 'int16', 'week': 'int8'})
@@ -1,6 +1,12 @@
 import sys
 import os
+import json
+import time
 import logging
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
 from pathlib import Path
 
 
@@ -12,14 +18,194 @@ logging.basicConfig(
 log = logging.getLogger()
 
 
+class Histogram:
+    """
+    Latency histogram with fixed bucket bounds in seconds, so histograms from different processes
+    can be added together.
+    """
+
+    bounds = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 30, 60)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def add(self, value: float):
+        """ Adding a value to the bucket it falls in. """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: dict):
+        """ Adding the values of a histogram sent back as a dict. """
+        self.counts = [a + b for a, b in zip(self.counts, other['counts'])]
+        self.total += other['total']
+        for key, pick in (('min', min), ('max', max)):
+            if other[key] is not None:
+                value = getattr(self, key)
+                setattr(self, key, other[key] if value is None else pick(value, other[key]))
+
+    def quantile(self, q: float) -> float:
+        """ Estimating the quantile as the upper bound of the bucket holding it. """
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds + (self.max,), self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {'counts': list(self.counts), 'total': self.total, 'min': self.min, 'max': self.max}
+
+    def summary(self) -> dict:
+        count = self.count
+        return {
+            'count': count,
+            'total_s': round(self.total, 6),
+            'mean_s': round(self.total / count, 6) if count else None,
+            'min_s': self.min,
+            'p50_s': self.quantile(0.5) if count else None,
+            'p90_s': self.quantile(0.9) if count else None,
+            'p99_s': self.quantile(0.99) if count else None,
+            'max_s': self.max,
+        }
+
+
 class CFBDataLogger:
+    """
+    Logger of the program and the metrics of a run: stage timings kept as latency histograms and
+    counters such as bytes downloaded, cache hits and retries. Worker processes send their metrics back
+    with snapshot and the parent adds them with merge, so the summary covers the whole run.
+    """
 
     def __init__(self):
         self.log = log
+        self.counters = Counter()
+        self.histograms = {}
+        self.started = time.time()
 
-    def info(self, msg: str):
+    def info(self, msg: str, *args):
         """
         Logging the message for the logger.
-        :param msg: message to deliver to the logger
+        :param msg: message to deliver to the logger, formatted with the args only when it is emitted
+        """
+        self.log.info(msg, *args)
+
+    def warning(self, msg: str, *args):
+        """
+        Logging a problem that the run carries on past.
+        :param msg: message to deliver to the logger, formatted with the args only when it is emitted
+        """
+        self.log.warning(msg, *args)
+
+    def debug(self, msg: str, *args):
+        """
+        Logging a per page message, these are dropped cheaply at the default level.
+        :param msg: message to deliver to the logger, formatted with the args only when it is emitted
+        """
+        self.log.debug(msg, *args)
+
+    def count(self, name: str, value: int = 1):
+        """
+        Adding to a counter.
+        :param name: name of the counter
+        :param value: amount to add
+        """
+        self.counters[name] += value
+
+    def observe(self, name: str, seconds: float):
+        """
+        Adding a duration to the histogram of the stage.
+        :param name: name of the stage
+        :param seconds: duration of the stage
+        """
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.add(seconds)
+
+    @contextmanager
+    def timer(self, name: str):
+        """
+        Timing the block into the histogram of the stage.
+        :param name: name of the stage
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def timed(self, name: str):
+        """
+        Decorator timing every call of the function into the histogram of the stage.
+        :param name: name of the stage
+        """
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def reset(self):
+        """ Clearing the metrics at the start of a run and in worker processes holding a copy of the parent metrics. """
+        self.counters = Counter()
+        self.histograms = {}
+        self.started = time.time()
+
+    def snapshot(self, reset: bool = False) -> dict:
+        """
+        Getting the metrics as a plain dict that can be sent between processes.
+        :param reset: clearing the metrics after taking them, so a worker only sends each value once
+        """
+        metrics = {
+            'counters': dict(self.counters),
+            'histograms': {name: h.to_dict() for name, h in self.histograms.items()},
+        }
+        if reset:
+            self.reset()
+        return metrics
+
+    def merge(self, metrics: dict):
+        """
+        Adding the metrics of a snapshot, usually sent back from a worker process.
+        :param metrics: snapshot of another logger
+        """
+        if not metrics:
+            return
+        self.counters.update(metrics['counters'])
+        for name, values in metrics['histograms'].items():
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.merge(values)
+
+    def summary(self) -> dict:
+        """ Getting the summary of the run. """
+        return {
+            'wall_s': round(time.time() - self.started, 3),
+            'counters': dict(sorted(self.counters.items())),
+            'stages': {name: h.summary() for name, h in sorted(self.histograms.items())},
+        }
+
+    def log_summary(self, path=None) -> dict:
+        """
+        Logging the summary of the run as JSON and writing it to the path when one is given.
+        :param path: JSON file to write the summary to
         """
-        self.log.info(msg)
+        summary = self.summary()
+        text = json.dumps(summary, indent=2)
+        self.info('run summary\n%s', text)
+        if path is not None:
+            Path(path).write_text(text)
+        return summary
@@ -0,0 +1,85 @@
+from lxml import etree
+from lxml import html as lxml_html
+
+# shapes of the tables read from the matchup page, matching the shapes pandas read_html gives them
+LINESCORE_SHAPE = (2, 6)
+TEAM_STATS_SHAPE = (25, 3)
+
+
+def cell_text(cell) -> str:
+    """ Getting the text of a cell with the whitespace collapsed. """
+    return ' '.join(cell.text_content().split())
+
+
+def table_cells(table, body_lengths: tuple = None):
+    """
+    Getting the body rows of a table as lists of cells, skipping the header rows the same way
+    read_html does. None is returned for tables using col or row spans.
+    :param table: table element of the page
+    :param body_lengths: numbers of body rows worth reading, other tables with a thead are skipped early
+    """
+    rows = table.xpath('./thead/tr|./tbody/tr|./tr|./tfoot/tr')
+    header_rows = sum(1 for row in rows if row.getparent().tag == 'thead')
+    has_thead = header_rows > 0
+    if has_thead and body_lengths is not None and len(rows) - header_rows not in body_lengths:
+        return []
+    body = []
+
+    for row in rows:
+        cells = row.xpath('./th|./td')
+        if any(cell.get('colspan', '1') != '1' or cell.get('rowspan', '1') != '1' for cell in cells):
+            return None
+        if has_thead:
+            if row.getparent().tag == 'thead':
+                continue
+        elif not body and cells and all(cell.tag == 'th' for cell in cells):
+            continue
+        body.append(cells)
+
+    return body
+
+
+def table_shape(body: list) -> tuple:
+    """ Getting the shape of the table body, None when the rows have a different number of cells. """
+    widths = {len(cells) for cells in body}
+    if len(widths) > 1:
+        return None
+    return len(body), widths.pop() if widths else 0
+
+
+def extract_matchup(html: bytes):
+    """
+    Pulling the linescore and team stats tables straight out of the matchup page without building a
+    DataFrame for every table. The teams, points and team stat rows are returned as lists, or None when
+    the layout of the page is not the expected one and the read_html path has to be used instead.
+    :param html: raw html of the matchup page
+    """
+    try:
+        tree = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+    linescore, team_stats = None, None
+    body_lengths = (LINESCORE_SHAPE[0], TEAM_STATS_SHAPE[0])
+    for i, table in enumerate(tree.iter('table')):
+        body = table_cells(table, body_lengths if i > 0 else None)
+        if i == 0 and not body:
+            # an empty first table means an empty page, leaving it to read_html
+            return None
+        if body is None:
+            continue
+        shape = table_shape(body)
+        if linescore is None and shape == LINESCORE_SHAPE:
+            linescore = body
+        elif team_stats is None and shape == TEAM_STATS_SHAPE:
+            team_stats = body
+        if linescore is not None and team_stats is not None:
+            break
+
+    if linescore is None or team_stats is None:
+        return None
+
+    teams = [cell_text(cells[0]) for cells in linescore]
+    points = [cell_text(cells[-1]) for cells in linescore]
+    stat_rows = [[cell_text(cell) for cell in cells] for cells in team_stats]
+    return teams, points, stat_rows
@@ -0,0 +1,144 @@
+import json
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+from .app_data import load_cleaned
+from .data_collector import cfb_log
+from .storage import DATA_DIR, ID_DTYPES
+
+# directory of the model ready arrays
+MODEL_DATA_DIR = DATA_DIR / 'model_data'
+# column the models predict
+LABEL_COLUMN = 'home_wins'
+# columns identifying the game, kept out of the features
+ID_COLUMNS = list(ID_DTYPES)
+
+
+def feature_columns(data: pd.DataFrame) -> list:
+    """ Getting the columns of the cleaned_data used as features, everything but the ids and the label. """
+    return [c for c in data.columns if c not in ID_COLUMNS and c != LABEL_COLUMN]
+
+
+def convert(data: pd.DataFrame, path=MODEL_DATA_DIR) -> dict:
+    """
+    Converting the cleaned data once into .npy arrays that are memory mapped when loaded: a float32
+    feature matrix with one row per game, the int8 labels and the seasons when the data has them.
+    The metadata is written last, so a conversion that did not finish is never loaded.
+    :param data: cleaned_data DataFrame, as given by app_data.load_cleaned
+    :param path: directory to write the arrays and metadata to
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    columns = feature_columns(data)
+
+    # filling the memory mapped file a column at a time so the float32 matrix is the only copy made
+    features = np.lib.format.open_memmap(path / 'features.npy', mode='w+', dtype=np.float32,
+                                         shape=(len(data), len(columns)))
+    for i, col in enumerate(columns):
+        features[:, i] = data[col].to_numpy(dtype=np.float32)
+    features.flush()
+    del features
+
+    np.save(path / 'labels.npy', data[LABEL_COLUMN].to_numpy(dtype=np.int8))
+    has_seasons = 'season' in data.columns
+    if has_seasons:
+        np.save(path / 'seasons.npy', data['season'].to_numpy(dtype=np.int16))
+    else:
+        (path / 'seasons.npy').unlink(missing_ok=True)
+
+    metadata = {
+        'rows': len(data),
+        'features': columns,
+        'label': LABEL_COLUMN,
+        'feature_dtype': 'float32',
+        'label_dtype': 'int8',
+        'seasons': sorted(int(s) for s in data['season'].unique()) if has_seasons else None,
+    }
+    (path / 'metadata.json').write_text(json.dumps(metadata, indent=2))
+    return metadata
+
+
+class ModelData:
+    """
+    Model ready view of the cleaned data. The arrays are memory mapped read only, so loading is
+    near instant and experiments running at the same time share the same pages of the page cache.
+    Mini-batches are gathered straight from the mapped arrays and handed to torch or tensorflow
+    without another copy.
+    """
+
+    def __init__(self, path=MODEL_DATA_DIR):
+        """
+        :param path: directory written by convert
+        """
+        path = Path(path)
+        metadata_path = path / 'metadata.json'
+        if not metadata_path.exists():
+            raise FileNotFoundError('no model data in {}, write it with model_data.convert'.format(path))
+        self.metadata = json.loads(metadata_path.read_text())
+        self.features = np.load(path / 'features.npy', mmap_mode='r')
+        self.labels = np.load(path / 'labels.npy', mmap_mode='r')
+        self.seasons = np.load(path / 'seasons.npy', mmap_mode='r') if self.metadata['seasons'] else None
+
+    @property
+    def columns(self) -> list:
+        return self.metadata['features']
+
+    def __len__(self) -> int:
+        return self.metadata['rows']
+
+    def split(self, validation_seasons: list) -> tuple:
+        """
+        Splitting the games by season, so no game of a validation season is trained on.
+        :param validation_seasons: seasons held out for validation
+        """
+        if self.seasons is None:
+            raise ValueError('the model data has no seasons to split by, convert cleaned data with a game_id '
+                             'column and a game index, see app_data.load_cleaned')
+        validation = np.isin(self.seasons, list(validation_seasons))
+        return np.flatnonzero(~validation), np.flatnonzero(validation)
+
+    def batches(self, indices: np.ndarray = None, batch_size: int = 256, shuffle: bool = True, seed: int = None):
+        """
+        Yielding mini-batches of features and labels as numpy arrays.
+        :param indices: rows to batch, every row when None
+        :param batch_size: number of rows in each batch
+        :param shuffle: shuffling the rows on every pass
+        :param seed: seed of the shuffle
+        """
+        indices = np.arange(len(self)) if indices is None else np.asarray(indices)
+        if shuffle:
+            indices = np.random.default_rng(seed).permutation(indices)
+        for start in range(0, len(indices), batch_size):
+            # sorting the rows of the batch reads the mapped file in order, the order inside a batch does not matter
+            rows = np.sort(indices[start:start + batch_size])
+            yield self.features[rows], self.labels[rows]
+
+    def torch_batches(self, indices: np.ndarray = None, batch_size: int = 256, shuffle: bool = True,
+                      seed: int = None):
+        """ Yielding the mini-batches as torch tensors sharing the memory of the numpy batches. """
+        import torch
+
+        for features, labels in self.batches(indices, batch_size, shuffle, seed):
+            yield torch.from_numpy(features), torch.from_numpy(labels)
+
+    def tf_dataset(self, indices: np.ndarray = None, batch_size: int = 256, shuffle: bool = True,
+                   seed: int = None):
+        """ Getting a tf.data.Dataset of the mini-batches, reshuffled on every pass over it. """
+        import tensorflow as tf
+
+        # a new seed for every pass, drawn from the seed so the passes can be repeated
+        seeds = np.random.default_rng(seed)
+        signature = (
+            tf.TensorSpec(shape=(None, len(self.columns)), dtype=tf.float32),
+            tf.TensorSpec(shape=(None,), dtype=tf.int8),
+        )
+        return tf.data.Dataset.from_generator(
+            lambda: self.batches(indices, batch_size, shuffle, int(seeds.integers(2 ** 32))),
+            output_signature=signature,
+        ).prefetch(tf.data.AUTOTUNE)
+
+
+if __name__ == '__main__':
+    metadata = convert(load_cleaned())
+    cfb_log.info('%s games with %s features in %s', metadata['rows'], len(metadata['features']), MODEL_DATA_DIR)
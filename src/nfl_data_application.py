@@ -1,6 +1,38 @@
+import sys
+import time
 import streamlit as st
 
+from pathlib import Path
+
+# the app is run with streamlit as a script, the repository root is added so the src package can be imported
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.app_data import AppData, load_cleaned
+
+
+@st.cache_resource
+def get_app_data() -> AppData:
+    """ Loading the cleaned data and building the indexes and aggregate tables once per process. """
+    return AppData(load_cleaned())
+
+
 st.write(" ## Apps baby! ")
-x = st.slider('Select a value')
-st.write('You have chosen', x)
-st.spinner('In progress...')
+with st.spinner('In progress...'):
+    app_data = get_app_data()
+
+teams = st.multiselect('Teams', app_data.teams)
+seasons = None
+if app_data.has_seasons:
+    seasons = st.slider('Seasons', min(app_data.seasons), max(app_data.seasons),
+                        (min(app_data.seasons), max(app_data.seasons)))
+yards = st.slider('Combined total yards', int(app_data.total_yards.min()), int(app_data.total_yards.max()),
+                  (int(app_data.total_yards.min()), int(app_data.total_yards.max())))
+
+start = time.perf_counter()
+games = app_data.games(teams=teams, seasons=seasons, total_yards=yards)
+summary = app_data.team_summary(teams=teams, seasons=seasons)
+elapsed = time.perf_counter() - start
+
+st.write('{} games, home team won {:.1%}'.format(len(games), games['home_wins'].mean() if len(games) else 0))
+st.dataframe(summary)
+st.dataframe(games.head(500))
+st.caption('answered in {:.1f} ms'.format(elapsed * 1000))
@@ -1,117 +1,310 @@
 import re
+import os
+import json
+import argparse
 import pandas as pd
 import numpy as np
-from functools import wraps
+from collections import deque
+from contextlib import nullcontext
+from multiprocessing import Pool
+from pathlib import Path
 
+# characters removed from the column names and the columns dropped from the raw data
+COLUMN_REGEX = '[()-_/:]'
+DROP_COLS = ['nnamed']
+# teams that moved, numbered the same as the team they were before
+TEAM_ALIASES = {'LAR': 'STL', 'LAC': 'SD'}
 
-def high_order_data_transform(func):
-    @wraps(func)
-    def wrapper(*args, data: pd.DataFrame):
-        new_data = data.copy()
-        results = func(*args, data=new_data)
-        return results
-    return wrapper
 
+def on_uniques(values: pd.Series, func) -> pd.Series:
+    """
+    Applying the vectorized function to the unique values of the Series only and spreading the results
+    back over the rows. The box score strings repeat a lot, so this is far less work than every row.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    results = func(pd.Series(uniques)).to_numpy()
+    return pd.Series(results[codes], index=values.index, name=values.name)
 
-def string_splitter(text: str, comp: str, location: int) -> str:
-    """ Function to split the string. """
-    if text == comp:
-        return '0'
-    return text.split('-')[location]
 
+def split_dashed(values: pd.Series) -> pd.DataFrame:
+    """ Splitting the dashed strings of the Series into a first and second column of strings. """
+    return values.astype(str).str.split('-', n=1, expand=True).reindex(columns=[0, 1])
 
-@high_order_data_transform
-def add_dashed_cols(col: str, data: pd.DataFrame) -> pd.DataFrame:
-    """ Function to return a DataFrame and get the new columns. """
-    new_col_names = [col+'first_number', col+'second_number']
 
-    temp_data = data[col].to_numpy(dtype=str)
-    first_entry = np.vectorize(string_splitter)(temp_data, 0)
-    second_entry = np.vectorize(string_splitter)(temp_data, 1)
+def clean_column_name(name: str, regex_str: str = COLUMN_REGEX) -> str:
+    """ Removing certain characters from the column name and joining the words with underscores. """
+    return '_'.join(re.sub(regex_str, ' ', name).split())
 
-    data[new_col_names[0]] = first_entry
-    data[new_col_names[1]] = second_entry
 
-    return data.drop([col], axis=1)
+def dashed_cols(data: pd.DataFrame) -> list:
+    """ Getting the columns of the dashed format from the first row of the DataFrame. """
+    first_row = data.iloc[0]
+    return [c for c in data.columns if '-' in str(first_row[c])]
 
 
-@high_order_data_transform
-def rename_cols(regex_str: str, data: pd.DataFrame) -> pd.DataFrame:
-    """ Removing certain characters from the column names. """
-    data.columns = ['_'.join(re.sub(regex_str, ' ', name).split()) for name in data.columns]
-    return data
-
+def divide_split(values: pd.Series) -> pd.Series:
+    """ Splitting the values of the Series and dividing the numbers, missing numbers and zero attempts give 0. """
+    parts = split_dashed(values)
+    zero = (parts[0] == 'nan') | (parts[1] == 'nan') | (parts[1] == '0')
+    x = parts[0].where(~zero, '0').astype(float)
+    y = parts[1].where(~zero, '1').astype(float)
+    return (x / y).where(~zero, 0.0)
 
-@high_order_data_transform
-def drop_funcs(cols: list, data: pd.DataFrame) -> pd.DataFrame:
-    """ Function to drop columns and na rows. """
-    data.drop(cols, axis=1, inplace=True)
-    data.dropna(inplace=True)
-    return data
 
+def divide_dashed(col_value: pd.Series) -> pd.Series:
+    """ Splitting every value of the Series and dividing the numbers. """
+    return on_uniques(col_value, divide_split)
 
-def contains_dash(col: str, data: pd.DataFrame) -> bool:
-    """ Checking if the column is of the dashed format. """
-    return '-' in str(data.at[1, col])
-
-
-def split_and_divide(value: str) -> float:
-    """ Splitting the value and then returning the divided numbers. """
-    value = value.split('-')
-    if 'nan' in value or value[1] == '0':
-        return float(0.0)
-    x, y = value
-    return float(x) / float(y)
 
+def make_dashed_cols(data: pd.DataFrame, cols: list = None) -> pd.DataFrame:
+    """ Dividing the numbers of each column that contains dashes, in place. """
+    cols = cols if cols is not None else dashed_cols(data)
+    for col in cols:
+        data[col] = divide_dashed(data[col])
+    return data
 
-def make_percentage(col_value) -> float:
-    """ Taking a value from the series and returning the percentage from the string. """
-    return col_value.map(split_and_divide)
 
+def split_times(possession_times: pd.Series) -> pd.Series:
+    """ Returning the total int time of the possession strings in the Series. """
+    parts = possession_times.astype(str).str.split(':', n=1, expand=True)
+    return parts[0].astype('int64') * 60 + parts[1].astype('int64')
 
-def make_dashed_cols(data: pd.DataFrame) -> pd.DataFrame:
-    """ Mapping over each column that contains dashes and creating new columns of the separate values. """
-    cols = [c for c in data.columns if contains_dash(str(c), data)]
-    data[cols] = data[cols].apply(make_percentage)
-    return data
 
+def total_times(possession_times: pd.Series) -> pd.Series:
+    """ Returning the total int time of every possession string in the Series. """
+    return on_uniques(possession_times, split_times)
 
-def total_time(possession_time: str) -> int:
-    """ Taking the datetime string and returning the total int time of the team possession. """
-    minutes, seconds = possession_time.split(':')
-    return int(minutes) * 60 + int(seconds)
 
-def apply_col_funcs(base_list: list, data: pd.DataFrame, funcs: list) -> pd.DataFrame:
-    """ Mapping a function over the desired columns and transforming the data. """
-    new_data = data.copy()
-    for i, col in enumerate(base_list):
-        new_data[col] = new_data[col].map(funcs[int(i/2)])
-    return new_data
+def encode_teams(teams: pd.Series, team_dictionary: dict) -> pd.Series:
+    """ Encoding the team names of the Series with the team dictionary. """
+    codes = teams.map(team_dictionary)
+    if codes.isna().any():
+        raise KeyError(sorted(set(teams[codes.isna()])))
+    return codes.astype('int64')
 
 
-def create_labels(cols: list, data: pd.DataFrame) -> pd.DataFrame:
+def create_labels(cols: list, data: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
     """ Creating the labels for the DataFrame and data. """
-    new_data = data.copy()
-    new_data['home_wins'] = data[cols[0]].ge(data[cols[1]]).map(lambda x: 1 if x else 0)
-    return new_data.drop(cols, axis=1)
+    new_data = data if inplace else data.copy()
+    new_data['home_wins'] = new_data[cols[0]].ge(new_data[cols[1]]).astype('int64')
+    new_data.drop(cols, axis=1, inplace=True)
+    return new_data
 
 
-if __name__ == '__main__':
-    data = pd.read_csv('../data/final_df.csv')
-    data = rename_cols('[()-_/:]', data=data)
-    data = drop_funcs(['nnamed'], data=data)
-    data = make_dashed_cols(data)
+def add_team_codes(team_codes: dict, teams: list) -> dict:
+    """
+    Numbering the new teams after the ones already in the team codes, in the order they first show up.
+    Codes already given out never change, and the moved teams share the number of their old team when
+    the old team has one.
+    :param team_codes: codes and next free number of the teams, from load_team_codes
+    :param teams: teams in the order they show up in the data
+    """
+    codes = dict(team_codes['codes'])
+    next_code = team_codes['next_code']
+    for team in teams:
+        if team not in codes:
+            codes[team] = next_code
+            next_code += 1
+    for team, old_team in TEAM_ALIASES.items():
+        if old_team in codes:
+            codes[team] = codes[old_team]
+    return {'codes': codes, 'next_code': next_code}
+
+
+def load_team_codes(path) -> dict:
+    """ Loading the persistent team codes, no teams are numbered yet when the file does not exist. """
+    path = Path(path)
+    if not path.exists():
+        return {'codes': {}, 'next_code': 0}
+    return json.loads(path.read_text())
+
+
+def stored_team_dictionary(teams: list, path) -> dict:
+    """
+    Getting the team dictionary from the persistent team codes, numbering and storing any new teams.
+    :param teams: teams in the order they show up in the data
+    :param path: json file of the team codes
+    """
+    path = Path(path)
+    team_codes = add_team_codes(load_team_codes(path), teams)
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(team_codes, indent=2, sort_keys=True))
+    tmp_path.replace(path)
+    return team_codes['codes']
+
+
+def make_team_dictionary(data: pd.DataFrame) -> dict:
+    """ Numbering the teams in the order they first show up, the moved teams share their old number. """
+    return add_team_codes({'codes': {}, 'next_code': 0}, list(data['away_team'].unique()))['codes']
+
+
+def clean_data(data: pd.DataFrame, team_dictionary: dict = None, inplace: bool = False,
+               logger=None, cols: list = None) -> pd.DataFrame:
+    """
+    Cleaning the raw game data in a single pass. Every step changes the same DataFrame, so apart from the
+    copy made when inplace is False the data is never duplicated.
+    :param data: raw data read from the final_df.csv
+    :param team_dictionary: numbers of the teams, made from the data when not given
+    :param inplace: cleaning the passed DataFrame instead of a copy of it
+    :param logger: CFBDataLogger timing each step of the cleaning
+    :param cols: dashed columns, found from the first row when not given
+    """
+    def timer(step: str):
+        return stage_timer(logger, step)
+
+    if not inplace:
+        with timer('copy'):
+            data = data.copy()
+
+    with timer('drop'):
+        drop_raw_cols(data)
+    with timer('dashed'):
+        make_dashed_cols(data, cols=cols if cols is not None else dashed_cols(data))
+
+    if team_dictionary is None:
+        team_dictionary = make_team_dictionary(data)
+    with timer('possession'):
+        for col in ['home_possession', 'away_possession']:
+            data[col] = total_times(data[col])
+    with timer('teams'):
+        for col in ['home_team', 'away_team']:
+            data[col] = encode_teams(data[col], team_dictionary)
+
+    with timer('labels'):
+        return create_labels(['home_points', 'away_points'], data, inplace=True)
+
+
+def stage_timer(logger, step: str):
+    """ Timing a step of the cleaning into the logger, nothing is timed without a logger. """
+    return logger.timer('clean.' + step) if logger is not None else nullcontext()
+
+
+def drop_raw_cols(data: pd.DataFrame) -> pd.DataFrame:
+    """ Renaming the raw columns and dropping the unneeded columns and incomplete rows, in place. """
+    data.columns = [clean_column_name(name) for name in data.columns]
+    data.drop([c for c in DROP_COLS if c in data.columns], axis=1, inplace=True)
+    data.dropna(inplace=True)
+    return data
 
-    team_dictionary = {team: i for i, team in enumerate(data['away_team'].unique())}
-    team_dictionary['LAR'] = team_dictionary['STL']
-    team_dictionary['LAC'] = team_dictionary['SD']
 
-    data = apply_col_funcs(
-        base_list=[h + '_possession' if i < 2 else h + '_team' for i, h in enumerate(['home', 'away', 'home', 'away'])],
-        data=data,
-        funcs=[total_time, lambda x: team_dictionary[x]]
-    )
-    data = create_labels(['home_points', 'away_points'], data)
+def widest_dtype(first, second):
+    """ Getting the dtype a full read gives a column whose chunks were read as the two dtypes. """
+    if first is None:
+        return second
+    if not (pd.api.types.is_numeric_dtype(first) and pd.api.types.is_numeric_dtype(second)):
+        return str
+    return np.promote_types(first, second)
+
+
+def scan_raw(path, chunksize: int):
+    """
+    Reading the raw file once in chunks for the dtypes a full read would give each column, the teams
+    in the order they show up and the dashed columns.
+    :param path: csv file of the raw data
+    :param chunksize: number of rows in each chunk
+    """
+    dtypes, teams, cols = {}, {}, None
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        for col, dtype in chunk.dtypes.items():
+            dtypes[col] = widest_dtype(dtypes.get(col), dtype)
+        chunk = drop_raw_cols(chunk)
+        teams.update(dict.fromkeys(chunk['away_team'].unique()))
+        if cols is None and len(chunk):
+            cols = dashed_cols(chunk)
+    return dtypes, list(teams), cols
+
+
+def clean_chunk(chunk: pd.DataFrame, team_dictionary: dict, cols: list, logger=None) -> tuple:
+    """
+    Cleaning a chunk in a worker process and returning its csv rows with the metrics of the worker.
+    :param logger: copy of the CFBDataLogger of the run, sent back as a snapshot
+    """
+    if logger is None:
+        return clean_data(chunk, team_dictionary=team_dictionary, inplace=True, cols=cols).to_csv(index=False), None
+    logger.reset()
+    with logger.timer('clean.chunk'):
+        data = clean_data(chunk, team_dictionary=team_dictionary, inplace=True, logger=logger, cols=cols)
+        text = data.to_csv(index=False)
+    logger.count('rows_cleaned', len(data))
+    return text, logger.snapshot()
+
+
+def clean_file(raw_path, cleaned_path, team_codes_path, chunksize: int = None, processes: int = None,
+               logger=None):
+    """
+    Cleaning the raw file into the cleaned file. With a chunksize the raw file is streamed in chunks that
+    are cleaned across a pool of processes and written in order, so the output is the same as cleaning
+    the whole file at once without holding it in memory.
+    :param raw_path: csv file of the raw data
+    :param cleaned_path: csv file to write the cleaned data to
+    :param team_codes_path: json file of the persistent team codes
+    :param chunksize: number of rows in each chunk, the whole file is cleaned at once when None
+    :param processes: number of processes cleaning chunks
+    :param logger: CFBDataLogger of the run, its summary is written next to the cleaned file
+    """
+    if logger is not None:
+        logger.reset()
+
+    if chunksize is None:
+        with stage_timer(logger, 'read'):
+            data = pd.read_csv(raw_path)
+        drop_raw_cols(data)
+        team_dictionary = stored_team_dictionary(list(data['away_team'].unique()), team_codes_path)
+        clean_data(data, team_dictionary=team_dictionary, inplace=True, logger=logger)
+        with stage_timer(logger, 'write'):
+            data.to_csv(cleaned_path, index=False)
+        if logger is not None:
+            logger.count('rows_cleaned', len(data))
+            logger.log_summary(Path(cleaned_path).with_suffix('.metrics.json'))
+        return
+
+    with stage_timer(logger, 'scan'):
+        dtypes, teams, cols = scan_raw(raw_path, chunksize)
+    team_dictionary = stored_team_dictionary(teams, team_codes_path)
+    processes = processes or os.cpu_count()
+
+    with Pool(processes) as pool, open(cleaned_path, 'w', newline='') as f:
+        pending = deque()
+        header = True
+
+        def write_next():
+            nonlocal header
+            text, metrics = pending.popleft().get()
+            if logger is not None:
+                logger.merge(metrics)
+            with stage_timer(logger, 'write'):
+                # every chunk comes back with the header, only the first one is kept
+                f.write(text if header else text.split('\n', 1)[1])
+            header = False
+
+        chunks = pd.read_csv(raw_path, chunksize=chunksize, dtype=dtypes)
+        while True:
+            with stage_timer(logger, 'read'):
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+            if logger is not None:
+                logger.count('chunks')
+            pending.append(pool.apply_async(clean_chunk, (chunk, team_dictionary, cols, logger)))
+            # bounding the chunks in flight so the file is never all in memory
+            if len(pending) >= 2 * processes:
+                write_next()
+        while pending:
+            write_next()
+
+    if logger is not None:
+        logger.log_summary(Path(cleaned_path).with_suffix('.metrics.json'))
 
-    data.to_csv('../data/cleaned_data.csv', index=False)
 
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Cleaning the raw game data.')
+    parser.add_argument('--raw', default='../data/final_df.csv')
+    parser.add_argument('--output', default='../data/cleaned_data.csv')
+    parser.add_argument('--team-codes', default='../data/team_codes.json')
+    parser.add_argument('--chunksize', type=int, default=None, help='rows per chunk, streams the raw file')
+    parser.add_argument('--processes', type=int, default=None)
+    args = parser.parse_args()
+
+    from log_cfb import CFBDataLogger
+    clean_file(args.raw, args.output, args.team_codes, chunksize=args.chunksize, processes=args.processes,
+               logger=CFBDataLogger())
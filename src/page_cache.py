@@ -0,0 +1,101 @@
+import gzip
+import os
+
+from pathlib import Path
+
+# default location of the cached matchup pages
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / 'data' / 'page_cache'
+
+
+class PageCache:
+    """
+    On disk cache of the raw matchup page html keyed by gameId. Each page is stored gzip compressed
+    in its own file and the least recently used pages are evicted once the cache grows past the size cap.
+    """
+
+    suffix = '.html.gz'
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes: int = 2 * 1024 ** 3):
+        """
+        :param cache_dir: directory holding the cached pages
+        :param max_bytes: size cap of the compressed pages on disk
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # running size of the cached pages, the directory is only scanned again when it passes the cap
+        self.total_bytes = sum(size for _, size, _ in self.entries())
+
+    def path(self, game_id: str) -> Path:
+        """ Path of the cached page for the gameId. """
+        return self.cache_dir / '{}{}'.format(game_id, self.suffix)
+
+    def __contains__(self, game_id: str) -> bool:
+        return self.path(game_id).exists()
+
+    def get(self, game_id: str):
+        """
+        Getting the html of the page from the cache, None is returned when the page is not cached.
+        Reading a page marks it as recently used.
+        :param game_id: gameId of the page
+        """
+        path = self.path(game_id)
+        try:
+            with gzip.open(path, 'rb') as f:
+                html = f.read()
+        except (FileNotFoundError, OSError, EOFError):
+            return None
+        os.utime(path)
+        return html
+
+    def put(self, game_id: str, html: bytes):
+        """
+        Storing the html of the page. The file is written under a temporary name and then moved into
+        place so a crashed or concurrent writer never leaves a partial page behind.
+        :param game_id: gameId of the page
+        :param html: raw html of the page
+        """
+        path = self.path(game_id)
+        tmp_path = path.with_name('{}.{}.tmp'.format(path.name, os.getpid()))
+        with gzip.open(tmp_path, 'wb', compresslevel=6) as f:
+            f.write(html)
+        try:
+            self.total_bytes -= path.stat().st_size
+        except FileNotFoundError:
+            pass
+        self.total_bytes += tmp_path.stat().st_size
+        os.replace(tmp_path, path)
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+
+    def game_ids(self) -> list:
+        """ Getting the gameIds of all the cached pages. """
+        return sorted(p.name[:-len(self.suffix)] for p in self.cache_dir.glob('*' + self.suffix))
+
+    def entries(self) -> list:
+        """ Getting the last use time, size and path of every cached page. """
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(self.suffix):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def evict(self):
+        """
+        Removing the least recently used pages until the cache is under the size cap. The directory is
+        scanned again here, so pages written by other processes sharing the cache are counted as well.
+        """
+        entries = self.entries()
+        self.total_bytes = sum(size for _, size, _ in entries)
+        if self.total_bytes <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            self.total_bytes -= size
+            if self.total_bytes <= self.max_bytes:
+                break
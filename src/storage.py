@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+from .game_index import index_seasons, DEFAULT_INDEX_PATH
+from .nfl_data_clean import clean_column_name
+
+# stats kept as strings of two numbers in the raw data and divided into ratios when cleaned
+DASHED_STATS = {
+    'rd_down_efficiency', 'th_down_efficiency', 'comp_att', 'sacks_yards_lost', 'red_zone_made_att', 'penalties',
+}
+# stats that are averages rather than counts
+AVERAGE_STATS = {'yards_per_play', 'yards_per_pass', 'yards_per_rush'}
+# location of the datasets
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+# columns identifying the game
+ID_DTYPES = {'game_id': 'int64', 'season': 'int16', 'week': 'int8'}
+
+
+def stat_name(column: str) -> str:
+    """ Getting the stat of a column by removing the away or home prefix from the cleaned column name. """
+    name = clean_column_name(column)
+    for prefix in ('away_', 'home_'):
+        if name.startswith(prefix):
+            return name[len(prefix):]
+    return name
+
+
+def raw_dtype(column: str) -> str:
+    """ Getting the dtype of a column of the final_df data. """
+    stat = stat_name(column)
+    if column in ID_DTYPES:
+        return ID_DTYPES[column]
+    if stat == 'team':
+        return 'category'
+    if stat in DASHED_STATS or stat == 'possession':
+        return 'string'
+    if stat in AVERAGE_STATS:
+        return 'float32'
+    return 'Int16'
+
+
+def cleaned_dtype(column: str) -> str:
+    """ Getting the dtype of a column of the cleaned_data. """
+    stat = stat_name(column)
+    if column in ID_DTYPES:
+        return ID_DTYPES[column]
+    if column == 'home_wins':
+        return 'int8'
+    if stat == 'team':
+        # the teams are already encoded as numbers in the cleaned_data, with room for the college teams
+        return 'int16'
+    if stat in DASHED_STATS or stat in AVERAGE_STATS:
+        return 'float32'
+    return 'int16'
+
+
+DTYPES = {'raw': raw_dtype, 'cleaned': cleaned_dtype}
+
+
+def typed_frame(data: pd.DataFrame, kind: str = 'cleaned') -> pd.DataFrame:
+    """
+    Casting the columns of the DataFrame to the explicit schema of the dataset.
+    :param data: final_df or cleaned_data DataFrame
+    :param kind: raw for the final_df data, cleaned for the cleaned_data
+    """
+    # the index column written by older runs is left out
+    dtypes = {c: DTYPES[kind](c) for c in data.columns if c != 'Unnamed: 0'}
+    for col, dtype in dtypes.items():
+        if not dtype.lower().startswith('int'):
+            continue
+        if pd.api.types.is_float_dtype(data[col]) and not (data[col].dropna() % 1 == 0).all():
+            raise ValueError('{} has values that are not whole numbers'.format(col))
+        # casting wraps values outside the range of the dtype around silently
+        limits = np.iinfo(dtype.lower())
+        if len(data[col].dropna()) and (data[col].min() < limits.min or data[col].max() > limits.max):
+            raise ValueError('{} has values outside the range of {}'.format(col, dtype))
+    return data[list(dtypes)].astype(dtypes)
+
+
+def write_dataset(data: pd.DataFrame, path, kind: str = 'cleaned', partition_by_season: bool = True):
+    """
+    Writing the dataset as parquet with its explicit schema. Data with a season column is written as one
+    partition per season so single seasons can be loaded without reading the rest.
+    :param data: final_df or cleaned_data DataFrame
+    :param path: parquet file or, when partitioned, directory of the dataset
+    :param kind: raw for the final_df data, cleaned for the cleaned_data
+    :param partition_by_season: partitioning the data by the season column when there is one
+    """
+    data = typed_frame(data, kind)
+    partition_cols = ['season'] if partition_by_season and 'season' in data.columns else None
+    data.to_parquet(Path(path), engine='pyarrow', index=False, partition_cols=partition_cols)
+
+
+def read_dataset(path, columns: list = None, seasons: list = None) -> pd.DataFrame:
+    """
+    Reading the dataset back with its schema, only the columns and seasons asked for are loaded.
+    :param path: parquet file or directory of the dataset
+    :param columns: columns to load, all columns when None
+    :param seasons: seasons to load from a season partitioned dataset, all seasons when None
+    """
+    filters = [('season', 'in', list(seasons))] if seasons is not None else None
+    data = pd.read_parquet(Path(path), engine='pyarrow', columns=columns, filters=filters)
+    if 'season' in data.columns and isinstance(data['season'].dtype, pd.CategoricalDtype):
+        # partition values come back as categories
+        data['season'] = data['season'].astype('int16')
+    return data
+
+
+def convert_csv(csv_path, path, kind: str = 'cleaned', index_path=DEFAULT_INDEX_PATH):
+    """
+    Converting one of the csv datasets to parquet, with the seasons of the games from the game index so
+    the parquet is partitioned by season.
+    :param csv_path: csv file of the dataset
+    :param path: parquet file or directory to write
+    :param kind: raw for the final_df data, cleaned for the cleaned_data
+    :param index_path: csv file of the game index
+    """
+    write_dataset(index_seasons(pd.read_csv(csv_path), index_path), path, kind=kind)
+
+
+if __name__ == '__main__':
+    convert_csv(DATA_DIR / 'final_df.csv', DATA_DIR / 'final_df.parquet', kind='raw')
+    convert_csv(DATA_DIR / 'cleaned_data.csv', DATA_DIR / 'cleaned_data.parquet', kind='cleaned')
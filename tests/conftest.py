@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+
+
+@pytest.fixture(scope='session')
+def games() -> pd.DataFrame:
+    """
+    The cleaned_data with synthetic gameIds, seasons and weeks: 16 games a week and 16 weeks a season.
+    Shared by the tests, which copy it before changing it.
+    """
+    data = pd.read_csv(DATA_DIR / 'cleaned_data.csv')
+    data.insert(0, 'game_id', np.arange(len(data)) + 400000000)
+    data['season'] = 2002 + np.arange(len(data)) // 256
+    data['week'] = 1 + np.arange(len(data)) % 256 // 16
+    return data
@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+
+from pathlib import Path
+from src.app_data import AppData, load_cleaned
+
+INDEX_COLUMNS = ['season', 'week', 'game_id']
+
+
+@pytest.fixture
+def data_dir(tmp_path, games) -> Path:
+    """ Directory with the cleaned_data under synthetic gameIds and a game index of them. """
+    games.drop(columns=['season', 'week']).to_csv(tmp_path / 'cleaned_data.csv', index=False)
+    games[INDEX_COLUMNS].to_csv(tmp_path / 'game_index.csv', index=False)
+    return tmp_path
+
+
+def test_seasons_are_joined_from_the_game_index(data_dir):
+    data = load_cleaned(data_dir, index_path=data_dir / 'game_index.csv')
+    app_data = AppData(data)
+
+    assert app_data.has_seasons
+    assert app_data.seasons == list(range(2002, 2008))
+    assert set(app_data.team_season_table['season']) == set(app_data.seasons)
+    games = app_data.games(seasons=(2003, 2003))
+    assert len(games) == 256 and (games['season'] == 2003).all()
+
+
+def test_games_missing_from_the_index_raise(data_dir):
+    index = pd.read_csv(data_dir / 'game_index.csv')
+    index.iloc[:-1].to_csv(data_dir / 'game_index.csv', index=False)
+
+    with pytest.raises(ValueError, match='not in the game index'):
+        load_cleaned(data_dir, index_path=data_dir / 'game_index.csv')
+
+
+def test_data_without_game_ids_loads_without_seasons(data_dir):
+    data = pd.read_csv(data_dir / 'cleaned_data.csv')
+    data.drop(columns='game_id').to_csv(data_dir / 'cleaned_data.csv', index=False)
+
+    app_data = AppData(load_cleaned(data_dir, index_path=data_dir / 'game_index.csv'))
+    assert not app_data.has_seasons and app_data.team_season_table is None
+    assert len(app_data.games(teams=app_data.teams[:1], seasons=(2003, 2003))) > 0
+
+
+def test_data_without_an_index_loads_without_seasons(data_dir):
+    data = load_cleaned(data_dir, index_path=data_dir / 'missing_index.csv')
+    assert 'game_id' in data.columns and 'season' not in data.columns
+
+
+def test_repo_data_loads():
+    assert len(AppData(load_cleaned()).teams) > 0
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from benchmarks.fixtures import matchup_page
+from src.async_collector import collect_games
+from src.checkpoint import GameOutput
+from src.data_collector import GAME_COLUMNS, cfb_log
+
+
+class StandInServer:
+    """ Local stand-in for ESPN serving the synthetic matchup pages, with scripted errors per gameId. """
+
+    def __init__(self, server_errors: dict = None, missing: set = ()):
+        """
+        :param server_errors: number of 503 answers given for a gameId before its page is served
+        :param missing: gameIds answered with a 404
+        """
+        self.server_errors = dict(server_errors or {})
+        self.missing = set(missing)
+        self.requests = []
+
+    async def matchup(self, request: web.Request) -> web.Response:
+        game_id = request.query['gameId']
+        self.requests.append((time.monotonic(), game_id))
+        if game_id in self.missing:
+            return web.Response(status=404)
+        if self.server_errors.get(game_id):
+            self.server_errors[game_id] -= 1
+            return web.Response(status=503)
+        return web.Response(body=matchup_page(int(game_id)), content_type='text/html')
+
+    def requested(self, game_id: str) -> int:
+        return sum(1 for _, requested_id in self.requests if requested_id == game_id)
+
+
+def collect(stand_in: StandInServer, game_ids: list, output: GameOutput, **options):
+    """ Collecting the games from the stand-in server. """
+    async def run():
+        app = web.Application()
+        app.router.add_get('/nfl/matchup', stand_in.matchup)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            game_urls = ['/nfl/game/_/gameId/{}'.format(game_id) for game_id in game_ids]
+            await collect_games(game_urls, output, base_url=str(server.make_url('')).rstrip('/'),
+                                backoff=0.01, parse_workers=1, **options)
+        finally:
+            await server.close()
+
+    cfb_log.reset()
+    asyncio.run(run())
+
+
+def manifest_status(output: GameOutput) -> dict:
+    with open(output.manifest_path) as f:
+        return {entry['game_id']: entry['status'] for entry in map(json.loads, f)}
+
+
+def test_server_errors_are_retried(tmp_path):
+    stand_in = StandInServer(server_errors={'2': 2})
+    output = GameOutput(tmp_path / 'final_df.csv', columns=['game_id'] + GAME_COLUMNS)
+    collect(stand_in, ['1', '2'], output, rate=100)
+
+    assert stand_in.requested('2') == 3
+    assert '2' in output
+    assert cfb_log.counters['retries'] == 2
+    assert manifest_status(output) == {'1': 'ok', '2': 'ok'}
+
+
+def test_missing_page_is_recorded_as_failed(tmp_path):
+    stand_in = StandInServer(missing={'3'})
+    output = GameOutput(tmp_path / 'final_df.csv', columns=['game_id'] + GAME_COLUMNS)
+    collect(stand_in, ['1', '3'], output, rate=100)
+
+    # a 404 is not retried
+    assert stand_in.requested('3') == 1
+    assert '3' not in output
+    assert output.failed() == {'3'}
+
+
+def test_requests_are_rate_limited(tmp_path):
+    stand_in = StandInServer()
+    output = GameOutput(tmp_path / 'final_df.csv', columns=['game_id'] + GAME_COLUMNS)
+    rate = 20
+    collect(stand_in, [str(i) for i in range(8)], output, rate=rate, concurrency=8)
+
+    times = sorted(t for t, _ in stand_in.requests)
+    assert len(times) == 8
+    # the bucket holds a single token, so the requests are spaced at least 1 / rate apart
+    assert times[-1] - times[0] >= 0.9 * (len(times) - 1) / rate
+
+
+def test_restart_skips_collected_games(tmp_path):
+    stand_in = StandInServer(missing={'3'})
+    output = GameOutput(tmp_path / 'final_df.csv', columns=['game_id'] + GAME_COLUMNS)
+    collect(stand_in, ['1', '2', '3'], output, rate=100)
+
+    stand_in.missing.clear()
+    restarted = GameOutput(tmp_path / 'final_df.csv', columns=['game_id'] + GAME_COLUMNS)
+    collect(stand_in, ['1', '2', '3', '4'], restarted, rate=100)
+
+    assert [stand_in.requested(game_id) for game_id in ['1', '2', '3', '4']] == [1, 1, 2, 1]
+    assert restarted.collected == {'1', '2', '3', '4'}
+    with open(restarted.output_path) as f:
+        assert len(f.readlines()) == 5
@@ -0,0 +1,29 @@
+import pytest
+
+from io import BytesIO
+from src.checkpoint import GameOutput, last_line_end
+
+
+@pytest.mark.parametrize('data', [b'', b'abc', b'a\n', b'a\nbc', b'header\n' + b'x' * 50 + b'\n' + b'y' * 30])
+def test_last_line_end_matches_a_full_read(data):
+    assert last_line_end(BytesIO(data), len(data), block_size=4) == data.rfind(b'\n') + 1
+
+
+def test_partly_written_row_is_dropped(tmp_path):
+    output = GameOutput(tmp_path / 'final_df.csv', columns=['game_id', 'a'])
+    for game_id in range(100):
+        output.write(str(game_id), {'a': 'x' * 1000})
+    with open(output.output_path, 'a') as f:
+        f.write('100,xxx')
+
+    restarted = GameOutput(tmp_path / 'final_df.csv', columns=['game_id', 'a'])
+    assert restarted.collected == {str(game_id) for game_id in range(100)}
+    assert output.output_path.read_bytes().endswith(b'x\r\n')
+
+
+def test_other_layouts_are_not_appended_to(tmp_path):
+    (tmp_path / 'final_df.csv').write_text(',away_team,home_team\n0,DAL,NYG\n')
+
+    with pytest.raises(ValueError):
+        GameOutput(tmp_path / 'final_df.csv', columns=['game_id', 'away_team', 'home_team'])
+    assert (tmp_path / 'final_df.csv').read_text() == ',away_team,home_team\n0,DAL,NYG\n'
@@ -0,0 +1,27 @@
+import pandas as pd
+import pytest
+
+from src.feature_store import TeamFormStore
+
+
+def test_updates_match_full_build(games):
+    full = TeamFormStore(window=5).build(games)
+
+    weeks = [week for _, week in games.groupby(['season', 'week'], sort=True)]
+    store = TeamFormStore(window=5)
+    store.build(weeks[0])
+    for week in weeks[1:]:
+        store.update(week)
+
+    assert len(store.features) == len(full)
+    pd.testing.assert_frame_equal(store.features.loc[full.index], full)
+
+
+def test_update_rejects_applied_games(games):
+    store = TeamFormStore(window=5)
+    store.build(games[games['season'] == 2002])
+    state = repr(store.state)
+
+    with pytest.raises(ValueError):
+        store.update(games[games['season'] <= 2003])
+    assert repr(store.state) == state
@@ -0,0 +1,89 @@
+import re
+import threading
+import pytest
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.game_index import load_index, update_index
+
+SCOREBOARD_PATH = re.compile(r'/nfl/scoreboard/_/year/(\d+)/seasontype/2/week/(\d+)')
+
+
+class Scoreboards:
+    """ Stand-in scoreboard pages: the gameIds of each week, weeks left out answer with a 404. """
+
+    def __init__(self, games: dict):
+        self.games = games
+        self.requested = []
+
+    def page(self, season: int, week: int):
+        self.requested.append((season, week))
+        if (season, week) not in self.games:
+            return None
+        links = ''.join('<a href="/nfl/game/_/gameId/{}">game</a>'.format(g) for g in self.games[season, week])
+        return '<html><body>{}</body></html>'.format(links).encode()
+
+
+@pytest.fixture
+def scoreboards():
+    """ Serving the scoreboards from a local server in a thread, update_index runs its own event loop. """
+    scoreboards = Scoreboards({(2019, 1): [1, 2], (2019, 2): [3, 4], (2019, 3): []})
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            season, week = map(int, SCOREBOARD_PATH.match(self.path).groups())
+            body = scoreboards.page(season, week)
+            self.send_response(404 if body is None else 200)
+            self.end_headers()
+            self.wfile.write(body or b'')
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    scoreboards.base_url = 'http://127.0.0.1:{}'.format(server.server_address[1])
+    yield scoreboards
+    server.shutdown()
+
+
+def update(scoreboards: Scoreboards, path, weeks: list, **options):
+    return update_index(weeks, path=path, base_url=scoreboards.base_url, rate=100, **options)
+
+
+def test_only_missing_weeks_are_fetched(scoreboards, tmp_path):
+    path = tmp_path / 'game_index.csv'
+    update(scoreboards, path, [(2019, 1)])
+    scoreboards.requested.clear()
+
+    index = update(scoreboards, path, [(2019, 1), (2019, 2)])
+
+    assert scoreboards.requested == [(2019, 2)]
+    assert index['game_id'].tolist() == [1, 2, 3, 4]
+    assert load_index(path).equals(index)
+
+
+def test_failed_and_empty_weeks_are_retried(scoreboards, tmp_path):
+    path = tmp_path / 'game_index.csv'
+    weeks = [(2019, 1), (2019, 3), (2019, 4)]
+    index = update(scoreboards, path, weeks)
+    assert set(zip(index['season'], index['week'])) == {(2019, 1)}
+
+    scoreboards.requested.clear()
+    scoreboards.games[2019, 4] = [7]
+    index = update(scoreboards, path, weeks)
+
+    assert sorted(scoreboards.requested) == [(2019, 3), (2019, 4)]
+    assert index['game_id'].tolist() == [1, 2, 7]
+
+
+def test_refreshed_weeks_replace_their_rows(scoreboards, tmp_path):
+    path = tmp_path / 'game_index.csv'
+    update(scoreboards, path, [(2019, 1), (2019, 2)])
+
+    scoreboards.requested.clear()
+    scoreboards.games[2019, 1] = [1, 5]
+    index = update(scoreboards, path, [(2019, 1), (2019, 2)], refresh=[(2019, 1)])
+
+    assert scoreboards.requested == [(2019, 1)]
+    assert index['game_id'].tolist() == [1, 5, 3, 4]
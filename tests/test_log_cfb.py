@@ -0,0 +1,51 @@
+from src.log_cfb import CFBDataLogger, Histogram
+
+
+def worker_snapshot(counters: dict, seconds: list) -> dict:
+    """ Metrics a worker process sends back after timing the parse stage. """
+    worker = CFBDataLogger()
+    for name, value in counters.items():
+        worker.count(name, value)
+    for value in seconds:
+        worker.observe('parse', value)
+    return worker.snapshot(reset=True)
+
+
+def test_snapshots_of_workers_add_up():
+    first = worker_snapshot({'cache_hits': 3, 'bytes_downloaded': 100}, [0.003, 0.004, 0.03])
+    second = worker_snapshot({'cache_hits': 1, 'retries': 2}, [0.0005] * 6 + [0.4])
+
+    parent = CFBDataLogger()
+    parent.merge(first)
+    parent.merge(second)
+    parent.merge(None)
+
+    assert parent.counters == {'cache_hits': 4, 'bytes_downloaded': 100, 'retries': 2}
+    parse = parent.histograms['parse']
+    assert parse.count == 10
+    assert parse.min == 0.0005 and parse.max == 0.4
+    assert abs(parse.total - (0.037 + 0.003 + 0.4)) < 1e-9
+    # six of the ten values are in the first bucket and the largest is in the 0.5 second bucket
+    assert parse.quantile(0.5) == 0.001
+    assert parse.quantile(0.7) == 0.005
+    assert parse.quantile(1.0) == 0.4
+
+
+def test_snapshot_reset_sends_each_value_once():
+    worker = CFBDataLogger()
+    worker.count('retries')
+    worker.observe('fetch', 0.1)
+
+    assert worker.snapshot(reset=True)['counters'] == {'retries': 1}
+    assert worker.snapshot() == {'counters': {}, 'histograms': {}}
+
+
+def test_merging_into_an_empty_histogram_keeps_the_values():
+    histogram = Histogram()
+    other = Histogram()
+    for value in (0.02, 2.5, 70):
+        other.add(value)
+
+    histogram.merge(other.to_dict())
+    assert histogram.to_dict() == other.to_dict()
+    assert histogram.summary()['p99_s'] == 70
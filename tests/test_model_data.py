@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from src.model_data import ModelData, convert, ID_COLUMNS, LABEL_COLUMN
+
+
+@pytest.fixture
+def model_data(games, tmp_path) -> ModelData:
+    convert(games, tmp_path)
+    return ModelData(tmp_path)
+
+
+def test_arrays_match_the_cleaned_data(games, model_data):
+    assert not set(ID_COLUMNS) & set(model_data.columns) and LABEL_COLUMN not in model_data.columns
+    assert isinstance(model_data.features, np.memmap) and model_data.features.dtype == np.float32
+    np.testing.assert_array_equal(model_data.features, games[model_data.columns].to_numpy(dtype=np.float32))
+    np.testing.assert_array_equal(model_data.labels, games[LABEL_COLUMN].to_numpy(dtype=np.int8))
+
+
+def test_split_holds_out_whole_seasons(games, model_data):
+    train, validation = model_data.split([2006, 2007])
+
+    assert set(games['season'].iloc[validation]) == {2006, 2007}
+    assert not set(games['season'].iloc[train]) & {2006, 2007}
+    assert len(train) + len(validation) == len(games)
+
+
+def test_batches_cover_the_rows_once(model_data):
+    train, _ = model_data.split([2007])
+
+    labels = np.concatenate([y for _, y in model_data.batches(train, batch_size=100, seed=1)])
+    assert len(labels) == len(train)
+    assert labels.sum() == model_data.labels[train].sum()
+
+
+def test_data_without_seasons_cannot_be_split(games, tmp_path):
+    convert(games.drop(columns=['game_id', 'season', 'week']), tmp_path)
+    model_data = ModelData(tmp_path)
+
+    assert len(model_data) == len(games)
+    assert sum(len(y) for _, y in model_data.batches(batch_size=500)) == len(games)
+    with pytest.raises(ValueError, match='no seasons'):
+        model_data.split([2007])
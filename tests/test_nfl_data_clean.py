@@ -0,0 +1,32 @@
+import json
+import pytest
+
+from pathlib import Path
+from src.nfl_data_clean import add_team_codes, clean_file
+
+RAW_PATH = Path(__file__).resolve().parent.parent / 'data' / 'final_df.csv'
+
+
+@pytest.mark.parametrize('chunksize', [7, 100, 500])
+def test_chunked_clean_matches_in_memory(tmp_path, chunksize):
+    clean_file(RAW_PATH, tmp_path / 'in_memory.csv', tmp_path / 'in_memory_codes.json')
+    clean_file(RAW_PATH, tmp_path / 'chunked.csv', tmp_path / 'chunked_codes.json', chunksize=chunksize,
+               processes=2)
+
+    assert (tmp_path / 'chunked.csv').read_bytes() == (tmp_path / 'in_memory.csv').read_bytes()
+    assert (tmp_path / 'chunked_codes.json').read_text() == (tmp_path / 'in_memory_codes.json').read_text()
+
+
+def test_team_codes_are_stable():
+    team_codes = add_team_codes({'codes': {}, 'next_code': 0}, ['DAL', 'STL', 'SD'])
+    team_codes = add_team_codes(team_codes, ['NE', 'LAR', 'DAL', 'LAC'])
+
+    codes = team_codes['codes']
+    assert [codes[team] for team in ['DAL', 'STL', 'SD', 'NE']] == [0, 1, 2, 3]
+    assert codes['LAR'] == codes['STL'] and codes['LAC'] == codes['SD']
+    assert json.loads(json.dumps(team_codes)) == team_codes
+
+
+def test_aliases_need_their_old_team():
+    codes = add_team_codes({'codes': {}, 'next_code': 0}, ['LAR', 'KC'])['codes']
+    assert codes == {'LAR': 0, 'KC': 1}
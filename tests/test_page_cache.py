@@ -0,0 +1,59 @@
+import csv
+import os
+
+from benchmarks.fixtures import matchup_page
+from src.checkpoint import GameOutput
+from src.data_collector import GAME_COLUMNS, offline_runner
+from src.page_cache import PageCache
+
+
+def page_bytes(cache: PageCache) -> int:
+    return sum(size for _, size, _ in cache.entries())
+
+
+def test_least_recently_used_pages_are_evicted(tmp_path):
+    cache = PageCache(tmp_path, max_bytes=2500)
+    # random bytes do not compress, so every page takes a little over 1000 bytes
+    cache.put('1', os.urandom(1000))
+    cache.put('2', os.urandom(1000))
+    os.utime(cache.path('1'), (1000, 1000))
+    os.utime(cache.path('2'), (2000, 2000))
+
+    # reading the older page marks it as recently used
+    assert cache.get('1') is not None
+    cache.put('3', os.urandom(1000))
+
+    assert cache.game_ids() == ['1', '3']
+    assert cache.total_bytes == page_bytes(cache) <= cache.max_bytes
+
+
+def test_running_size_follows_the_pages(tmp_path):
+    cache = PageCache(tmp_path)
+    for game_id in range(5):
+        cache.put(str(game_id), os.urandom(500))
+    assert cache.total_bytes == page_bytes(cache)
+
+    # storing a page again replaces its size
+    cache.put('0', os.urandom(2000))
+    assert cache.total_bytes == page_bytes(cache)
+    assert PageCache(tmp_path).total_bytes == cache.total_bytes
+
+
+def test_offline_runner_rebuilds_a_fresh_output(tmp_path):
+    cache = PageCache(tmp_path / 'cache')
+    for game_id in range(1, 5):
+        cache.put(str(game_id), matchup_page(game_id))
+    columns = ['game_id'] + GAME_COLUMNS
+    output = GameOutput(tmp_path / 'final_df.csv', columns=columns)
+    output.write('1', {'away_team': 'stale'})
+    output.write('9', {'away_team': 'not cached'})
+
+    offline_runner(cache, output)
+
+    with open(tmp_path / 'final_df.csv', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert sorted(row['game_id'] for row in rows) == ['1', '2', '3', '4']
+    assert all(row['away_team'] not in ('stale', 'not cached') for row in rows)
+    assert GameOutput(tmp_path / 'final_df.csv', columns=columns).failed() == set()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        'cache', 'final_df.csv', 'final_df.manifest.jsonl', 'final_df.metrics.json']
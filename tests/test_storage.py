@@ -0,0 +1,31 @@
+import pandas as pd
+import pytest
+
+from src.storage import convert_csv, read_dataset, typed_frame
+
+
+def test_team_codes_past_int8_are_kept(games):
+    data = games.copy()
+    data.loc[0, 'home_team'] = 200
+
+    assert typed_frame(data)['home_team'].iloc[0] == 200
+
+
+def test_values_outside_the_dtype_raise(games):
+    data = games.copy()
+    data.loc[0, 'home_wins'] = 200
+
+    with pytest.raises(ValueError, match='outside the range'):
+        typed_frame(data)
+
+
+def test_convert_csv_partitions_by_season(games, tmp_path):
+    games[['season', 'week', 'game_id']].to_csv(tmp_path / 'game_index.csv', index=False)
+    games.drop(columns=['season', 'week']).to_csv(tmp_path / 'cleaned_data.csv', index=False)
+
+    convert_csv(tmp_path / 'cleaned_data.csv', tmp_path / 'cleaned_data.parquet',
+                index_path=tmp_path / 'game_index.csv')
+
+    assert sorted(p.name for p in (tmp_path / 'cleaned_data.parquet').iterdir())[0] == 'season=2002'
+    data = read_dataset(tmp_path / 'cleaned_data.parquet', seasons=[2003])
+    assert len(data) == 256 and (data['season'] == 2003).all()